@@ -0,0 +1,81 @@
+"""
+Benchmarks de ponta a ponta contra o servidor local de vagas simuladas
+(requer Playwright e o Chromium instalados)
+"""
+
+import asyncio
+
+import pytest
+
+async_api = pytest.importorskip("playwright.async_api")
+
+from fixture_server import FixtureServer
+from pacing import ZeroPacing
+from utils import find_job_cards, harvest_job_cards
+
+PAGE_JOBS = 50
+
+@pytest.fixture(scope="module")
+def fixture_server():
+    server = FixtureServer(seed=3, total_jobs=200).start()
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="module")
+def browser_env():
+    loop = asyncio.new_event_loop()
+    playwright = loop.run_until_complete(async_api.async_playwright().start())
+    try:
+        browser = loop.run_until_complete(playwright.chromium.launch(headless=True))
+    except Exception as e:
+        loop.run_until_complete(playwright.stop())
+        loop.close()
+        pytest.skip(f"Chromium do Playwright indisponível: {e}")
+
+    context = loop.run_until_complete(browser.new_context())
+    yield loop, playwright, browser, context
+
+    loop.run_until_complete(context.close())
+    loop.run_until_complete(browser.close())
+    loop.run_until_complete(playwright.stop())
+    loop.close()
+
+def test_card_harvest(fixture_server, browser_env, benchmark_gate):
+    loop, _, _, context = browser_env
+    page = loop.run_until_complete(context.new_page())
+    loop.run_until_complete(page.goto(f"{fixture_server.base_url}/jobs/search/?start=0"))
+
+    async def harvest():
+        records = await harvest_job_cards(await find_job_cards(page))
+        assert len(records) == fixture_server.page_size
+
+    try:
+        benchmark_gate.measure_async("card_harvest[25]", harvest, rounds=10, loop=loop)
+    finally:
+        loop.run_until_complete(page.close())
+
+def test_page_processing(fixture_server, browser_env, benchmark_gate):
+    from automation_fixed import LinkedInAutomation
+
+    loop, playwright, browser, context = browser_env
+
+    async def process():
+        fixture_server.jobs.saved.clear()
+        automation = LinkedInAutomation(
+            "bench@example.com", "", "python", "Brasil", PAGE_JOBS, 0, lambda message: None,
+            user_skills="python, sql, java, react, aws", use_recommendations=False,
+            prefetch_saved=False, prefetch_next_page=False, skip_duplicates=False,
+            base_url=fixture_server.base_url, pacing=ZeroPacing()
+        )
+        automation.playwright, automation.browser, automation.context = playwright, browser, context
+        automation.page = await context.new_page()
+        automation.is_running = True
+        try:
+            await automation.page.goto(f"{fixture_server.base_url}/jobs/search/?start=0")
+            saved = await automation.save_jobs()
+            assert saved > 0
+        finally:
+            await automation.page.close()
+            automation.close_archive()
+
+    benchmark_gate.measure_async(f"page_processing[{PAGE_JOBS}]", process, rounds=3, loop=loop)
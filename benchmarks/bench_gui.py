@@ -0,0 +1,44 @@
+"""
+Benchmarks da interface: abertura da janela e ingestão de logs
+(requer Tk com display e Playwright, importado pela interface)
+"""
+
+import os
+import sys
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+pytest.importorskip("playwright")
+
+if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+    pytest.skip("sem display para a interface Tk", allow_module_level=True)
+
+from gui import LinkedInGUI
+
+LOG_MESSAGES = 1_000
+
+def test_startup_to_window(benchmark_gate):
+    def start():
+        app = LinkedInGUI()
+        app.root.update()
+        app.root.destroy()
+
+    benchmark_gate.measure("gui_startup", start, rounds=3)
+
+def test_log_ingestion(benchmark_gate):
+    app = LinkedInGUI()
+    messages = [
+        f"Vaga {index} não compatível, pulando..." if index % 3 else f"Vaga {index} salva! (perfil: padrão)"
+        for index in range(LOG_MESSAGES)
+    ]
+
+    def ingest():
+        app.clear_logs()
+        for message in messages:
+            app.log_message(message)
+
+    try:
+        benchmark_gate.measure(f"gui_log_ingestion[{LOG_MESSAGES}]", ingest, rounds=3)
+    finally:
+        app.root.destroy()
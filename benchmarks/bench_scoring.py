@@ -0,0 +1,93 @@
+"""
+Benchmarks da avaliação de compatibilidade sobre corpora sintéticos
+"""
+
+import asyncio
+
+import pytest
+
+from corpus import job_texts
+from profiles import SkillProfile, ProfileMatcher
+from utils import analyze_job_compatibility
+
+SKILLS = ["python", "django", "sql", "aws", "docker"]
+AVOID_TERMS = ["sênior", "lead", "gerente"]
+
+PROFILES = [
+    SkillProfile("backend", SKILLS, AVOID_TERMS),
+    SkillProfile("dados", ["python", "pandas", "sql", "spark"], ["estágio"]),
+    SkillProfile("frontend", ["react", "typescript", "javascript"], AVOID_TERMS),
+]
+
+SIZES = [1_000, 10_000, 100_000]
+
+def corpus_or_skip(size, large_corpora):
+    if size >= 100_000 and not large_corpora:
+        pytest.skip("corpus de 100k textos apenas com BENCH_LARGE=1")
+    return job_texts(size)
+
+@pytest.mark.parametrize("size", SIZES)
+def test_analyze_job_compatibility(size, benchmark_gate, large_corpora):
+    texts = corpus_or_skip(size, large_corpora)
+
+    def run():
+        for text in texts:
+            analyze_job_compatibility(text, SKILLS, AVOID_TERMS, "Júnior")
+
+    benchmark_gate.measure(f"analyze_job_compatibility[{size}]", run, rounds=5)
+
+@pytest.mark.parametrize("size", SIZES)
+def test_profile_matcher(size, benchmark_gate, large_corpora):
+    texts = corpus_or_skip(size, large_corpora)
+    matcher = ProfileMatcher(PROFILES, "Júnior", "Remoto")
+
+    def run():
+        for text in texts:
+            matcher.evaluate(text)
+
+    benchmark_gate.measure(f"profile_matcher[{size}]", run, rounds=5)
+
+# Razão máxima aceita (matcher / caminho ingênuo): com um perfil, empate (com margem
+# para ruído); com três, a passada única precisa ser claramente mais rápida
+@pytest.mark.parametrize("profile_count,max_ratio", [(1, 1.15), (3, 0.85)])
+def test_profile_matcher_vs_naive(profile_count, max_ratio, benchmark_gate):
+    """
+    Compara o ProfileMatcher com a avaliação de cada perfil separadamente por
+    analyze_job_compatibility (o caminho original)
+    """
+    texts = job_texts(10_000)
+    profiles = PROFILES[:profile_count]
+    matcher = ProfileMatcher(profiles, "Júnior")
+
+    def naive():
+        for text in texts:
+            for profile in profiles:
+                analyze_job_compatibility(text, profile.skills, profile.avoid_terms, "Júnior")
+
+    def matched():
+        for text in texts:
+            matcher.evaluate(text)
+
+    benchmark_gate.compare(f"profile_matcher_vs_naive[{profile_count}]", matched, naive, max_ratio=max_ratio)
+
+@pytest.mark.parametrize("size", SIZES[:2])
+def test_is_job_compatible(size, benchmark_gate, large_corpora):
+    pytest.importorskip("playwright")
+    from automation_fixed import LinkedInAutomation
+
+    texts = corpus_or_skip(size, large_corpora)
+    automation = LinkedInAutomation(
+        "bench@example.com", "", "python", "Brasil", 10, 0, lambda message: None,
+        experience_level="Júnior", work_type="Remoto", user_skills=", ".join(SKILLS),
+        avoid_terms=", ".join(AVOID_TERMS), profiles=PROFILES[1:], skip_duplicates=False
+    )
+
+    async def run():
+        for text in texts:
+            await automation.is_job_compatible(None, text)
+
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark_gate.measure_async(f"is_job_compatible[{size}]", run, rounds=3, loop=loop)
+    finally:
+        loop.close()
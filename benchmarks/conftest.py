@@ -0,0 +1,238 @@
+"""
+Infraestrutura dos benchmarks: calibração da máquina, medição e comparação
+com a linha de base gravada em baseline.json
+
+Uso:
+    python -m pytest benchmarks                      # compara com a linha de base
+    python -m pytest benchmarks --update-baseline    # regrava a linha de base (calibração)
+    python -m pytest benchmarks --require-baseline   # métrica sem linha de base falha (CI)
+    BENCH_LARGE=1 python -m pytest benchmarks        # inclui corpora de 100k textos
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+import warnings
+
+import pytest
+
+# Adiciona o diretório src ao path para importar os módulos
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCH_DIR), "src"))
+
+# Dados locais (ledger, índices) dos benchmarks não se misturam aos do usuário
+os.environ.setdefault("LINKEDIN_AUTOMATION_HOME", tempfile.mkdtemp(prefix="linkedin-bench-"))
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+# Regressão tolerada sobre a linha de base (0.30 = até 30% mais lento)
+DEFAULT_TOLERANCE = 0.30
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--update-baseline", action="store_true", default=False,
+                    help="grava os resultados desta execução como nova linha de base")
+    group.addoption("--bench-tolerance", type=float, default=None,
+                    help="regressão tolerada sobre a linha de base (padrão: valor do baseline.json)")
+    group.addoption("--require-baseline", action="store_true", default=False,
+                    help="falha (em vez de pular) quando uma métrica não tem linha de base")
+
+def calibrate(rounds=9):
+    """
+    Mede um laço fixo de Python puro para normalizar os tempos entre máquinas
+
+    Returns:
+        float: Melhor tempo do laço em segundos
+    """
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        total = 0
+        table = {}
+        for i in range(200_000):
+            total += i * i
+            table[i & 1023] = total
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def load_baseline():
+    try:
+        with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"tolerance": DEFAULT_TOLERANCE, "metrics": {}}
+
+class BenchmarkGate:
+    """
+    Mede funções, normaliza pela calibração e compara com a linha de base
+    """
+
+    def __init__(self, calibration, baseline, tolerance, update, require_baseline=False):
+        self.calibration = calibration
+        self.baseline = baseline.get("metrics", {})
+        self.tolerance = tolerance
+        self.update = update
+        self.require_baseline = require_baseline
+        self.results = {}
+        self.missing = []
+        self.comparisons = {}
+
+    def measure(self, name, func, rounds=5):
+        """
+        Executa func várias vezes e verifica o melhor tempo contra a linha de base
+
+        A calibração é refeita logo antes da medição, para que oscilações de
+        velocidade da máquina afetem igualmente a referência e a métrica
+
+        Args:
+            name (str): Nome da métrica
+            func (function): Função sem argumentos a medir
+            rounds (int): Repetições (vale o melhor tempo)
+
+        Returns:
+            float: Melhor tempo em segundos
+        """
+        calibration = calibrate(3)
+        best = None
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        self.check(name, best, min(calibration, calibrate(3)))
+        return best
+
+    def compare(self, name, func, reference, max_ratio=1.0, rounds=5):
+        """
+        Mede func contra uma implementação de referência na mesma máquina
+
+        As duas funções são executadas alternadamente (vale o melhor tempo de cada),
+        então o resultado não depende de calibração nem da linha de base
+
+        Args:
+            name (str): Nome da comparação
+            func (function): Implementação medida
+            reference (function): Implementação de referência (ex.: caminho ingênuo)
+            max_ratio (float): Razão máxima aceita entre func e reference
+
+        Returns:
+            float: Razão entre os melhores tempos (func / reference)
+        """
+        best = {func: None, reference: None}
+        for _ in range(rounds):
+            for candidate in (reference, func):
+                start = time.perf_counter()
+                candidate()
+                elapsed = time.perf_counter() - start
+                best[candidate] = elapsed if best[candidate] is None else min(best[candidate], elapsed)
+
+        ratio = best[func] / best[reference]
+        self.comparisons[name] = {"seconds": best[func], "reference": best[reference], "ratio": ratio}
+        assert ratio <= max_ratio, (
+            f"{name}: {best[func] * 1000:.1f}ms contra {best[reference] * 1000:.1f}ms da referência "
+            f"(razão {ratio:.2f}, máximo {max_ratio:.2f})"
+        )
+        return ratio
+
+    def measure_async(self, name, coroutine_factory, rounds=3, loop=None):
+        """
+        Versão para corrotinas: coroutine_factory cria uma corrotina nova a cada rodada
+        """
+        loop = loop or asyncio.get_event_loop()
+        return self.measure(name, lambda: loop.run_until_complete(coroutine_factory()), rounds)
+
+    def check(self, name, seconds, calibration=None):
+        normalized = seconds / (calibration or self.calibration)
+        self.results[name] = {"seconds": seconds, "normalized": normalized}
+
+        if self.update:
+            return
+
+        reference = self.baseline.get(name)
+        if reference is None:
+            # Métrica ainda não calibrada nesta árvore (ex.: depende do Chromium):
+            # o benchmark é pulado com aviso, ou falha com --require-baseline
+            message = (
+                f"{name} não tem linha de base em {os.path.basename(BASELINE_PATH)} "
+                f"({normalized:.2f} unidades, {seconds * 1000:.1f}ms); "
+                f"calibre com: python -m pytest benchmarks --update-baseline"
+            )
+            assert not self.require_baseline, message
+            self.missing.append(name)
+            warnings.warn(message)
+            pytest.skip(message)
+
+        limit = reference * (1 + self.tolerance)
+        assert normalized <= limit, (
+            f"{name} regrediu: {normalized:.2f} unidades de calibração "
+            f"(linha de base {reference:.2f}, limite {limit:.2f}, {seconds * 1000:.1f}ms)"
+        )
+
+    def write_baseline(self):
+        """
+        Mescla os resultados desta execução na linha de base gravada
+        """
+        baseline = load_baseline()
+        metrics = baseline.setdefault("metrics", {})
+        for name, result in self.results.items():
+            metrics[name] = round(result["normalized"], 3)
+        baseline.setdefault("tolerance", DEFAULT_TOLERANCE)
+        baseline["metrics"] = dict(sorted(metrics.items()))
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+_gate = None
+
+@pytest.fixture(scope="session")
+def benchmark_gate(request):
+    global _gate
+    if _gate is None:
+        baseline = load_baseline()
+        tolerance = request.config.getoption("--bench-tolerance")
+        if tolerance is None:
+            tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+        _gate = BenchmarkGate(calibrate(), baseline, tolerance,
+                              request.config.getoption("--update-baseline"),
+                              request.config.getoption("--require-baseline"))
+    return _gate
+
+@pytest.fixture(scope="session")
+def large_corpora():
+    """
+    Indica se os corpora de 100k textos devem ser medidos (BENCH_LARGE=1)
+    """
+    return os.environ.get("BENCH_LARGE") == "1"
+
+def pytest_sessionfinish(session, exitstatus):
+    if _gate is not None and _gate.update and _gate.results:
+        _gate.write_baseline()
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if _gate is None or not (_gate.results or _gate.comparisons):
+        return
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"calibração: {_gate.calibration * 1000:.1f}ms por unidade")
+    for name, result in sorted(_gate.results.items()):
+        reference = _gate.baseline.get(name)
+        line = f"{name}: {result['seconds'] * 1000:.1f}ms ({result['normalized']:.2f} unidades)"
+        if reference:
+            line += f", linha de base {reference:.2f} ({(result['normalized'] / reference - 1) * 100:+.0f}%)"
+        terminalreporter.write_line(line)
+    for name, result in sorted(_gate.comparisons.items()):
+        terminalreporter.write_line(
+            f"{name}: {result['seconds'] * 1000:.1f}ms contra {result['reference'] * 1000:.1f}ms "
+            f"da referência (razão {result['ratio']:.2f})"
+        )
+    if _gate.missing:
+        terminalreporter.write_line(
+            f"sem linha de base (pulados): {', '.join(sorted(_gate.missing))}; "
+            f"calibre com: python -m pytest benchmarks --update-baseline"
+        )
+    if _gate.update:
+        terminalreporter.write_line(f"linha de base gravada em {BASELINE_PATH}")
@@ -0,0 +1,28 @@
+"""
+Corpora sintéticos e determinísticos de textos de vagas para os benchmarks
+"""
+
+from fixture_server import FixtureJobs
+
+_cache = {}
+
+def job_texts(size, seed=7):
+    """
+    Gera textos de card + descrição no formato lido pela automação
+
+    Args:
+        size (int): Quantidade de textos
+        seed (int): Semente do gerador
+    """
+    key = (size, seed)
+    if key not in _cache:
+        jobs = FixtureJobs(seed=seed, total_jobs=size, repost_ratio=0.05)
+        texts = []
+        for index in range(size):
+            job = jobs.get(index)
+            texts.append(
+                f"{job['title']}\n{job['company']}\n{job['location']} ({job['mode']})\n"
+                f"{job['level']} · {', '.join(job['skills'])}\n{job['posted']}\n{job['description']}"
+            )
+        _cache[key] = texts
+    return _cache[key]
@@ -0,0 +1,170 @@
+"""
+LinkedIn Job Automation Tool - execução sem interface gráfica
+
+Lê perfil, busca e filtros de um arquivo TOML ou JSON e executa com o
+navegador em modo headless, sem importar o Tk (servidores e agendamentos)
+
+Uso:
+    python cli.py config.toml
+    python cli.py config.json --pacing zero --base-url http://127.0.0.1:8000
+
+Cada linha da saída padrão é um evento JSON:
+    {"event": "start", ...}   configuração em uso (sem a senha)
+    {"event": "log", ...}     mensagem do log da automação
+    {"event": "job", ...}     resultado de uma vaga (ver LinkedInAutomation.job_result)
+    {"event": "done", ...}    resumo final
+    {"event": "error", ...}   falha que encerrou a execução
+
+Códigos de saída:
+    0 sucesso (a busca chegou ao fim), 1 erro inesperado ou busca encerrada por erro,
+    2 configuração inválida, 3 navegador não iniciou, 4 login falhou,
+    5 busca sem resultados, 130 interrompido (Ctrl+C ou SIGTERM)
+"""
+
+import sys
+import os
+import json
+import time
+import signal
+import asyncio
+import argparse
+
+# Adiciona o diretório src ao path para importar os módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, 'src')
+sys.path.insert(0, src_path)
+
+from run_config import ConfigError, load_run_config, automation_kwargs
+from pacing import PACING_MODES
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_CONFIG = 2
+EXIT_BROWSER = 3
+EXIT_LOGIN = 4
+EXIT_SEARCH = 5
+EXIT_INTERRUPTED = 130
+
+def exit_code(stop_reason, finished_reasons):
+    """
+    Código de saída pelo motivo de fim da execução (stop_reason da automação)
+
+    Args:
+        stop_reason (str): Motivo do fim
+        finished_reasons (tuple): Motivos em que a busca chegou ao fim de fato
+    """
+    if stop_reason == "stopped":
+        return EXIT_INTERRUPTED
+    if stop_reason in finished_reasons:
+        return EXIT_OK
+    return EXIT_FAILURE
+
+def emit(event, **fields):
+    """
+    Escreve um evento JSON em uma linha da saída padrão
+    """
+    record = {"event": event, "time": round(time.time(), 3)}
+    record.update(fields)
+    print(json.dumps(record, ensure_ascii=False, default=str), flush=True)
+
+async def run(config):
+    """
+    Executa a automação com a configuração carregada
+
+    Returns:
+        int: Código de saída
+    """
+    from automation_fixed import (LinkedInAutomation, BrowserStartError, LoginError, SearchError,
+                                  FINISHED_STOP_REASONS)
+    from pacing import create_pacing
+
+    pacing = create_pacing(config["pacing"], config["pacing_seed"], config["pacing_scale"])
+    automation = LinkedInAutomation(
+        log_callback=lambda message: emit("log", message=message),
+        pacing=pacing,
+        **automation_kwargs(config)
+    )
+
+    # SIGTERM encerra depois da vaga atual, gravando o estado normalmente
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, automation.stop)
+    except (NotImplementedError, RuntimeError):
+        pass
+
+    started = time.time()
+    counts = {}
+    try:
+        async with automation:
+            async for job in automation.iter_jobs():
+                counts[job["verdict"]] = counts.get(job["verdict"], 0) + 1
+                emit("job", **job)
+    except BrowserStartError as e:
+        emit("error", kind="browser", message=str(e))
+        return EXIT_BROWSER
+    except LoginError as e:
+        emit("error", kind="login", message=str(e))
+        return EXIT_LOGIN
+    except SearchError as e:
+        emit("error", kind="search", message=str(e))
+        return EXIT_SEARCH
+
+    emit("done",
+         saved=counts.get(LinkedInAutomation.VERDICT_SAVED, 0),
+         processed=sum(counts.values()),
+         verdicts=counts,
+         by_profile=automation.saved_by_profile,
+         stop_reason=automation.stop_reason,
+         elapsed=round(time.time() - started, 1))
+    return exit_code(automation.stop_reason, FINISHED_STOP_REASONS)
+
+def parse_arguments(argv=None):
+    """
+    Lê as opções de linha de comando (sobrepõem os valores do arquivo)
+    """
+    parser = argparse.ArgumentParser(description="Execução sem interface gráfica a partir de um arquivo de configuração")
+    parser.add_argument("config", help="arquivo de configuração (.toml ou .json)")
+    parser.add_argument("--pacing", choices=PACING_MODES, help="política de ritmo das pausas")
+    parser.add_argument("--seed", type=int, help="semente do ritmo \"seeded\"")
+    parser.add_argument("--scale", type=float, help="multiplicador das pausas")
+    parser.add_argument("--base-url", help="endereço alternativo ao LinkedIn (ex.: servidor de fixtures)")
+    parser.add_argument("--max-jobs", type=int, help="número máximo de vagas para salvar")
+    parser.add_argument("--headed", action="store_true", help="mostra a janela do navegador")
+    parser.add_argument("--resume", action="store_true", help="retoma a execução interrompida pelo checkpoint")
+    parser.add_argument("--check", action="store_true", help="apenas valida a configuração")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    try:
+        config = load_run_config(args.config)
+    except ConfigError as e:
+        emit("error", kind="config", message=str(e))
+        return EXIT_CONFIG
+
+    overrides = {
+        "pacing": args.pacing, "pacing_seed": args.seed, "pacing_scale": args.scale,
+        "base_url": args.base_url, "max_jobs": args.max_jobs,
+    }
+    config.update({key: value for key, value in overrides.items() if value is not None})
+    if args.headed:
+        config["headless"] = False
+    if args.resume:
+        config["resume"] = True
+
+    emit("start", config={key: value for key, value in config.items() if key != "password"})
+    if args.check:
+        return EXIT_OK
+
+    try:
+        return asyncio.run(run(config))
+    except KeyboardInterrupt:
+        emit("error", kind="interrupted", message="Execução interrompida")
+        return EXIT_INTERRUPTED
+    except Exception as e:
+        emit("error", kind="unexpected", message=str(e))
+        return EXIT_FAILURE
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,7 @@ Desenvolvido com Playwright para máxima performance e compatibilidade
 
 import sys
 import os
+import argparse
 import subprocess
 
 # Adiciona o diretório src ao path para importar os módulos
@@ -50,9 +51,12 @@ def install_playwright_browsers():
         print(f"❌ Erro na instalação: {e}")
         return False
 
-def main():
+def main(profile=False):
     """
     Função principal que inicia a aplicação
+    
+    Args:
+        profile (bool): Abre a interface com o modo de profiling ativado
     """
     print("=" * 70)
     print("🚀 LinkedIn Job Automation Tool - Smart Edition")
@@ -82,7 +86,7 @@ def main():
         from gui import LinkedInGUI
         
         # Criar e executar a interface gráfica
-        app = LinkedInGUI()
+        app = LinkedInGUI(profile=profile)
         app.run()
         
     except ImportError as e:
@@ -153,7 +157,17 @@ def show_features():
     print("   • Interface gráfica intuitiva com logs em tempo real")
     print("   • Salvamento automático de logs e estatísticas")
 
+def parse_arguments():
+    """
+    Lê as opções de linha de comando
+    """
+    parser = argparse.ArgumentParser(description="LinkedIn Job Automation Tool - Smart Edition")
+    parser.add_argument("--profile", action="store_true",
+                        help="ativa o modo de profiling (arquivo .pstats + resumo no log)")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_arguments()
     try:
         # Verificar requisitos do sistema
         if not check_system_requirements():
@@ -165,7 +179,7 @@ if __name__ == "__main__":
         show_features()
         
         # Executar aplicação principal
-        main()
+        main(profile=args.profile)
         
     except KeyboardInterrupt:
         print("\n\n⏹️ Aplicação interrompida pelo usuário")
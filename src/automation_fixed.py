@@ -1,19 +1,118 @@
 import time
-import random
 import asyncio
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
-from utils import random_delay
+from utils import random_delay, harvest_job_cards, collect_job_ids, find_job_cards, job_card_locator
+from job_ledger import JobLedger
+from job_record import posted_age_days
+from page_prefetcher import NextPagePrefetcher, RESULTS_PAGE_SIZE, results_offset, page_url_at
+from dedup import SimHashIndex, job_fingerprint
+from company_index import CompanyIndex
+from profiles import ProfileMatcher, build_profile_list, DEFAULT_PROFILE_NAME
+from tracing import Tracer, traced
+from instrumentation import CallStats, instrument
+from metrics import RunMetrics, MetricsServer
+from profiling import RunProfiler
+from memory_tracker import MemoryTracker
+from page_recycler import PageRecycler
+from pacing import Pacing, create_pacing, get_pacing
+from job_archive import JobArchive
+from query_planner import QueryPlanner, parse_queries
+from search_cache import SearchCache, search_cache_key, search_key
+from checkpoint import RunCheckpoint
+from browser_session import CONTEXT_OPTIONS, STEALTH_SCRIPT, browser_launch_options
+
+# Endereço do LinkedIn (substituível por um servidor local de testes)
+LINKEDIN_URL = "https://www.linkedin.com"
+
+# Motivos de reciclagem da página, como aparecem no log
+RECYCLE_REASONS = {
+    "jobs": "limite de vagas por página",
+    "heap": "heap JS acima do limite",
+    "dom": "nós do DOM acima do limite",
+}
+
+# Seletores dos cards na seção de vagas recomendadas
+RECOMMENDED_CARD_SELECTORS = [".job-card, .job-recommendation-card, [data-job-id]"]
+
+# Seletores do botão "Próxima" da paginação, em ordem de preferência
+NEXT_PAGE_SELECTORS = [
+    "button[aria-label='Próxima']",
+    "button:has-text('Próxima')",
+    "button[aria-label='Next']",
+    "a[aria-label*='Next']"
+]
+
+# Quantidade de itens por página na lista "Minhas vagas / Salvas"
+SAVED_JOBS_PAGE_SIZE = 10
+
+# Motivos de fim da paginação, como aparecem no log
+STOP_REASONS = {
+    "max_jobs": "limite de vagas salvas atingido",
+    "max_pages": "limite de páginas atingido",
+    "stale_pages": "páginas seguidas só com vagas antigas ou já vistas",
+    "cached": "nenhuma vaga nova desde a última passagem",
+    "no_cards": "nenhuma vaga na página",
+    "last_page": "última página de resultados",
+    "recommended": "vagas recomendadas processadas",
+    "stopped": "execução interrompida",
+    "error": "erro durante a busca",
+}
+
+# Motivos em que a busca chegou ao fim de fato (o checkpoint pode ser removido)
+FINISHED_STOP_REASONS = ("max_jobs", "max_pages", "stale_pages", "cached", "no_cards", "last_page", "recommended")
+
+class AutomationError(RuntimeError):
+    """
+    Falha que impede a automação de continuar
+    """
+
+class BrowserStartError(AutomationError):
+    """
+    O navegador não pôde ser iniciado
+    """
+
+class LoginError(AutomationError):
+    """
+    O login no LinkedIn falhou
+    """
+
+class SearchError(AutomationError):
+    """
+    A busca de vagas não carregou resultados
+    """
 
 class LinkedInAutomation:
     """
     Classe principal para automação do LinkedIn usando Playwright - Versão 2024
     Com sistema de filtragem inteligente baseado nas recomendações do LinkedIn
+    
+    Uso como biblioteca (resultados entregues conforme cada vaga é processada):
+    
+        async with LinkedInAutomation(...) as automation:
+            async for job in automation.iter_jobs():
+                print(job['job_id'], job['verdict'], job['score'])
     """
     
+    # Vereditos dos resultados entregues por iter_jobs
+    VERDICT_SAVED = "saved"
+    VERDICT_COMPATIBLE = "compatible"
+    VERDICT_REJECTED = "rejected"
+    VERDICT_SKIPPED = "skipped"
+    VERDICT_ERROR = "error"
+    
     def __init__(self, email, password, keywords, location, max_jobs, delay, log_callback, 
                  job_type="Todos", experience_level="Todos", work_type="Todas", 
                  contract_type="Todos", apply_filters=True, user_skills="", 
-                 avoid_terms="", use_recommendations=True):
+                 avoid_terms="", use_recommendations=True, prefetch_saved=True,
+                 prefetch_next_page=True, skip_duplicates=True, blocked_companies="",
+                 allowed_companies="", profiles=None, trace_path=None, count_calls=False,
+                 metrics_port=None, metrics_textfile=None, profile_run=False,
+                 track_memory=False, recycle_after_jobs=150, recycle_heap_mb=None,
+                 recycle_dom_nodes=None, base_url=None, har_record_path=None,
+                 har_replay_path=None, pacing=None, archive_jobs=True, headless=False,
+                 browser_session=None, queries=None, search_cache_hours=0, search_cache_size=200,
+                 checkpoint=True, checkpoint_path=None, resume=False,
+                 max_posted_days=None, stale_pages=None, max_pages=50):
         """
         Inicializa a automação com os parâmetros fornecidos
         
@@ -33,6 +132,44 @@ class LinkedInAutomation:
             user_skills (str): Skills do usuário separadas por vírgula
             avoid_terms (str): Termos a evitar separados por vírgula
             use_recommendations (bool): Priorizar recomendações do LinkedIn
+            prefetch_saved (bool): Carregar as vagas já salvas antes de processar
+            prefetch_next_page (bool): Pré-carregar a próxima página em uma aba de fundo
+            skip_duplicates (bool): Ignorar repostagens quase idênticas de vagas já vistas
+            blocked_companies (str): Empresas a ignorar separadas por vírgula
+            allowed_companies (str): Empresas nunca bloqueadas por aprendizado
+            profiles (str or list): Perfis nomeados extras ("nome: skills | evitar; ...")
+                ou lista de SkillProfile, avaliados juntos em uma única passada
+            trace_path (str): Arquivo JSON para exportar o trace das fases (Perfetto)
+            count_calls (bool): Contar chamadas ao Playwright por ponto de chamada
+            metrics_port (int): Porta local para expor métricas OpenMetrics em /metrics
+            metrics_textfile (str): Arquivo onde gravar as métricas ao final da execução
+            profile_run (bool): Executar com profiler (.pstats + callbacks lentos do asyncio)
+            track_memory (bool): Medir a memória (Python, heap JS, DOM e RSS) a cada fase
+            recycle_after_jobs (int): Reabrir a página após esse número de vagas abertas (0 desativa)
+            recycle_heap_mb (int): Reabrir a página quando o heap JS passar desse valor em MB
+            recycle_dom_nodes (int): Reabrir a página quando o DOM passar dessa quantidade de nós
+            base_url (str): Endereço alternativo ao LinkedIn (ex.: servidor de fixtures local)
+            har_record_path (str): Gravar todo o tráfego da execução neste arquivo HAR
+            har_replay_path (str): Servir a execução a partir deste HAR, sem acesso à rede
+            pacing (Pacing or str): Política de ritmo das pausas ("random", "seeded", "zero")
+                ou instância de Pacing (padrão: política global do processo)
+            archive_jobs (bool): Guardar os cards coletados no arquivo local de vagas
+            headless (bool): Executar o navegador sem janela
+            browser_session (BrowserSession): Navegador já aberto e compartilhado entre
+                execuções (modo daemon); a execução só abre e fecha a própria página
+            queries (str or list): Várias buscas ("palavras-chave @ localização", uma por
+                linha ou separadas por ";"), executadas em vez da busca única
+            search_cache_hours (float): Guardar as páginas de resultados por esse tempo e,
+                ao repetir a busca, processar só as vagas novas desde a passagem anterior (0 desativa)
+            search_cache_size (int): Quantidade máxima de páginas no cache de resultados
+            checkpoint (bool): Gravar a posição da busca após cada vaga processada
+            checkpoint_path (str): Arquivo do checkpoint (padrão: diretório de dados)
+            resume (bool): Retomar a busca interrompida a partir do último checkpoint
+            max_posted_days (float): Ignorar vagas publicadas há mais dias que isso (None desativa)
+            stale_pages (int): Encerrar a busca após essa quantidade de páginas seguidas só
+                com vagas antigas ou já vistas (ledger, vagas salvas ou cache de resultados);
+                None ou 0 desativa a regra (padrão)
+            max_pages (int): Quantidade máxima de páginas de resultados por busca
         """
         self.email = email
         self.password = password
@@ -53,70 +190,177 @@ class LinkedInAutomation:
         self.avoid_terms = [term.strip().lower() for term in avoid_terms.split(',') if term.strip()]
         self.use_recommendations = use_recommendations
         
+        # Várias buscas na mesma execução, com conjunto de vagas vistas compartilhado
+        search_queries = parse_queries(queries, location) if queries else []
+        self.query_planner = QueryPlanner(search_queries) if search_queries else None
+        self.current_query = None
+        
+        # Páginas de resultados recentes, para processar só as vagas novas ao repetir a busca
+        self.search_cache = None
+        if search_cache_hours:
+            self.search_cache = SearchCache(ttl_hours=search_cache_hours, max_entries=search_cache_size)
+        
+        # Checkpoint da busca para retomar execuções interrompidas
+        self.checkpoint = RunCheckpoint(checkpoint_path) if checkpoint or resume else None
+        self.resume = resume
+        
+        # Regras de parada da paginação (idade da vaga e páginas sem novidades)
+        self.max_posted_days = max_posted_days
+        self.stale_pages = max(int(stale_pages), 0) if stale_pages else 0
+        self.max_pages = max(int(max_pages), 1)
+        self.stop_reason = None
+        self.search_complete = False
+        
+        # Perfis nomeados compilados juntos: uma leitura do texto por card
+        self.profiles = self.build_profiles(profiles)
+        self.matcher = ProfileMatcher(self.profiles, experience_level, work_type)
+        self.last_match = None
+        self.saved_by_profile = {}
+        
+        # Vagas já salvas pelo usuário (carregadas uma vez por execução)
+        self.prefetch_saved = prefetch_saved
+        self.ledger = JobLedger()
+        self.saved_job_ids = set()
+        
+        # Pré-carregamento da próxima página de resultados
+        self.prefetch_next_page = prefetch_next_page
+        self.prefetcher = None
+        self.prefetched_records = None
+        
+        # Índice de assinaturas para detectar repostagens da mesma vaga
+        self.dedup_index = SimHashIndex() if skip_duplicates else None
+        
+        # Índice de empresas bloqueadas/permitidas e vereditos aprendidos
+        self.company_index = CompanyIndex(blocked=blocked_companies, allowed=allowed_companies)
+        
+        # Rastreamento por fases (exportado para Perfetto ao final da execução)
+        self.trace_path = trace_path
+        self.tracer = Tracer(enabled=bool(trace_path))
+        
+        # Contagem de idas e voltas ao navegador (sem custo quando desativada)
+        self.call_stats = CallStats() if count_calls else None
+        
+        # Métricas da execução (vazão, latência por fase, falhas de seletor...)
+        self.metrics = RunMetrics()
+        self.tracer.add_listener(self.metrics.observe_span)
+        self.metrics_port = metrics_port
+        self.metrics_textfile = metrics_textfile
+        self.metrics_server = None
+        
+        # Modo de profiling da execução completa
+        self.profile_run = profile_run
+        
+        # Acompanhamento de memória por fase (tracemalloc + navegador)
+        self.memory_tracker = MemoryTracker(self.log) if track_memory else None
+        self.jobs_processed = 0
+        
+        # Reciclagem da página para limitar o crescimento de heap e DOM
+        self.recycle_after_jobs = recycle_after_jobs
+        self.recycle_heap_mb = recycle_heap_mb
+        self.recycle_dom_nodes = recycle_dom_nodes
+        self.page_recycler = None
+        self.cards_reloaded = False
+        
+        # Todas as pausas entre ações passam pela política de ritmo
+        if isinstance(pacing, Pacing):
+            self.pacing = pacing
+        elif pacing:
+            self.pacing = create_pacing(pacing)
+        else:
+            self.pacing = get_pacing()
+        
+        # Arquivo local dos cards coletados (corpus para reanálise offline)
+        self.archive = None
+        if archive_jobs:
+            try:
+                self.archive = JobArchive()
+            except Exception as e:
+                self.log(f"Arquivo local de vagas indisponível: {e}")
+        
+        # Endereço base de todas as páginas visitadas
+        self.base_url = (base_url or LINKEDIN_URL).rstrip("/")
+        
+        # Gravação/reprodução do tráfego (HAR) para execuções repetíveis
+        self.har_record_path = None if har_replay_path else har_record_path
+        self.har_replay_path = har_replay_path
+        
+        self.headless = headless
+        self.browser_session = browser_session
+        
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
         self.is_running = False
+        self.session_open = False
+        self.profiler = None
         self.saved_jobs_count = 0
 
+    def build_profiles(self, profiles):
+        """
+        Monta a lista de perfis a partir dos campos simples e dos perfis extras
+        """
+        # Skills padrão baseadas nas palavras-chave quando não há skills do usuário
+        keywords = self.keywords
+        if self.query_planner is not None:
+            keywords = ", ".join([keywords] + [query.keywords for query in self.query_planner.queries])
+        return build_profile_list(self.user_skills, self.avoid_terms, keywords, profiles)
+
+    def url(self, path):
+        """
+        Monta o endereço completo de uma página a partir do endereço base
+        """
+        return f"{self.base_url}{path}"
+
+    def instrument(self, target):
+        """
+        Envolve uma página/locator com o contador de chamadas, se ativado
+        """
+        return instrument(target, self.call_stats)
+
+    @traced()
     async def setup_browser(self):
         """
         Configura e inicializa o navegador Playwright
         """
+        if self.browser_session is not None:
+            return await self.attach_session()
+        
         self.log("Configurando navegador com Playwright...")
         
         try:
             # Inicializar Playwright
             self.playwright = await async_playwright().start()
             
-            # Configurar opções do navegador
-            browser_options = {
-                "headless": False,
-                "args": [
-                    "--no-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-web-security",
-                    "--allow-running-insecure-content",
-                    "--disable-features=VizDisplayCompositor",
-                ],
-                "ignore_default_args": ["--enable-blink-features=AutomationControlled"],
-            }
-            
             # Lançar navegador Chrome
-            self.browser = await self.playwright.chromium.launch(**browser_options)
+            self.browser = await self.playwright.chromium.launch(**browser_launch_options(self.headless))
             
             # Criar contexto com configurações anti-detecção
-            context_options = {
-                "viewport": {"width": 1366, "height": 768},
-                "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-                "locale": "pt-BR",
-                "timezone_id": "America/Sao_Paulo",
-                "extra_http_headers": {
-                    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8"
-                }
-            }
+            context_options = dict(CONTEXT_OPTIONS)
+            
+            if self.har_record_path:
+                context_options["record_har_path"] = self.har_record_path
+                context_options["record_har_mode"] = "full"
+                self.log(f"Gravando tráfego em: {self.har_record_path}")
             
             self.context = await self.browser.new_context(**context_options)
             
+            if self.har_replay_path:
+                # Requisições fora do arquivo são abortadas: nada sai para a rede
+                await self.context.route_from_har(self.har_replay_path, not_found="abort")
+                self.log(f"Reproduzindo tráfego gravado de: {self.har_replay_path}")
+            self.watch_responses()
+            
             # Configurações avançadas anti-detecção
-            await self.context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => false,
-                });
-                
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['pt-BR', 'pt', 'en-US', 'en'],
-                });
-            """)
+            await self.context.add_init_script(STEALTH_SCRIPT)
             
             # Criar nova página
-            self.page = await self.context.new_page()
+            await self.setup_page()
+            
+            # Servidor local ou tráfego gravado dispensam o teste de acesso à internet
+            if self.base_url != LINKEDIN_URL or self.har_replay_path:
+                self.log(f"Navegador configurado para {self.base_url}")
+                return True
             
             # Teste básico
             self.log("Testando navegação...")
@@ -133,63 +377,519 @@ class LinkedInAutomation:
             await self.cleanup()
             raise
 
+    async def setup_page(self):
+        """
+        Abre a página principal e os auxiliares que dependem do contexto
+        """
+        self.page = self.instrument(await self.context.new_page())
+        
+        if self.prefetch_next_page:
+            self.prefetcher = NextPagePrefetcher(self.context, self.log, page_wrapper=self.instrument,
+                                                 pacing=self.pacing)
+        
+        if self.recycle_after_jobs or self.recycle_heap_mb or self.recycle_dom_nodes:
+            self.page_recycler = PageRecycler(
+                self.context, self.log, max_jobs=self.recycle_after_jobs,
+                max_heap_mb=self.recycle_heap_mb, max_dom_nodes=self.recycle_dom_nodes,
+                page_wrapper=self.instrument
+            )
+
+    async def attach_session(self):
+        """
+        Usa o navegador compartilhado em vez de abrir um novo
+        
+        Sem lançamento do Chromium nem teste de navegação: apenas uma página nova
+        """
+        try:
+            if not await self.browser_session.ensure_started():
+                return False
+            
+            self.browser = self.browser_session.browser
+            self.context = self.browser_session.context
+            self.watch_responses()
+            await self.setup_page()
+            self.log("Usando navegador já aberto")
+            return True
+            
+        except Exception as e:
+            self.log(f"Erro ao usar navegador compartilhado: {e}")
+            return False
+
+    @traced()
     async def login(self):
         """
         Realiza login no LinkedIn
         """
+        session = self.browser_session
+        if session is not None and session.logged_in:
+            # Cookies do navegador compartilhado ainda valem: basta abrir o feed
+            try:
+                await self.page.goto(self.url("/feed/"), wait_until="domcontentloaded")
+                if "feed" in self.page.url:
+                    self.log("Sessão do LinkedIn já autenticada")
+                    return True
+            except Exception as e:
+                self.log(f"Erro ao verificar sessão: {e}")
+            session.logged_in = False
+        
         self.log("Fazendo login no LinkedIn...")
         
         try:
             # Navegar para página de login
-            await self.page.goto("https://www.linkedin.com/login", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(random.randint(2000, 4000))
+            await self.page.goto(self.url("/login"), wait_until="domcontentloaded")
+            await self.pacing.wait(2000, 4000)
             
             # Preencher campo de e-mail
             email_field = self.page.locator("#username")
             await email_field.wait_for(state="visible")
             await email_field.fill(self.email)
-            await self.page.wait_for_timeout(random.randint(500, 1500))
+            await self.pacing.wait(500, 1500)
             
             # Preencher campo de senha
             password_field = self.page.locator("#password")
             await password_field.fill(self.password)
-            await self.page.wait_for_timeout(random.randint(500, 1500))
+            await self.pacing.wait(500, 1500)
             
             # Clicar no botão de login
             login_button = self.page.locator("button[type='submit']")
             await login_button.click()
             
             self.log("Credenciais enviadas, aguardando...")
-            await self.page.wait_for_timeout(random.randint(5000, 8000))
+            await self.pacing.wait(5000, 8000)
             
             # Verificar sucesso do login
             current_url = self.page.url
             if "feed" in current_url or "/in/" in current_url:
                 self.log("Login realizado com sucesso!")
-                return True
             elif "challenge" in current_url or "checkpoint" in current_url:
                 self.log("Verificação adicional necessária. Complete manualmente.")
                 await self.page.wait_for_url("**/feed/**", timeout=300000)
-                return True
             else:
                 self.log("Falha no login. Verifique suas credenciais.")
                 return False
+            
+            if session is not None:
+                session.logged_in = True
+            return True
                 
         except Exception as e:
             self.log(f"Erro durante login: {e}")
             return False
 
+    @traced()
+    async def prefetch_saved_jobs(self, max_pages=50):
+        """
+        Carrega os IDs da lista "Minhas vagas / Salvas" uma única vez por execução
+
+        Percorre a lista em lotes paginados, guarda os IDs em memória e
+        espelha o resultado no ledger local para evitar abrir vagas já salvas
+        """
+        self.log("Carregando vagas já salvas em 'Minhas vagas'...")
+
+        found_ids = set()
+        start = 0
+        complete = False
+
+        try:
+            for _ in range(max_pages):
+                if not self.is_running:
+                    break
+
+                await self.page.goto(
+                    self.url(f"/my-items/saved-jobs/?cardType=SAVED&start={start}"),
+                    wait_until="domcontentloaded"
+                )
+
+                try:
+                    await self.page.wait_for_selector(
+                        "a[href*='/jobs/view/'], [data-job-id]", timeout=10000
+                    )
+                except:
+                    complete = True
+                    break
+
+                batch = await collect_job_ids(self.page)
+                new_ids = set(batch) - found_ids
+                if not new_ids:
+                    complete = True
+                    break
+
+                found_ids.update(new_ids)
+                start += len(batch)
+
+                # Última página da lista tem menos itens que um lote completo
+                if len(batch) < SAVED_JOBS_PAGE_SIZE:
+                    complete = True
+                    break
+
+                await self.pacing.wait(500, 1500)
+
+        except Exception as e:
+            self.log(f"Erro ao carregar vagas salvas: {e}")
+
+        if complete:
+            # Lista completa: ela é a fonte de verdade desta execução
+            self.saved_job_ids = found_ids
+        else:
+            # Lista parcial: complementa com o que o ledger já conhecia
+            self.saved_job_ids = found_ids | self.ledger.ids_with_status(JobLedger.STATUS_SAVED)
+
+        self.ledger.mark_many(found_ids, JobLedger.STATUS_SAVED)
+        self.ledger.save()
+
+        self.log(f"{len(self.saved_job_ids)} vagas já salvas serão ignoradas")
+        return self.saved_job_ids
+
+    def is_already_saved(self, job_id):
+        """
+        Verifica se a vaga já consta no conjunto de vagas salvas
+        """
+        return bool(job_id) and job_id in self.saved_job_ids
+
+    def is_known_job(self, job_id):
+        """
+        Verifica se a vaga já foi salva ou avaliada (nesta ou em execuções anteriores)
+        """
+        return bool(job_id) and (job_id in self.saved_job_ids or job_id in self.ledger)
+
+    def is_too_old(self, record):
+        """
+        Verifica se a vaga foi publicada há mais tempo que max_posted_days
+        
+        Cards sem data reconhecível nunca são considerados antigos
+        """
+        if self.max_posted_days is None:
+            return False
+        age = posted_age_days(record.posted)
+        return age is not None and age > self.max_posted_days
+
+    def is_stale_page(self, records):
+        """
+        Verifica se todos os cards restantes da página são antigos ou já conhecidos
+        
+        Uma lista vazia (todos descartados pelo cache ou por outras buscas) também conta
+        """
+        return all(self.is_too_old(record) or self.is_known_job(record.job_id) for record in records)
+
+    def record_verdict(self, record, result):
+        """
+        Registra no ledger as vagas avaliadas e não salvas (salvas já são registradas ao salvar)
+        """
+        if result['reason'] == "saved":
+            return
+        if result['verdict'] in (self.VERDICT_REJECTED, self.VERDICT_SKIPPED):
+            self.ledger.mark(record.job_id, JobLedger.STATUS_REJECTED, reason=result['reason'])
+        elif result['verdict'] == self.VERDICT_COMPATIBLE:
+            self.ledger.mark(record.job_id, JobLedger.STATUS_SEEN)
+
+    def remember_saved(self, job_id):
+        """
+        Registra uma vaga salva em memória e no ledger local
+        """
+        if not job_id:
+            return
+
+        self.saved_job_ids.add(job_id)
+        profile = self.last_match['profile'] if self.last_match else None
+        self.ledger.mark(job_id, JobLedger.STATUS_SAVED, profile=profile)
+
+    def count_saved_for_profile(self):
+        """
+        Contabiliza a vaga recém-salva para o perfil que a aprovou
+        
+        Returns:
+            str: Rótulo do perfil responsável pelo salvamento
+        """
+        profile = (self.last_match or {}).get('profile') or DEFAULT_PROFILE_NAME
+        self.saved_by_profile[profile] = self.saved_by_profile.get(profile, 0) + 1
+        return profile
+
+    def get_skip_reason(self, record):
+        """
+        Verifica, antes de qualquer abertura, se um card coletado deve ser ignorado
+        
+        Returns:
+            tuple or None: (tipo, motivo) para pular a vaga ou None se deve ser processada
+        """
+        job_id = record.job_id
+        if self.is_already_saved(job_id):
+            return "saved", "já está salva"
+        
+        if self.is_too_old(record):
+            return "old", f"publicada {record.posted.lower()} (limite {self.max_posted_days:g} dias)"
+        
+        company_reason = self.company_index.should_skip(record.company)
+        if company_reason:
+            return "company", company_reason
+        
+        if self.dedup_index is not None:
+            record.fingerprint = job_fingerprint(record.title, record.company, record.text)
+            duplicate_id = self.dedup_index.find(record.fingerprint, exclude_id=job_id)
+            if duplicate_id:
+                return "duplicate", f"é repostagem da vaga {duplicate_id}"
+        
+        return None
+
+    def archive_records(self, records):
+        """
+        Envia os cards coletados para o arquivo local (gravação fora do event loop)
+        """
+        if self.archive is None or not records:
+            return
+        
+        try:
+            self.archive.submit(records, source=self.page.url, keywords=self.keywords, location=self.location)
+        except Exception as e:
+            self.log(f"Erro ao arquivar vagas: {e}")
+
+    def search_filters(self):
+        """
+        Filtros que definem o conjunto de resultados da busca
+        """
+        return {
+            "experience_level": self.experience_level,
+            "work_type": self.work_type,
+            "contract_type": self.contract_type,
+            "apply_filters": self.apply_filters,
+        }
+
+    def results_cache_key(self, page_number):
+        """
+        Chave do cache para a página de resultados atual
+        
+        Args:
+            page_number (int): Página pela contagem do laço (usada se a URL não indicar a posição)
+        """
+        offset = results_offset(self.page.url)
+        page = offset // RESULTS_PAGE_SIZE if offset is not None else page_number
+        return search_cache_key(self.keywords, self.location, self.search_filters(), page)
+
+    def load_resume_state(self):
+        """
+        Lê o checkpoint da execução interrompida, se a retomada foi pedida
+        
+        Returns:
+            dict or None: Estado do checkpoint
+        """
+        if not self.resume or self.checkpoint is None:
+            return None
+        
+        state = self.checkpoint.load()
+        if not state:
+            self.log("Nenhuma execução interrompida para retomar, começando do início")
+            return None
+        
+        self.log(f"Retomando execução interrompida: {state['saved']} vagas salvas e "
+                 f"{state['processed']} processadas até o último checkpoint")
+        return state
+
+    def resumes_current_search(self, resume_state):
+        """
+        Se o checkpoint é da busca atual (mesmas palavras-chave, localização e filtros)
+        """
+        search = search_cache_key(self.keywords, self.location, self.search_filters())
+        return bool(resume_state) and resume_state.get("search") == search and bool(resume_state.get("page_url"))
+
+    async def open_search(self, resume_state=None):
+        """
+        Abre a busca atual: direto na página do checkpoint ou pelo formulário
+        
+        Returns:
+            tuple: (True se a página de resultados carregou, estado de retomada válido
+                para a página aberta ou None se a busca recomeçou da primeira página)
+        """
+        if self.resumes_current_search(resume_state):
+            url = page_url_at(resume_state["page_url"], resume_state.get("offset", 0))
+            if url:
+                try:
+                    self.log(f"Abrindo diretamente a página {resume_state.get('offset', 0) // RESULTS_PAGE_SIZE + 1} "
+                             f"dos resultados...")
+                    await self.page.goto(url, wait_until="domcontentloaded")
+                    await self.page.wait_for_selector("div[data-job-id], .job-card, .result-card", timeout=20000)
+                    return True, resume_state
+                except Exception as e:
+                    self.log(f"Erro ao abrir a página do checkpoint, refazendo a busca: {e}")
+                    self.metrics.retries.inc(operation="resume_page")
+        
+        # Busca pelo formulário começa na primeira página: a posição do checkpoint não vale
+        # mais (vagas já salvas continuam sendo puladas pelo conjunto de salvas)
+        return await self.search_jobs(), None
+
+    def skip_processed(self, records, resume_state):
+        """
+        Descarta os cards da página retomada que já foram processados antes da interrupção
+        
+        Vagas que falharam antes da interrupção são mantidas para uma nova tentativa
+        """
+        ids = [record.job_id for record in records]
+        last_job_id = resume_state.get("last_job_id")
+        if last_job_id and last_job_id in ids:
+            position = ids.index(last_job_id) + 1
+        else:
+            last_index = resume_state.get("last_index", -1)
+            position = next((n for n, record in enumerate(records) if record.index > last_index), len(records))
+        
+        failed = set(resume_state.get("failed", []))
+        retried = [record for record in records[:position] if record.job_id in failed]
+        if position:
+            self.log(f"{position - len(retried)} vagas desta página já foram processadas antes da interrupção")
+        return retried + records[position:]
+
+    def save_checkpoint(self, record, result):
+        """
+        Grava a posição da busca depois de uma vaga processada
+        
+        Vagas com erro não avançam a posição: ficam pendentes para a retomada
+        """
+        if self.checkpoint is None:
+            return
+        
+        try:
+            if result['verdict'] == self.VERDICT_ERROR:
+                self.checkpoint.record_failure(record.job_id)
+                return
+            self.checkpoint.record(
+                search_cache_key(self.keywords, self.location, self.search_filters()),
+                self.current_query.key if self.current_query else None,
+                page_url_at(self.page.url, results_offset(self.page.url) or 0) or self.page.url,
+                results_offset(self.page.url) or 0,
+                record.job_id, record.index, result['saved']
+            )
+        except Exception as e:
+            self.log(f"Erro ao gravar checkpoint: {e}")
+
+    def register_opened(self, record):
+        """
+        Registra uma vaga aberta para que suas repostagens sejam descartadas
+        """
+        if self.dedup_index is not None and record.fingerprint is not None:
+            self.dedup_index.add(record.job_id, record.fingerprint)
+
+    async def recycle_page_if_needed(self, job_cards, card_selectors=None):
+        """
+        Recicla a página principal quando a política de memória pedir
+        
+        A URL atual é reaberta em uma página nova, então o processamento
+        continua na mesma lista de resultados
+        
+        Returns:
+            Locator: Cards da página em uso (novos se a página foi reciclada; None
+                se a página reaberta ainda não mostrou os cards)
+        """
+        if job_cards is None:
+            # A reciclagem anterior não encontrou os cards a tempo: nova consulta
+            job_cards = await find_job_cards(self.page, card_selectors)
+        
+        if self.page_recycler is None:
+            return job_cards
+        
+        reason = await self.page_recycler.check(self.page)
+        if not reason:
+            return job_cards
+        
+        self.log(f"Reciclando a página ({RECYCLE_REASONS[reason]})...")
+        with self.tracer.span("recycle", reason=reason):
+            self.page, job_cards = await self.page_recycler.recycle(self.page, card_selectors)
+        self.metrics.page_recycles.inc(reason=reason)
+        self.cards_reloaded = True
+        await self.memory_checkpoint("reciclagem")
+        return job_cards
+
+    def count_fallback(self, operation, position):
+        """
+        Conta o uso de um caminho alternativo (seletor além do primeiro da lista)
+        """
+        if position:
+            self.metrics.retries.inc(operation=operation)
+
+    def locate_card(self, job_cards, record):
+        """
+        Retorna o Locator do card de um registro coletado
+        
+        Depois de uma reciclagem a ordem dos cards pode mudar, então o card
+        passa a ser localizado pelo ID da vaga
+        
+        Raises:
+            LookupError: Se o card não tem ID e a página reaberta não mostrou os cards;
+                a vaga é registrada como erro e tentada de novo na retomada
+        """
+        if self.cards_reloaded and record.job_id:
+            return job_card_locator(self.page, record.job_id)
+        if job_cards is None:
+            raise LookupError("card sem ID não encontrado na página reaberta")
+        return job_cards.nth(record.index)
+
+    def job_result(self, record, verdict, saved=False, reason=None):
+        """
+        Monta o resultado estruturado de uma vaga processada
+        
+        Args:
+            record (JobRecord): Card coletado
+            verdict (str): Um dos VERDICT_* da classe
+            saved (bool): Se a vaga foi salva nesta execução
+            reason (str): Motivo do pulo ("saved", "company", "duplicate") ou do erro
+        
+        Returns:
+            dict: job_id, index, title, company, location, posted, verdict, reason,
+                  saved, score e profile (avaliação do card, quando houve) e query
+                  (busca que encontrou a vaga, com várias buscas)
+        """
+        match = self.last_match if verdict in (self.VERDICT_SAVED, self.VERDICT_COMPATIBLE,
+                                               self.VERDICT_REJECTED) else None
+        return {
+            'job_id': record.job_id,
+            'index': record.index,
+            'title': record.title,
+            'company': record.company,
+            'location': record.location,
+            'posted': record.posted,
+            'verdict': verdict,
+            'reason': reason,
+            'saved': saved,
+            'score': match['score'] if match else None,
+            'profile': match['profile'] if match else None,
+            'query': self.current_query.label if self.current_query else None,
+        }
+
+    def job_opened(self, record):
+        """
+        Registra uma vaga aberta (repostagens e política de reciclagem)
+        """
+        self.register_opened(record)
+        if self.page_recycler:
+            self.page_recycler.job_done()
+
+    @traced()
     async def save_recommended_jobs(self):
         """
         Salva vagas da seção "Vagas que mais combinam com seu perfil"
         Aproveitando o algoritmo do próprio LinkedIn
+        
+        Returns:
+            int: Quantidade de vagas salvas
+        """
+        saved_count = 0
+        async for job in self.iter_recommended_jobs():
+            if job['saved']:
+                saved_count += 1
+        return saved_count
+
+    async def iter_recommended_jobs(self):
+        """
+        Processa as vagas recomendadas, gerando o resultado de cada card
+        
+        Sem recomendações na página, recorre à busca tradicional
+        
+        Yields:
+            dict: Resultado de cada vaga (ver job_result)
         """
         self.log("Processando vagas recomendadas pelo LinkedIn...")
+        self.stop_reason = None
         
         try:
             # Navegar para página inicial se não estiver
-            await self.page.goto("https://www.linkedin.com/feed/", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(3000)
+            await self.page.goto(self.url("/feed/"), wait_until="domcontentloaded")
+            await self.pacing.wait(3000)
             
             # Procurar seção de vagas recomendadas
             recommended_selectors = [
@@ -200,12 +900,13 @@ class LinkedInAutomation:
             ]
             
             section_found = False
-            for selector in recommended_selectors:
+            for position, selector in enumerate(recommended_selectors):
                 try:
                     section = self.page.locator(selector).first
                     if await section.is_visible():
                         await section.scroll_into_view_if_needed()
                         section_found = True
+                        self.count_fallback("recommended_section", position)
                         self.log(f"Seção de vagas recomendadas encontrada!")
                         break
                 except:
@@ -213,7 +914,9 @@ class LinkedInAutomation:
             
             if not section_found:
                 self.log("Vagas recomendadas não encontradas, indo para busca normal...")
-                return await self.search_jobs()
+                async for job in self.iter_search_fallback():
+                    yield job
+                return
             
             # Encontrar vagas recomendadas
             job_cards = self.page.locator(".job-card, .job-recommendation-card, [data-job-id]")
@@ -221,107 +924,136 @@ class LinkedInAutomation:
             
             if count == 0:
                 self.log("Nenhuma vaga recomendada encontrada, fazendo busca normal...")
-                return await self.search_jobs()
+                async for job in self.iter_search_fallback():
+                    yield job
+                return
             
             self.log(f"Encontradas {count} vagas recomendadas pelo LinkedIn")
             saved_count = 0
+            records = await harvest_job_cards(job_cards)
+            self.cards_reloaded = False
+            self.metrics.harvested.inc(len(records))
+            self.archive_records(records)
             
             # Processar cada vaga recomendada
-            for i in range(min(count, self.max_jobs)):
+            for record in records[:self.max_jobs]:
                 if not self.is_running:
                     break
+                
+                i = record.index
+                self.jobs_processed += 1
+                skip = self.get_skip_reason(record)
+                if skip:
+                    self.metrics.skipped.inc(reason=skip[0])
+                    self.log(f"Vaga {i+1} {skip[1]}, pulando...")
+                    result = self.job_result(record, self.VERDICT_SKIPPED, reason=skip[0])
+                    self.record_verdict(record, result)
+                    yield result
+                    continue
+                
+                # O resultado é entregue fora dos spans: o consumidor pode demorar
+                result = None
+                with self.tracer.span("card", job_id=record.job_id, index=i):
+                    try:
+                        job_cards = await self.recycle_page_if_needed(job_cards, RECOMMENDED_CARD_SELECTORS)
+                        job_card = self.locate_card(job_cards, record)
+                        await job_card.scroll_into_view_if_needed()
+                        await self.pacing.wait(1000)
                     
-                try:
-                    job_card = job_cards.nth(i)
-                    await job_card.scroll_into_view_if_needed()
-                    await self.page.wait_for_timeout(1000)
-                    
-                    # Verificar se a vaga é compatível
-                    if await self.is_job_compatible(job_card):
-                        await job_card.click()
-                        await self.page.wait_for_timeout(2000)
+                        # Verificar se a vaga é compatível
+                        if await self.is_job_compatible(job_card, record.text):
+                            with self.tracer.span("click", job_id=record.job_id):
+                                await job_card.click()
+                            self.job_opened(record)
+                            await self.pacing.wait(2000)
                         
-                        # Tentar salvar a vaga
-                        if await self.save_current_job():
-                            saved_count += 1
-                            self.saved_jobs_count = saved_count
-                            self.log(f"Vaga recomendada {saved_count} salva com sucesso!")
+                            # Tentar salvar a vaga
+                            saved = await self.save_current_job(record.job_id)
+                            self.company_index.record(record.company, True, saved)
+                            if saved:
+                                saved_count += 1
+                                self.saved_jobs_count = saved_count
+                                self.metrics.job_saved()
+                                profile = self.count_saved_for_profile()
+                                self.log(f"Vaga recomendada {saved_count} salva com sucesso! (perfil: {profile})")
+                            result = self.job_result(
+                                record, self.VERDICT_SAVED if saved else self.VERDICT_COMPATIBLE, saved=saved
+                            )
                         
-                        await self.page.wait_for_timeout(self.delay * 1000)
-                    else:
-                        self.log(f"Vaga {i+1} não atende aos critérios, pulando...")
+                            await self.pacing.wait(self.delay * 1000)
+                        else:
+                            self.company_index.record(record.company, False)
+                            self.log(f"Vaga {i+1} não atende aos critérios, pulando...")
+                            result = self.job_result(record, self.VERDICT_REJECTED)
                         
-                except Exception as e:
-                    self.log(f"Erro ao processar vaga recomendada {i+1}: {e}")
-                    continue
+                    except Exception as e:
+                        self.log(f"Erro ao processar vaga recomendada {i+1}: {e}")
+                        result = self.job_result(record, self.VERDICT_ERROR, reason=str(e))
+                
+                self.record_verdict(record, result)
+                yield result
             
             self.log(f"Processamento concluído! {saved_count} vagas recomendadas salvas.")
-            return saved_count
+            self.stop_reason = "recommended" if self.is_running else "stopped"
+            return
             
         except Exception as e:
             self.log(f"Erro ao processar vagas recomendadas: {e}")
-            return await self.search_jobs()
+        
+        async for job in self.iter_search_fallback():
+            yield job
+
+    async def iter_search_fallback(self):
+        """
+        Busca tradicional usada quando não há vagas recomendadas
+        """
+        self.metrics.retries.inc(operation="search_fallback")
+        if not await self.search_jobs():
+            self.stop_reason = "error"
+            return
+        async for job in self.iter_search_results():
+            yield job
 
-    async def is_job_compatible(self, job_card):
+    @traced("score")
+    async def is_job_compatible(self, job_card, job_text=None):
         """
         Verifica se a vaga é compatível com critérios definidos
+        
+        Se o texto do card já foi coletado, evita uma nova leitura no navegador
         """
+        self.last_match = None
         try:
             # Extrair informações da vaga
-            job_text = await job_card.text_content()
-            job_text_lower = job_text.lower()
+            if job_text is None:
+                job_text = await job_card.text_content()
             
-            # Verificar skills do usuário
-            skill_matches = 0
-            if self.user_skills:
-                skill_matches = sum(1 for skill in self.user_skills if skill in job_text_lower)
-            else:
-                # Skills padrão baseadas nas palavras-chave
-                default_skills = [word.strip().lower() for word in self.keywords.split(',')]
-                skill_matches = sum(1 for skill in default_skills if skill in job_text_lower)
-            
-            # Verificar termos a evitar
-            has_unwanted = any(term in job_text_lower for term in self.avoid_terms)
-            
-            # Verificar nível de experiência
-            level_ok = True
-            if self.experience_level == "Júnior" or self.experience_level == "Estágio":
-                senior_terms = ["senior", "sênior", "lead", "manager", "diretor", "especialista"]
-                has_senior_terms = any(term in job_text_lower for term in senior_terms)
-                level_ok = not has_senior_terms
-            
-            # Verificar modalidade de trabalho
-            work_mode_ok = True
-            if self.work_type != "Todas":
-                work_terms = {
-                    "Remoto": ["remoto", "remote", "home office", "trabalho remoto"],
-                    "Presencial": ["presencial", "escritório", "office", "local"],
-                    "Híbrido": ["híbrido", "hybrid", "misto"]
-                }
-                
-                if self.work_type in work_terms:
-                    work_mode_ok = any(term in job_text_lower for term in work_terms[self.work_type])
-            
-            # Critério final de compatibilidade
-            compatible = (
-                skill_matches >= 1 and     # Pelo menos 1 skill match
-                not has_unwanted and       # Sem termos indesejados
-                level_ok and              # Nível apropriado
-                work_mode_ok              # Modalidade OK
-            )
+            # Uma única varredura do texto avalia todos os perfis ativos
+            result = self.matcher.evaluate(job_text)
+            self.last_match = result
+            self.metrics.scored.inc()
+            if not result['compatible']:
+                self.metrics.rejected.inc()
             
-            if compatible:
-                self.log(f"Vaga compatível! Skills: {skill_matches}, Nível: OK, Modalidade: OK")
+            if result['compatible']:
+                verdict = result['verdicts'][result['profile']]
+                self.log(
+                    f"Vaga compatível! Perfil: {result['profile']}, "
+                    f"Skills: {len(verdict['matching_skills'])}, Nível: OK, Modalidade: OK"
+                )
             
-            return compatible
+            return result['compatible']
             
         except Exception as e:
             self.log(f"Erro na verificação de compatibilidade: {e}")
             return True
 
-    async def save_current_job(self):
+    @traced()
+    async def save_current_job(self, job_id=None):
         """
         Salva a vaga atualmente aberta
+        
+        Args:
+            job_id (str): ID da vaga aberta, usado para atualizar o conjunto de salvas
         """
         try:
             # Procurar botão salvar
@@ -332,27 +1064,39 @@ class LinkedInAutomation:
                 ".jobs-save-button"
             ]
             
-            for selector in save_selectors:
+            # O painel da vaga carrega depois do clique; sem pausas fixas é preciso aguardá-lo
+            try:
+                await self.page.locator(", ".join(save_selectors)).first.wait_for(state="visible", timeout=5000)
+            except:
+                pass
+            
+            for position, selector in enumerate(save_selectors):
                 try:
                     save_button = self.page.locator(selector).first
                     if await save_button.is_visible() and await save_button.is_enabled():
-                        # Verificar se já está salva
-                        button_text = await save_button.text_content() or ""
-                        if "salva" in button_text.lower():
+                        self.count_fallback("save_button", position)
+                        # Verificar se já está salva ("Salvar" também contém "salva")
+                        button_text = (await save_button.text_content() or "").strip().lower()
+                        if button_text in ("salva", "salvo", "saved") or \
+                                await save_button.get_attribute("aria-pressed") == "true":
+                            self.remember_saved(job_id)
                             return False
                         
                         await save_button.click()
-                        await self.page.wait_for_timeout(1000)
+                        await self.pacing.wait(1000)
+                        self.remember_saved(job_id)
                         return True
                 except:
                     continue
             
+            self.metrics.selector_misses.inc(selector="save_button")
             return False
             
         except Exception as e:
             self.log(f"Erro ao salvar vaga: {e}")
             return False
 
+    @traced()
     async def search_jobs(self):
         """
         Busca vagas com base nos filtros fornecidos (método tradicional)
@@ -361,8 +1105,8 @@ class LinkedInAutomation:
         
         try:
             # Navegar para página de vagas
-            await self.page.goto("https://www.linkedin.com/jobs/", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(random.randint(2000, 4000))
+            await self.page.goto(self.url("/jobs/"), wait_until="domcontentloaded")
+            await self.pacing.wait(2000, 4000)
             
             # Buscar campo de palavras-chave
             keyword_selectors = [
@@ -372,21 +1116,23 @@ class LinkedInAutomation:
             ]
             
             keyword_field = None
-            for selector in keyword_selectors:
+            for position, selector in enumerate(keyword_selectors):
                 try:
                     keyword_field = self.page.locator(selector).first
                     await keyword_field.wait_for(state="visible", timeout=5000)
+                    self.count_fallback("keyword_field", position)
                     break
                 except:
                     continue
             
             if not keyword_field:
+                self.metrics.selector_misses.inc(selector="keyword_field")
                 raise Exception("Campo de pesquisa não encontrado")
             
             # Limpar e preencher palavras-chave
             await keyword_field.fill("")
-            await keyword_field.type(self.keywords, delay=50)
-            await self.page.wait_for_timeout(random.randint(500, 1500))
+            await keyword_field.type(self.keywords, delay=self.pacing.typing_delay(50))
+            await self.pacing.wait(500, 1500)
             
             # Buscar campo de localização
             location_selectors = [
@@ -405,14 +1151,14 @@ class LinkedInAutomation:
             
             if location_field:
                 await location_field.fill("")
-                await location_field.type(self.location, delay=50)
-                await self.page.wait_for_timeout(random.randint(500, 1500))
+                await location_field.type(self.location, delay=self.pacing.typing_delay(50))
+                await self.pacing.wait(500, 1500)
             
             # Executar busca
             await self.page.keyboard.press("Enter")
             
             self.log("Executando busca tradicional...")
-            await self.page.wait_for_timeout(random.randint(3000, 6000))
+            await self.pacing.wait(3000, 6000)
             
             # Aguardar resultados carregarem
             await self.page.wait_for_selector(
@@ -431,6 +1177,7 @@ class LinkedInAutomation:
             self.log(f"Erro durante busca: {e}")
             return False
 
+    @traced()
     async def apply_advanced_filters(self):
         """
         Aplica filtros avançados
@@ -455,7 +1202,7 @@ class LinkedInAutomation:
             
             if filter_button:
                 await filter_button.click()
-                await self.page.wait_for_timeout(random.randint(2000, 3000))
+                await self.pacing.wait(2000, 3000)
                 
                 # Aplicar filtros específicos
                 await self.apply_work_type_filter()
@@ -475,11 +1222,12 @@ class LinkedInAutomation:
                         if await apply_button.is_visible() and await apply_button.is_enabled():
                             await apply_button.click()
                             self.log("Filtros aplicados!")
-                            await self.page.wait_for_timeout(random.randint(3000, 5000))
+                            await self.pacing.wait(3000, 5000)
                             return
                     except:
                         continue
             else:
+                self.metrics.selector_misses.inc(selector="filter_button")
                 self.log("Botão de filtros não encontrado")
                 
         except Exception as e:
@@ -578,150 +1326,600 @@ class LinkedInAutomation:
         except Exception as e:
             self.log(f"Erro ao aplicar filtro de contrato: {e}")
 
+    @traced()
     async def save_jobs(self):
         """
         Salva as vagas encontradas - versão tradicional para busca normal
+        
+        Returns:
+            int: Quantidade de vagas salvas
+        """
+        saved_count = 0
+        async for job in self.iter_search_results():
+            if job['saved']:
+                saved_count += 1
+        return saved_count
+
+    async def iter_search_results(self, max_saves=None, resume_state=None):
+        """
+        Percorre as páginas de resultados da busca já aberta, gerando o resultado de cada card
+        
+        Args:
+            max_saves (int): Vagas a salvar nesta busca (padrão: max_jobs)
+            resume_state (dict): Checkpoint da execução interrompida; os cards da
+                primeira página até a última vaga processada são pulados
+        
+        Yields:
+            dict: Resultado de cada vaga (ver job_result)
         """
-        self.log(f"Iniciando salvamento de até {self.max_jobs} vagas...")
+        max_saves = self.max_jobs if max_saves is None else max_saves
+        self.log(f"Iniciando salvamento de até {max_saves} vagas...")
         
         saved_count = 0
         attempts = 0
-        max_attempts = 50
+        stale_pages = 0
+        self.stop_reason = None
+        self.search_complete = False
         
-        while saved_count < self.max_jobs and attempts < max_attempts and self.is_running:
+        while saved_count < max_saves and attempts < self.max_pages and self.is_running:
             try:
                 attempts += 1
                 
-                job_selectors = [
-                    "div[data-job-id]",
-                    ".job-card",
-                    ".result-card"
-                ]
-                
-                job_cards = None
-                for selector in job_selectors:
-                    job_cards = self.page.locator(selector)
-                    count = await job_cards.count()
-                    if count > 0:
-                        break
-                
-                if not job_cards or await job_cards.count() == 0:
+                job_cards = await find_job_cards(self.page)
+                if not job_cards:
+                    self.metrics.selector_misses.inc(selector="job_cards")
                     self.log("Nenhuma vaga encontrada na página")
+                    self.stop_reason = "no_cards"
                     break
                 
-                count = await job_cards.count()
-                self.log(f"Processando {count} vagas...")
+                # Cards da página pré-carregada já foram coletados em segundo plano
+                records = self.prefetched_records
+                self.prefetched_records = None
+                if not records:
+                    records = await harvest_job_cards(job_cards)
+                self.cards_reloaded = False
+                self.metrics.harvested.inc(len(records))
+                self.archive_records(records)
+                self.metrics.sample_memory()
+                
+                page_records = records
+                resumed_page = resume_state is not None
+                if resumed_page:
+                    records = self.skip_processed(records, resume_state)
+                    resume_state = None
+                
+                # Diferença com a passagem anterior pela mesma busca (qualquer página,
+                # já que vagas novas deslocam as antigas): só as vagas novas são processadas
+                cache_key = None
+                if self.search_cache is not None:
+                    cache_key = self.results_cache_key(attempts - 1)
+                    cache_search = search_key(self.keywords, self.location, self.search_filters())
+                    known_ids = self.search_cache.known_ids(cache_search)
+                    if known_ids:
+                        records = [record for record in records if not record.job_id or record.job_id not in known_ids]
+                        unchanged = len(page_records) - len(records)
+                        self.metrics.skipped.inc(unchanged, reason="cached")
+                        if not records and not self.stale_pages and not resumed_page:
+                            self.search_cache.put(cache_key, page_records, cache_search)
+                            self.log("Nenhuma vaga nova nesta página desde a última passagem, encerrando a busca")
+                            self.stop_reason = "cached"
+                            break
+                        if unchanged:
+                            self.log(f"{unchanged} vagas sem mudança desde a última passagem")
                 
-                for i in range(min(count, self.max_jobs - saved_count)):
-                    if saved_count >= self.max_jobs or not self.is_running:
+                # Vagas já vistas em outra busca desta execução não são avaliadas de novo
+                if self.query_planner is not None and self.current_query is not None:
+                    harvested = len(records)
+                    records = self.query_planner.filter_new(self.current_query, records)
+                    if len(records) < harvested:
+                        self.log(f"{harvested - len(records)} vagas já vistas em outras buscas")
+                
+                # Página só com vagas antigas ou já vistas: nada a processar; após
+                # stale_pages páginas seguidas assim, as próximas também não terão novidades
+                if self.stale_pages and not resumed_page and self.is_stale_page(records):
+                    stale_pages += 1
+                    self.metrics.skipped.inc(len(records), reason="stale")
+                    self.log(f"Nenhuma vaga nova ou recente nesta página ({stale_pages} de {self.stale_pages})")
+                    records = []
+                    if stale_pages >= self.stale_pages:
+                        if cache_key is not None:
+                            self.search_cache.put(cache_key, page_records, cache_search)
+                        self.stop_reason = "stale_pages"
+                        break
+                else:
+                    stale_pages = 0
+                self.log(f"Processando {len(records)} vagas...")
+                page_errors = 0
+                
+                # Começar a carregar a próxima página enquanto esta é processada
+                # (na última página não há botão "Próxima" e nada a pré-carregar)
+                if self.prefetcher and saved_count < max_saves and await self.has_next_page():
+                    self.prefetcher.schedule(self.page.url)
+                
+                for record in records:
+                    if saved_count >= max_saves or not self.is_running:
                         break
                     
-                    try:
-                        job_card = job_cards.nth(i)
+                    i = record.index
+                    self.jobs_processed += 1
+                    skip = self.get_skip_reason(record)
+                    if skip:
+                        self.metrics.skipped.inc(reason=skip[0])
+                        self.log(f"Vaga {i+1} {skip[1]}, pulando...")
+                        result = self.job_result(record, self.VERDICT_SKIPPED, reason=skip[0])
+                        self.record_verdict(record, result)
+                        self.save_checkpoint(record, result)
+                        yield result
+                        continue
+                    
+                    result = None
+                    with self.tracer.span("card", job_id=record.job_id, index=i):
+                        try:
+                            job_cards = await self.recycle_page_if_needed(job_cards)
+                            job_card = self.locate_card(job_cards, record)
                         
-                        # Scroll até a vaga
-                        await job_card.scroll_into_view_if_needed()
-                        await self.page.wait_for_timeout(random.randint(1000, 2000))
+                            # Scroll até a vaga
+                            await job_card.scroll_into_view_if_needed()
+                            await self.pacing.wait(1000, 2000)
                         
-                        # Verificar compatibilidade antes de clicar
-                        if await self.is_job_compatible(job_card):
-                            # Clicar na vaga
-                            await job_card.click()
-                            await self.page.wait_for_timeout(random.randint(2000, 3000))
+                            # Verificar compatibilidade antes de clicar
+                            if await self.is_job_compatible(job_card, record.text):
+                                # Clicar na vaga
+                                with self.tracer.span("click", job_id=record.job_id):
+                                    await job_card.click()
+                                self.job_opened(record)
+                                await self.pacing.wait(2000, 3000)
                             
-                            # Tentar salvar
-                            if await self.save_current_job():
-                                saved_count += 1
-                                self.saved_jobs_count = saved_count
-                                self.log(f"Vaga {saved_count} salva!")
+                                # Tentar salvar
+                                saved = await self.save_current_job(record.job_id)
+                                self.company_index.record(record.company, True, saved)
+                                if saved:
+                                    saved_count += 1
+                                    self.saved_jobs_count = saved_count
+                                    self.metrics.job_saved()
+                                    profile = self.count_saved_for_profile()
+                                    self.log(f"Vaga {saved_count} salva! (perfil: {profile})")
+                                result = self.job_result(
+                                    record, self.VERDICT_SAVED if saved else self.VERDICT_COMPATIBLE, saved=saved
+                                )
                             
-                            await self.page.wait_for_timeout(random.randint(
-                                self.delay * 1000, (self.delay + 2) * 1000
-                            ))
-                        else:
-                            self.log(f"Vaga {i+1} não compatível, pulando...")
+                                await self.pacing.wait(self.delay * 1000, (self.delay + 2) * 1000)
+                            else:
+                                self.company_index.record(record.company, False)
+                                self.log(f"Vaga {i+1} não compatível, pulando...")
+                                result = self.job_result(record, self.VERDICT_REJECTED)
                         
-                    except Exception as e:
-                        self.log(f"Erro ao processar vaga {i + 1}: {e}")
-                        continue
+                        except Exception as e:
+                            self.log(f"Erro ao processar vaga {i + 1}: {e}")
+                            result = self.job_result(record, self.VERDICT_ERROR, reason=str(e))
+                            page_errors += 1
+                    
+                    self.record_verdict(record, result)
+                    self.save_checkpoint(record, result)
+                    yield result
+                else:
+                    # Página inteira processada: entra no cache para a próxima passagem
+                    if cache_key is not None:
+                        self.search_cache.put(cache_key, page_records, cache_search)
+                
+                await self.memory_checkpoint(f"pagina {attempts}")
                 
                 # Ir para próxima página se necessário
-                if saved_count < self.max_jobs and self.is_running:
+                if saved_count < max_saves and self.is_running:
                     if not await self.go_to_next_page():
+                        # Sem botão "Próxima" depois de falhas nos cards: a página
+                        # provavelmente caiu, não é o fim dos resultados
+                        if page_errors:
+                            self.log(f"Próxima página não encontrada após {page_errors} erros nesta página")
+                            self.stop_reason = "error"
+                        else:
+                            self.stop_reason = "last_page"
                         break
                 
             except Exception as e:
                 self.log(f"Erro durante salvamento: {e}")
+                self.stop_reason = "error"
                 break
         
-        self.log(f"Processo concluído! {saved_count} vagas salvas no total.")
-        return saved_count
+        if self.stop_reason is None:
+            if not self.is_running:
+                self.stop_reason = "stopped"
+            elif saved_count >= max_saves:
+                self.stop_reason = "max_jobs"
+            else:
+                self.stop_reason = "max_pages"
+        
+        self.log(f"Processo concluído! {saved_count} vagas salvas no total "
+                 f"({STOP_REASONS[self.stop_reason]}, {attempts} páginas).")
+        self.search_complete = self.is_running and self.stop_reason in FINISHED_STOP_REASONS
 
+    async def has_next_page(self):
+        """
+        Verifica, sem rolar nem esperar, se a página atual tem o botão "Próxima"
+        
+        Em caso de dúvida (erro na consulta) considera que há próxima página
+        """
+        try:
+            return await self.page.locator(", ".join(NEXT_PAGE_SELECTORS)).count() > 0
+        except Exception:
+            return True
+
+    @traced()
     async def go_to_next_page(self):
         """
         Navega para a próxima página de resultados
+        
+        Usa a aba pré-carregada quando disponível; caso contrário clica em "Próxima"
         """
+        if self.prefetcher:
+            prefetched = await self.prefetcher.take()
+            if prefetched:
+                page, records = prefetched
+                old_page, self.page = self.page, page
+                await self.page.bring_to_front()
+                await old_page.close()
+                self.prefetched_records = records
+                if self.page_recycler:
+                    # A aba pré-carregada já é uma página nova
+                    self.page_recycler.reset()
+                self.log("Próxima página (pré-carregada)...")
+                return True
+            self.metrics.retries.inc(operation="next_page")
+        
         try:
             await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await self.page.wait_for_timeout(random.randint(2000, 3000))
-            
-            next_selectors = [
-                "button[aria-label='Próxima']",
-                "button:has-text('Próxima')",
-                "button[aria-label='Next']",
-                "a[aria-label*='Next']"
-            ]
+            await self.pacing.wait(2000, 3000)
             
-            for selector in next_selectors:
+            for position, selector in enumerate(NEXT_PAGE_SELECTORS):
                 try:
                     next_button = self.page.locator(selector).first
                     if await next_button.is_visible() and await next_button.is_enabled():
+                        self.count_fallback("next_button", position)
                         await next_button.click()
                         self.log("Próxima página...")
-                        await self.page.wait_for_timeout(random.randint(3000, 5000))
+                        await self.pacing.wait(3000, 5000)
                         return True
                 except:
                     continue
             
+            self.metrics.selector_misses.inc(selector="next_button")
             return False
             
-        except:
-            return False
+        except Exception as e:
+            # A página não responde: não é o fim dos resultados
+            raise SearchError(f"Falha ao ir para a próxima página: {e}")
 
-    async def run_async(self):
+    async def __aenter__(self):
         """
-        Executa todo o processo de automação de forma assíncrona
+        Abre o navegador, faz login e carrega as vagas já salvas
+        
+        Raises:
+            BrowserStartError: Se o navegador não abrir
+            LoginError: Se o login falhar
         """
         self.is_running = True
+        self.session_open = True
+        self.start_metrics_server()
+        
+        if self.profile_run:
+            self.profiler = RunProfiler(self.log)
+            self.profiler.start()
+            self.log("Profiling ativado para esta execução")
+        
+        if self.memory_tracker:
+            self.memory_tracker.start()
         
         try:
             # 1. Configurar navegador
             if not await self.setup_browser():
-                return False
+                raise BrowserStartError("Não foi possível iniciar o navegador")
+            await self.memory_checkpoint("setup_browser")
             
             # 2. Fazer login
             if not await self.login():
-                return False
-            
-            # 3. Escolher estratégia baseada nas configurações
-            if self.use_recommendations:
-                self.log("Priorizando vagas recomendadas pelo LinkedIn...")
-                saved_count = await self.save_recommended_jobs()
-            else:
-                self.log("Usando busca tradicional...")
-                if not await self.search_jobs():
-                    return False
-                saved_count = await self.save_jobs()
-            
-            self.log(f"Automação finalizada! {saved_count} vagas salvas.")
+                raise LoginError("Falha no login")
+            await self.memory_checkpoint("login")
+            
+            # Carregar vagas já salvas para não abri-las novamente
+            session = self.browser_session
+            if self.prefetch_saved and session is not None and session.saved_job_ids is not None:
+                # Conjunto carregado por uma execução anterior do daemon (atualizado a cada salvamento)
+                self.saved_job_ids = session.saved_job_ids
+                self.log(f"{len(self.saved_job_ids)} vagas já salvas serão ignoradas")
+            elif self.prefetch_saved:
+                await self.prefetch_saved_jobs()
+                await self.memory_checkpoint("prefetch_saved_jobs")
+                if session is not None:
+                    session.saved_job_ids = self.saved_job_ids
+        except BaseException:
+            await self.finish()
+            raise
+        
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.finish()
+        return False
+
+    async def iter_jobs(self, use_recommendations=None):
+        """
+        Processa as vagas e entrega o resultado de cada uma assim que fica pronto
+        
+        Deve ser usado dentro de "async with"; a próxima vaga só é aberta quando
+        o consumidor pede o próximo resultado
+        
+        Args:
+            use_recommendations (bool): Estratégia (padrão: a do construtor)
+        
+        Yields:
+            dict: Resultado de cada vaga (ver job_result)
+        
+        Raises:
+            SearchError: Se a busca tradicional não carregar resultados
+        """
+        if use_recommendations is None:
+            use_recommendations = self.use_recommendations
+        
+        # 3. Escolher estratégia baseada nas configurações
+        if use_recommendations:
+            self.log("Priorizando vagas recomendadas pelo LinkedIn...")
+            async for job in self.iter_recommended_jobs():
+                yield job
+            # Recomendações não são retomadas: um checkpoint da busca de apoio não vale mais
+            self.search_complete = self.is_running
+        elif self.query_planner is not None:
+            async for job in self.iter_planned_searches():
+                yield job
+        else:
+            self.log("Usando busca tradicional...")
+            state = self.load_resume_state()
+            if state and not self.resumes_current_search(state):
+                self.log("O checkpoint é de outra busca ou filtros, começando do início")
+                self.checkpoint.state = self.checkpoint.empty_state()
+                state = None
+            
+            opened, page_state = await self.open_search(state)
+            if not opened:
+                raise SearchError("Falha na busca de vagas")
+            
+            max_saves = self.max_jobs - state['saved'] if state else self.max_jobs
+            async for job in self.iter_search_results(max_saves, resume_state=page_state):
+                yield job
+        
+        self.clear_checkpoint()
+
+    def clear_checkpoint(self):
+        """
+        Remove o checkpoint quando a busca chegou ao fim (resultados esgotados ou
+        limite atingido); após erros ou interrupção ele é mantido para a retomada
+        """
+        if self.checkpoint is None or not self.search_complete:
+            return
+        try:
+            self.checkpoint.clear()
+        except Exception as e:
+            self.log(f"Erro ao remover checkpoint: {e}")
+
+    async def iter_planned_searches(self):
+        """
+        Executa as várias buscas configuradas, da mais para a menos produtiva
+        
+        O limite max_jobs vale para o total das buscas; cada vaga é avaliada
+        uma única vez, mesmo que apareça em várias buscas
+        
+        Yields:
+            dict: Resultado de cada vaga (ver job_result)
+        """
+        planner = self.query_planner
+        queries = planner.order()
+        
+        # Buscas concluídas antes da interrupção não são repetidas
+        state = self.load_resume_state()
+        saved_total = 0
+        if state:
+            completed = set(state.get("completed_queries", []))
+            queries = [query for query in queries if query.key not in completed]
+            saved_total = state['saved']
+        
+        self.log(f"Executando {len(queries)} buscas, da mais para a menos produtiva...")
+        failed = False
+        try:
+            for query in queries:
+                if saved_total >= self.max_jobs or not self.is_running:
+                    break
+                
+                self.current_query = query
+                self.keywords, self.location = query.keywords, query.location
+                
+                # A página pré-carregada pertence à busca anterior
+                if self.prefetcher:
+                    await self.prefetcher.cancel()
+                self.prefetched_records = None
+                
+                query_state = state if state and state.get("query") == query.key else None
+                if query_state and not self.resumes_current_search(query_state):
+                    query_state = None
+                
+                opened, query_state = await self.open_search(query_state)
+                if not opened:
+                    self.log(f"Busca {query.label} falhou, seguindo para a próxima...")
+                    failed = True
+                    continue
+                
+                async for job in self.iter_search_results(self.max_jobs - saved_total, resume_state=query_state):
+                    if job['saved']:
+                        saved_total += 1
+                    yield job
+                
+                # Só a busca que chegou ao fim sem erros deixa de ser repetida na retomada
+                if not self.search_complete:
+                    failed = True
+                elif self.checkpoint is not None:
+                    try:
+                        self.checkpoint.complete_query(query.key)
+                    except Exception as e:
+                        self.log(f"Erro ao gravar checkpoint: {e}")
+            self.search_complete = self.is_running and not failed
+            
+            # Motivo do fim do conjunto de buscas (o da última busca não basta)
+            if not self.is_running:
+                self.stop_reason = "stopped"
+            elif failed:
+                self.stop_reason = "error"
+            elif saved_total >= self.max_jobs:
+                self.stop_reason = "max_jobs"
+            elif self.stop_reason is None:
+                self.stop_reason = "last_page"
+        finally:
+            self.current_query = None
+            try:
+                planner.save()
+            except Exception as e:
+                self.log(f"Erro ao gravar histórico das buscas: {e}")
+            self.log("Vagas por busca:")
+            for line in planner.report():
+                self.log(line)
+
+    async def run_async(self):
+        """
+        Executa todo o processo de automação de forma assíncrona
+        """
+        try:
+            async with self:
+                saved_count = 0
+                with self.tracer.span("iter_jobs"):
+                    async for job in self.iter_jobs():
+                        if job['saved']:
+                            saved_count += 1
+                
+                self.log(f"Automação finalizada! {saved_count} vagas salvas.")
+                if len(self.profiles) > 1:
+                    for profile in self.profiles:
+                        self.log(f"  Perfil '{profile.name}': {self.saved_by_profile.get(profile.name, 0)} vagas")
             return True
             
         except Exception as e:
             self.log(f"Erro geral na automação: {e}")
             return False
-        finally:
-            self.is_running = False
-            await self.cleanup()
+
+    async def finish(self):
+        """
+        Encerra a execução: grava o estado local, exporta relatórios e fecha o navegador
+        """
+        if not self.session_open:
+            return
+        
+        self.session_open = False
+        self.is_running = False
+        if self.memory_tracker:
+            await self.memory_checkpoint("fim")
+        self.ledger.save()
+        if self.dedup_index is not None:
+            self.dedup_index.save()
+        self.company_index.save()
+        if self.search_cache is not None:
+            try:
+                self.search_cache.save()
+            except Exception as e:
+                self.log(f"Erro ao gravar cache de buscas: {e}")
+        self.close_archive()
+        self.export_trace()
+        self.export_metrics()
+        if self.call_stats is not None:
+            for line in self.call_stats.report():
+                self.log(line)
+        await self.cleanup()
+        if self.memory_tracker:
+            self.memory_tracker.stop()
+        if self.profiler:
+            self.profiler.stop()
+            self.profiler = None
+
+    def close_archive(self):
+        """
+        Conclui as gravações pendentes e atualiza o índice do arquivo local
+        """
+        if self.archive is None:
+            return
+        
+        try:
+            self.archive.close()
+            self.log(f"Arquivo local de vagas: {self.archive.index_count} vagas ({self.archive.path})")
+        except Exception as e:
+            self.log(f"Erro ao fechar arquivo local de vagas: {e}")
+        self.archive = None
+
+    async def memory_checkpoint(self, phase):
+        """
+        Registra a memória ao final de uma fase, se o acompanhamento estiver ativo
+        """
+        if self.memory_tracker is None:
+            return
+        
+        try:
+            page = self.page if self.page and not self.page.is_closed() else None
+            await self.memory_tracker.checkpoint(phase, page, self.jobs_processed)
+        except Exception as e:
+            self.log(f"Erro ao medir memória: {e}")
+
+    def exports_metrics(self):
+        """
+        Se as métricas desta execução são expostas (endpoint) ou gravadas em arquivo
+        """
+        return bool(self.metrics_port or self.metrics_textfile)
+
+    def watch_responses(self):
+        """
+        Soma os bytes baixados pelo navegador, só quando as métricas são exportadas:
+        respostas sem content-length custam uma ida extra ao navegador
+        """
+        if self.exports_metrics():
+            self.context.on("response", self.metrics.observe_response)
+
+    def start_metrics_server(self):
+        """
+        Inicia o endpoint local de métricas, se configurado
+        """
+        if not self.metrics_port or self.metrics_server:
+            return
+        
+        try:
+            self.metrics_server = MetricsServer(self.metrics.registry, int(self.metrics_port)).start()
+            self.log(f"Métricas disponíveis em http://127.0.0.1:{self.metrics_port}/metrics")
+        except Exception as e:
+            self.log(f"Erro ao iniciar servidor de métricas: {e}")
+
+    def export_metrics(self):
+        """
+        Grava o arquivo de métricas e encerra o endpoint local
+        """
+        self.metrics.sample_memory()
+        
+        if self.metrics_textfile:
+            try:
+                self.metrics.registry.write_textfile(self.metrics_textfile)
+                self.log(f"Métricas salvas em: {self.metrics_textfile}")
+            except Exception as e:
+                self.log(f"Erro ao gravar métricas: {e}")
+        
+        if self.metrics_server:
+            self.metrics_server.stop()
+            self.metrics_server = None
+
+    def export_trace(self):
+        """
+        Exporta o trace da execução e registra no log o tempo por fase
+        """
+        if not self.tracer.enabled:
+            return
+        
+        try:
+            self.tracer.export(self.trace_path)
+            self.log(f"Trace salvo em: {self.trace_path} (abra em https://ui.perfetto.dev)")
+            for name, count, total in self.tracer.summary()[:10]:
+                self.log(f"  {name}: {count}x, {total:.1f}s no total")
+        except Exception as e:
+            self.log(f"Erro ao exportar trace: {e}")
 
     def run(self):
         """
@@ -747,8 +1945,16 @@ class LinkedInAutomation:
         Limpa recursos do navegador
         """
         try:
+            if self.prefetcher:
+                await self.prefetcher.cancel()
             if self.page:
                 await self.page.close()
+            if self.browser_session is not None:
+                # Navegador compartilhado continua aberto para a próxima execução
+                if self.exports_metrics():
+                    self.context.remove_listener("response", self.metrics.observe_response)
+                self.log("Página fechada (navegador continua aberto)")
+                return
             if self.context:
                 await self.context.close()
             if self.browser:
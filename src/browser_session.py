@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Navegador compartilhado entre execuções (modo daemon)
+Mantém um único Chromium/contexto aberto, com login e vagas salvas já
+carregados, e o reinicia após falhas ou excesso de memória
+"""
+
+import time
+import asyncio
+
+from utils import process_tree_rss
+
+# Opções de lançamento do Chromium (iguais para execuções avulsas e daemon)
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--disable-features=VizDisplayCompositor",
+    # Evita que a aba de pré-carregamento seja estrangulada em segundo plano
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+]
+
+# Contexto com configurações anti-detecção
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1366, "height": 768},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
+    "locale": "pt-BR",
+    "timezone_id": "America/Sao_Paulo",
+    "extra_http_headers": {
+        "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8"
+    }
+}
+
+# Configurações avançadas anti-detecção
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => false,
+    });
+
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en-US', 'en'],
+    });
+"""
+
+def browser_launch_options(headless):
+    return {
+        "headless": headless,
+        "args": list(BROWSER_ARGS),
+        "ignore_default_args": ["--enable-blink-features=AutomationControlled"],
+    }
+
+class BrowserSession:
+    """
+    Navegador e contexto mantidos abertos entre várias execuções da automação
+
+    As execuções apenas abrem e fecham páginas; cookies (login) e o conjunto
+    de vagas salvas continuam valendo para a próxima execução
+    """
+
+    def __init__(self, log_callback, headless=True, max_rss_mb=None, max_age_hours=None,
+                 health_timeout=15):
+        """
+        Args:
+            log_callback (function): Função para logging
+            headless (bool): Executar o navegador sem janela
+            max_rss_mb (int): Reiniciar quando a memória do processo + navegador passar disso
+            max_age_hours (float): Reiniciar o navegador depois desse tempo aberto
+            health_timeout (int): Segundos para o navegador responder à verificação
+        """
+        self.log = log_callback
+        self.headless = headless
+        self.max_rss_mb = max_rss_mb
+        self.max_age_hours = max_age_hours
+        self.health_timeout = health_timeout
+
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.started_at = None
+        self.crashed = False
+        self.restarts = 0
+
+        # Estado da conta, preservado entre reinícios do navegador
+        self.logged_in = False
+        self.saved_job_ids = None
+
+    async def start(self):
+        """
+        Abre o Playwright, o navegador e o contexto
+        """
+        from playwright.async_api import async_playwright
+
+        self.log("Abrindo navegador compartilhado...")
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(**browser_launch_options(self.headless))
+        self.browser.on("disconnected", self._on_disconnected)
+        self.context = await self.browser.new_context(**CONTEXT_OPTIONS)
+        await self.context.add_init_script(STEALTH_SCRIPT)
+        self.crashed = False
+        self.started_at = time.time()
+        return self
+
+    def _on_disconnected(self, browser):
+        self.crashed = True
+
+    def is_alive(self):
+        return self.browser is not None and not self.crashed and self.browser.is_connected()
+
+    async def ensure_started(self):
+        """
+        Garante um navegador utilizável, reiniciando-o se tiver caído
+
+        Returns:
+            bool: True se o navegador está pronto
+        """
+        try:
+            if self.browser is None:
+                await self.start()
+            elif not self.is_alive():
+                await self.restart("navegador encerrado")
+            return True
+        except Exception as e:
+            self.log(f"Erro ao abrir navegador compartilhado: {e}")
+            return False
+
+    async def check_health(self):
+        """
+        Verifica se o navegador responde e está dentro dos limites
+
+        Returns:
+            str or None: Motivo para reiniciar ou None se está saudável
+        """
+        if not self.is_alive():
+            return "navegador encerrado"
+
+        page = None
+        try:
+            page = await asyncio.wait_for(self.context.new_page(), self.health_timeout)
+            await asyncio.wait_for(page.evaluate("1 + 1"), self.health_timeout)
+        except Exception:
+            return "navegador não responde"
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+        if self.max_rss_mb:
+            rss_mb = process_tree_rss() / (1024 * 1024)
+            if rss_mb > self.max_rss_mb:
+                return f"memória em {rss_mb:.0f}MB (limite {self.max_rss_mb}MB)"
+
+        if self.max_age_hours and time.time() - self.started_at > self.max_age_hours * 3600:
+            return f"aberto há mais de {self.max_age_hours}h"
+
+        return None
+
+    async def restart(self, reason):
+        """
+        Fecha e reabre o navegador (o login é refeito na próxima execução)
+        """
+        self.log(f"Reiniciando navegador compartilhado ({reason})...")
+        await self.close()
+        self.logged_in = False
+        self.restarts += 1
+        await self.start()
+
+    async def close(self):
+        """
+        Fecha contexto, navegador e Playwright, ignorando falhas de um navegador já caído
+        """
+        try:
+            if self.context:
+                await self.context.close()
+        except Exception:
+            pass
+        try:
+            if self.browser:
+                await self.browser.close()
+        except Exception:
+            pass
+        try:
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception:
+            pass
+        self.playwright = None
+        self.browser = None
+        self.context = None
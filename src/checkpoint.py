@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Checkpoint da busca em andamento para retomar execuções interrompidas
+Guarda a busca, a página (URL com start=), a última vaga processada e os
+contadores; a gravação é atômica, então uma queda perde no máximo a vaga atual
+"""
+
+import os
+import json
+import time
+
+from utils import get_data_dir, atomic_write_json
+
+class RunCheckpoint:
+    """
+    Posição da execução atual, gravada em disco após cada vaga processada
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str): Arquivo do checkpoint (padrão: diretório de dados)
+        """
+        self.path = path or os.path.join(get_data_dir(), "checkpoint.json")
+        self.state = self.empty_state()
+
+    @staticmethod
+    def empty_state():
+        return {
+            "search": None,
+            "query": None,
+            "page_url": None,
+            "offset": 0,
+            "last_job_id": None,
+            "last_index": -1,
+            "failed": [],
+            "saved": 0,
+            "processed": 0,
+            "completed_queries": [],
+            "started_at": time.time(),
+            "updated_at": None,
+        }
+
+    def load(self):
+        """
+        Lê o checkpoint de uma execução interrompida e continua a partir dele
+
+        Returns:
+            dict or None: Estado gravado ou None se não houver checkpoint válido
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not state.get("page_url") and not state.get("completed_queries"):
+            return None
+
+        self.state = self.empty_state()
+        self.state.update(state)
+        return self.state
+
+    def record(self, search, query, page_url, offset, job_id, index, saved):
+        """
+        Registra uma vaga processada e grava o checkpoint
+
+        Args:
+            search (str): Chave normalizada da busca e dos filtros
+            query (str): Chave da busca no planejador (várias buscas) ou None
+            page_url (str): URL da página de resultados atual
+            offset (int): Posição da página (parâmetro start)
+            job_id (str): ID da última vaga processada
+            index (int): Posição do card na página
+            saved (bool): Se a vaga foi salva
+        """
+        self.state.update({
+            "search": search,
+            "query": query,
+            "page_url": page_url,
+            "offset": offset,
+            "last_job_id": job_id,
+            "last_index": index,
+        })
+        if job_id in self.state["failed"]:
+            self.state["failed"].remove(job_id)
+        self.state["processed"] += 1
+        if saved:
+            self.state["saved"] += 1
+        self.save()
+
+    def record_failure(self, job_id):
+        """
+        Registra uma vaga que falhou; a posição não avança e a vaga é tentada de novo na retomada
+        """
+        if job_id and job_id not in self.state["failed"]:
+            self.state["failed"].append(job_id)
+            self.save()
+
+    def complete_query(self, query):
+        """
+        Marca uma das várias buscas como concluída (não é repetida ao retomar)
+        """
+        if query not in self.state["completed_queries"]:
+            self.state["completed_queries"].append(query)
+        self.save()
+
+    def save(self):
+        self.state["updated_at"] = time.time()
+        atomic_write_json(self.path, self.state)
+
+    def clear(self):
+        """
+        Remove o checkpoint (execução concluída)
+        """
+        self.state = self.empty_state()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
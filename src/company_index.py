@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice de empresas com listas de bloqueio/permissão e vereditos aprendidos
+Permite descartar vagas de empresas irrelevantes ainda na coleta dos cards
+"""
+
+import os
+import re
+import json
+import unicodedata
+
+from utils import get_data_dir, atomic_write_json
+
+# Formas jurídicas ignoradas no final do nome (apenas sufixos legais; palavras
+# comuns como "do" ou "Brasil" fazem parte do nome: "Banco do Brasil")
+COMPANY_SUFFIXES = {
+    "ltda", "sa", "me", "epp", "eireli", "inc", "llc", "ltd", "limited",
+    "corp", "corporation", "gmbh", "plc",
+}
+
+# Formas jurídicas que a pontuação separa em vários tokens ("S.A.", "S/A")
+COMPANY_SUFFIX_SEQUENCES = (("s", "a"),)
+
+def normalize_company_name(name):
+    """
+    Normaliza o nome da empresa para agrupar variações do mesmo nome
+
+    Ex.: "Acme Tecnologia Ltda.", "ACME TECNOLOGIA S/A" e "Acme Tecnologia S.A."
+    resultam todos em "acme tecnologia"; "Banco do Brasil" continua "banco do brasil"
+
+    Args:
+        name (str): Nome da empresa como aparece no card
+
+    Returns:
+        str: Nome normalizado
+    """
+    if not name:
+        return ""
+
+    name = unicodedata.normalize("NFKD", name.lower())
+    name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    tokens = re.sub(r"[^\w\s]", " ", name).split()
+
+    # Remove apenas formas jurídicas no final do nome ("Ltda Seguros" continua intacto)
+    while len(tokens) > 1:
+        if tokens[-1] in COMPANY_SUFFIXES:
+            tokens.pop()
+            continue
+        sequence = next((sequence for sequence in COMPANY_SUFFIX_SEQUENCES
+                         if len(tokens) > len(sequence) and tuple(tokens[-len(sequence):]) == sequence), None)
+        if sequence is None:
+            break
+        del tokens[-len(sequence):]
+
+    return " ".join(tokens)
+
+class CompanyIndex:
+    """
+    Índice de empresas com listas explícitas e estatísticas de rejeição
+    """
+
+    def __init__(self, blocked="", allowed="", path=None, min_rejections=5, rejection_ratio=0.9):
+        """
+        Inicializa o índice
+
+        Args:
+            blocked (str): Empresas a bloquear separadas por vírgula
+            allowed (str): Empresas sempre permitidas separadas por vírgula
+            path (str): Caminho do arquivo de estatísticas (padrão: diretório de dados)
+            min_rejections (int): Rejeições mínimas para bloquear por aprendizado
+            rejection_ratio (float): Proporção mínima de rejeições para bloquear
+        """
+        self.path = path or os.path.join(get_data_dir(), "company_index.json")
+        self.min_rejections = min_rejections
+        self.rejection_ratio = rejection_ratio
+
+        # Cache de nomes já normalizados (as mesmas empresas se repetem muito)
+        self.name_map = {}
+        self.blocked = {self.normalize(name) for name in blocked.split(',') if name.strip()}
+        self.allowed = {self.normalize(name) for name in allowed.split(',') if name.strip()}
+
+        self.stats = {}
+        self.dirty = False
+        self.load()
+
+    def normalize(self, name):
+        """
+        Normaliza um nome usando o cache de variações já vistas
+        """
+        normalized = self.name_map.get(name)
+        if normalized is None:
+            normalized = normalize_company_name(name)
+            self.name_map[name] = normalized
+        return normalized
+
+    def should_skip(self, company):
+        """
+        Verifica se as vagas da empresa devem ser descartadas
+
+        Returns:
+            str or None: Motivo do descarte ou None se a vaga deve ser avaliada
+        """
+        key = self.normalize(company)
+        if not key or key in self.allowed:
+            return None
+
+        if key in self.blocked:
+            return f"é da empresa bloqueada '{company}'"
+
+        entry = self.stats.get(key)
+        if entry and entry["saved"] == 0 and entry["rejected"] >= self.min_rejections:
+            if entry["rejected"] >= self.rejection_ratio * entry["seen"]:
+                return f"é da empresa '{company}' (rejeitada {entry['rejected']} vezes)"
+
+        return None
+
+    def record(self, company, compatible, saved=False):
+        """
+        Registra o resultado da avaliação de uma vaga da empresa
+
+        Args:
+            company (str): Nome da empresa
+            compatible (bool): Se a vaga passou nos critérios
+            saved (bool): Se a vaga foi salva
+        """
+        key = self.normalize(company)
+        if not key:
+            return
+
+        entry = self.stats.setdefault(key, {"name": company, "seen": 0, "rejected": 0, "saved": 0})
+        entry["seen"] += 1
+        if not compatible:
+            entry["rejected"] += 1
+        if saved:
+            entry["saved"] += 1
+        self.dirty = True
+
+    def load(self):
+        """
+        Carrega as estatísticas aprendidas do disco
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.stats = json.load(f).get("companies", {})
+        except (OSError, ValueError):
+            self.stats = {}
+
+    def save(self):
+        """
+        Grava as estatísticas no disco se houver alterações
+        """
+        if not self.dirty:
+            return
+
+        atomic_write_json(self.path, {"companies": self.stats})
+        self.dirty = False
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Daemon de agendamento: executa buscas salvas em horários no formato cron,
+reaproveitando um único navegador já aberto e autenticado entre execuções
+
+Uso: python src/daemon.py daemon.toml [--once]
+
+Exemplo (daemon.toml; cada job aponta para um arquivo de configuração do cli.py):
+
+    [daemon]
+    headless = true
+    max_browser_mb = 1500
+    health_interval = 60
+
+    [[jobs]]
+    name = "python-remoto"
+    schedule = "0 8-20/2 * * 1-5"
+    config = "python.toml"
+
+    [[jobs]]
+    name = "dados"
+    schedule = "@daily"
+    config = "dados.toml"
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+
+from run_config import ConfigError, read_config_file, load_run_config, automation_kwargs
+from browser_session import BrowserSession
+from utils import get_data_dir, atomic_write_json
+
+# Atalhos aceitos no lugar das cinco colunas
+CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+# Colunas do cron: (mínimo, máximo)
+CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# Valores padrão da seção [daemon]
+DAEMON_DEFAULTS = {
+    "headless": True,
+    "max_browser_mb": None,
+    "max_browser_hours": None,
+    "health_interval": 60,
+    "state_path": None,
+}
+
+def parse_cron_field(text, minimum, maximum):
+    """
+    Converte uma coluna do cron ("*", "*/15", "1-5", "8-20/2", "0,30") no conjunto de valores
+    """
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Passo inválido: {step_text}")
+
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+        else:
+            start = int(part)
+            end = maximum if step > 1 else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"Valor fora do intervalo {minimum}-{maximum}: {text}")
+        values.update(range(start, end + 1, step))
+    return values
+
+class CronSchedule:
+    """
+    Agenda no formato cron de cinco colunas: minuto hora dia mês dia-da-semana
+    """
+
+    def __init__(self, expression):
+        self.expression = expression.strip()
+        fields = CRON_ALIASES.get(self.expression, self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Agenda deve ter 5 colunas: {expression}")
+
+        try:
+            self.minutes, self.hours, self.days, self.months, weekdays = (
+                parse_cron_field(field, minimum, maximum)
+                for field, (minimum, maximum) in zip(fields, CRON_FIELDS)
+            )
+        except ValueError as e:
+            raise ValueError(f"Agenda inválida ({expression}): {e}")
+
+        # 0 e 7 são domingo
+        self.weekdays = {day % 7 for day in weekdays}
+        # Como no cron: com dia do mês e dia da semana restritos, basta um deles coincidir
+        self.day_or_weekday = fields[2] != "*" and fields[4] != "*"
+
+    def day_matches(self, moment):
+        weekday = (moment.weekday() + 1) % 7
+        if self.day_or_weekday:
+            return moment.day in self.days or weekday in self.weekdays
+        return moment.day in self.days and weekday in self.weekdays
+
+    def next_after(self, moment):
+        """
+        Próximo horário da agenda estritamente depois de moment
+        """
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                month = candidate.month % 12 + 1
+                year = candidate.year + (1 if month == 1 else 0)
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+            elif not self.day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Agenda sem próximos horários: {self.expression}")
+
+class ScheduledJob:
+    """
+    Uma busca salva: nome, agenda e configuração da execução
+    """
+
+    def __init__(self, name, schedule, config):
+        self.name = name
+        self.schedule = schedule
+        self.config = config
+
+def load_daemon_config(path):
+    """
+    Lê o arquivo do daemon e as configurações de cada job
+
+    Returns:
+        tuple: (opções da seção [daemon], lista de ScheduledJob)
+    """
+    data = read_config_file(path)
+    options = dict(DAEMON_DEFAULTS)
+    section = data.get("daemon") or {}
+    unknown = sorted(set(section) - set(DAEMON_DEFAULTS))
+    if unknown:
+        raise ConfigError(f"Chaves desconhecidas em [daemon]: {', '.join(unknown)}")
+    options.update(section)
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    for entry in data.get("jobs") or []:
+        name = entry.get("name")
+        if not name or not entry.get("schedule") or not entry.get("config"):
+            raise ConfigError("Cada job precisa de name, schedule e config")
+        if any(job.name == name for job in jobs):
+            raise ConfigError(f"Job repetido: {name}")
+        try:
+            schedule = CronSchedule(entry["schedule"])
+        except ValueError as e:
+            raise ConfigError(str(e))
+        config = load_run_config(os.path.join(base_dir, entry["config"]))
+        jobs.append(ScheduledJob(name, schedule, config))
+
+    if not jobs:
+        raise ConfigError("Nenhum job definido em [[jobs]]")
+
+    # Um único navegador compartilha cookies: todos os jobs usam a mesma conta
+    if len({job.config["email"] for job in jobs}) > 1:
+        raise ConfigError("Todos os jobs devem usar a mesma conta (account.email)")
+
+    return options, jobs
+
+class SchedulerDaemon:
+    """
+    Executa os jobs nos horários agendados com um navegador sempre aberto
+    """
+
+    def __init__(self, jobs, log_callback=print, headless=True, max_browser_mb=None,
+                 max_browser_hours=None, health_interval=60, state_path=None):
+        """
+        Args:
+            jobs (list): Lista de ScheduledJob
+            log_callback (function): Função para logging
+            headless (bool): Executar o navegador sem janela
+            max_browser_mb (int): Reiniciar o navegador acima dessa memória (processo + navegador)
+            max_browser_hours (float): Reiniciar o navegador depois desse tempo aberto
+            health_interval (int): Segundos entre verificações do navegador ocioso
+            state_path (str): Arquivo do estado por job (padrão: diretório de dados)
+        """
+        self.jobs = jobs
+        self.log = log_callback
+        self.health_interval = max(int(health_interval or 60), 1)
+        self.state_path = state_path or os.path.join(get_data_dir(), "daemon_state.json")
+        self.session = BrowserSession(log_callback, headless=headless, max_rss_mb=max_browser_mb,
+                                      max_age_hours=max_browser_hours)
+        self.state = self.load_state()
+        self.stopping = None
+        self.current = None
+        self.next_runs = {}
+
+    def load_state(self):
+        """
+        Carrega o estado persistido dos jobs (última execução, contadores)
+        """
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("jobs", {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self):
+        atomic_write_json(self.state_path, {"jobs": self.state})
+
+    def schedule_all(self, now=None):
+        """
+        Calcula o próximo horário de cada job
+        """
+        now = now or datetime.now()
+        for job in self.jobs:
+            self.next_runs[job.name] = job.schedule.next_after(now)
+            self.state.setdefault(job.name, {})["next_run"] = self.next_runs[job.name].isoformat(timespec="minutes")
+
+    def next_job(self):
+        """
+        Retorna o job com o horário mais próximo e esse horário
+        """
+        job = min(self.jobs, key=lambda item: self.next_runs[item.name])
+        return job, self.next_runs[job.name]
+
+    async def run_job(self, job):
+        """
+        Executa um job no navegador compartilhado e registra o resultado
+        """
+        from automation_fixed import LinkedInAutomation, AutomationError
+        from pacing import create_pacing
+
+        config = job.config
+        prefix = f"[{job.name}] "
+        pacing = create_pacing(config["pacing"], config["pacing_seed"], config["pacing_scale"])
+        kwargs = automation_kwargs(config)
+        # Cada job tem seu checkpoint; uma execução interrompida continua na próxima
+        if not kwargs["checkpoint_path"]:
+            safe_name = "".join(char if char.isalnum() else "_" for char in job.name)
+            kwargs["checkpoint_path"] = os.path.join(get_data_dir(), f"checkpoint_{safe_name}.json")
+        kwargs["resume"] = kwargs["checkpoint"]
+        automation = LinkedInAutomation(
+            log_callback=lambda message: self.log(prefix + message),
+            pacing=pacing,
+            browser_session=self.session,
+            **kwargs
+        )
+        self.current = automation
+
+        started = time.time()
+        saved = processed = 0
+        status = "ok"
+        error = None
+        self.log(f"{prefix}Iniciando execução")
+        try:
+            async with automation:
+                async for result in automation.iter_jobs():
+                    processed += 1
+                    if result["saved"]:
+                        saved += 1
+        except AutomationError as e:
+            status, error = "failed", str(e)
+        except Exception as e:
+            status, error = "error", str(e)
+        finally:
+            self.current = None
+
+        # Busca encerrada por erro (página caiu, próxima página não carregou) não é sucesso
+        if status == "ok" and automation.stop_reason == "error":
+            status, error = "failed", "busca encerrada por erro"
+
+        state = self.state.setdefault(job.name, {})
+        state["last_run"] = datetime.fromtimestamp(started).isoformat(timespec="seconds")
+        state["last_status"] = status
+        state["last_error"] = error
+        state["last_saved"] = saved
+        state["last_processed"] = processed
+        state["last_stop_reason"] = automation.stop_reason
+        state["last_duration"] = round(time.time() - started, 1)
+        state["runs"] = state.get("runs", 0) + 1
+        state["total_saved"] = state.get("total_saved", 0) + saved
+        if status != "ok":
+            state["failures"] = state.get("failures", 0) + 1
+        self.save_state()
+
+        self.log(f"{prefix}Execução {status}: {saved} vagas salvas, {processed} processadas "
+                 f"em {state['last_duration']}s" + (f" ({error})" if error else ""))
+
+        # Falha com o navegador caído: reinicia já, sem esperar a próxima verificação
+        if status != "ok" and not self.session.is_alive():
+            await self.restart_browser("navegador encerrado durante a execução")
+        return status
+
+    async def restart_browser(self, reason):
+        try:
+            await self.session.restart(reason)
+        except Exception as e:
+            self.log(f"Erro ao reiniciar navegador: {e}")
+
+    async def check_health(self):
+        """
+        Verifica o navegador ocioso e o reinicia se necessário
+        """
+        reason = await self.session.check_health()
+        if reason:
+            await self.restart_browser(reason)
+
+    async def serve(self, once=False):
+        """
+        Laço principal: espera o próximo horário, executa o job e verifica o navegador
+
+        Args:
+            once (bool): Executar todos os jobs uma vez, imediatamente, e sair
+        """
+        self.stopping = asyncio.Event()
+        if not await self.session.ensure_started():
+            return False
+
+        try:
+            if once:
+                results = []
+                for job in self.jobs:
+                    if self.stopping.is_set():
+                        break
+                    results.append(await self.run_job(job))
+                return all(status == "ok" for status in results)
+
+            self.schedule_all()
+            self.save_state()
+            for job in self.jobs:
+                self.log(f"[{job.name}] Próxima execução: {self.next_runs[job.name]:%Y-%m-%d %H:%M}")
+
+            while not self.stopping.is_set():
+                job, when = self.next_job()
+                delay = (when - datetime.now()).total_seconds()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self.stopping.wait(), min(delay, self.health_interval))
+                    except asyncio.TimeoutError:
+                        if delay > self.health_interval:
+                            await self.check_health()
+                    continue
+
+                await self.run_job(job)
+                self.next_runs[job.name] = job.schedule.next_after(datetime.now())
+                self.state[job.name]["next_run"] = self.next_runs[job.name].isoformat(timespec="minutes")
+                self.save_state()
+                self.log(f"[{job.name}] Próxima execução: {self.next_runs[job.name]:%Y-%m-%d %H:%M}")
+            return True
+        finally:
+            await self.session.close()
+            self.log("Daemon encerrado")
+
+    def stop(self):
+        """
+        Encerra o daemon depois da vaga em processamento
+        """
+        self.log("Parando daemon...")
+        if self.stopping is not None:
+            self.stopping.set()
+        if self.current is not None:
+            self.current.stop()
+
+def log_with_time(message):
+    print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {message}", flush=True)
+
+async def run_daemon(daemon, once=False):
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, daemon.stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+    return await daemon.serve(once)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa buscas salvas em horários agendados com o navegador sempre aberto")
+    parser.add_argument("config", help="arquivo do daemon (.toml ou .json) com [daemon] e [[jobs]]")
+    parser.add_argument("--once", action="store_true", help="executa todos os jobs uma vez e sai")
+    parser.add_argument("--state", help="arquivo de estado dos jobs (padrão: diretório de dados)")
+    args = parser.parse_args(argv)
+
+    try:
+        options, jobs = load_daemon_config(args.config)
+    except ConfigError as e:
+        log_with_time(f"Configuração inválida: {e}")
+        return 2
+
+    daemon = SchedulerDaemon(
+        jobs, log_with_time,
+        headless=options["headless"],
+        max_browser_mb=options["max_browser_mb"],
+        max_browser_hours=options["max_browser_hours"],
+        health_interval=options["health_interval"],
+        state_path=args.state or options["state_path"],
+    )
+    return 0 if asyncio.run(run_daemon(daemon, args.once)) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
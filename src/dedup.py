@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Detecção de vagas quase duplicadas (repostagens) com SimHash + LSH
+A mesma vaga publicada com IDs diferentes é descartada antes de ser aberta
+"""
+
+import os
+import re
+import json
+import hashlib
+import unicodedata
+
+from utils import get_data_dir, atomic_write_json
+
+# Tamanho da assinatura SimHash em bits
+SIMHASH_BITS = 64
+
+# Palavras de interface que mudam entre repostagens e não descrevem a vaga
+NOISE_WORDS = {
+    "ha", "dia", "dias", "semana", "semanas", "mes", "meses", "hora", "horas", "minuto", "minutos",
+    "ago", "day", "days", "week", "weeks", "month", "months", "hour", "hours", "minute", "minutes",
+    "candidatura", "candidaturas", "candidato", "candidatos", "applicant", "applicants",
+    "repostada", "reposted", "promovida", "promoted", "visualizado", "viewed", "salva", "saved",
+}
+
+def normalize_job_text(text):
+    """
+    Normaliza texto para comparação: minúsculas, sem acentos, sem pontuação
+    e sem tokens que variam entre repostagens (datas relativas, candidaturas etc.)
+
+    Args:
+        text (str): Texto original
+
+    Returns:
+        str: Texto normalizado
+    """
+    if not text:
+        return ""
+
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = re.sub(r"[^\w\s]", " ", text)
+    tokens = [
+        token for token in text.split()
+        if token not in NOISE_WORDS and not any(ch.isdigit() for ch in token)
+    ]
+    return " ".join(tokens)
+
+def simhash(text, bits=SIMHASH_BITS):
+    """
+    Calcula a assinatura SimHash de um texto usando shingles de 3 palavras
+
+    Args:
+        text (str): Texto normalizado
+        bits (int): Tamanho da assinatura
+
+    Returns:
+        int: Assinatura SimHash
+    """
+    tokens = text.split()
+    if len(tokens) >= 3:
+        features = [" ".join(tokens[i:i + 3]) for i in range(len(tokens) - 2)]
+    else:
+        features = tokens
+
+    weights = [0] * bits
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=bits // 8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(bits):
+            if value >> bit & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+
+    fingerprint = 0
+    for bit in range(bits):
+        if weights[bit] > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def job_fingerprint(title, company, description):
+    """
+    Calcula a assinatura de uma vaga a partir de título, empresa e descrição
+    """
+    return simhash(normalize_job_text(f"{title} {company} {description}"))
+
+def hamming_distance(a, b):
+    """
+    Número de bits diferentes entre duas assinaturas
+    """
+    return bin(a ^ b).count("1")
+
+class SimHashIndex:
+    """
+    Índice LSH de assinaturas SimHash persistido entre execuções
+
+    A assinatura é dividida em bandas; duas assinaturas com distância de
+    Hamming até max_distance compartilham ao menos uma banda idêntica
+    (princípio da casa dos pombos), então a busca só compara os candidatos
+    dos mesmos baldes em vez de todas as vagas já vistas
+    """
+
+    def __init__(self, path=None, max_distance=3, max_entries=50000):
+        """
+        Inicializa o índice carregando as assinaturas salvas, se existirem
+
+        Args:
+            path (str): Caminho do arquivo JSON (padrão: diretório de dados)
+            max_distance (int): Distância de Hamming máxima para considerar duplicata
+            max_entries (int): Quantidade máxima de assinaturas mantidas
+        """
+        self.path = path or os.path.join(get_data_dir(), "job_fingerprints.json")
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self.bands = max_distance + 1
+        self.band_bits = SIMHASH_BITS // self.bands
+        self.fingerprints = {}
+        self.buckets = [{} for _ in range(self.bands)]
+        self.dirty = False
+        self.load()
+
+    def _band_keys(self, fingerprint):
+        mask = (1 << self.band_bits) - 1
+        return [(fingerprint >> (band * self.band_bits)) & mask for band in range(self.bands)]
+
+    def _index(self, job_id, fingerprint):
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            self.buckets[band].setdefault(key, set()).add(job_id)
+
+    def _unindex(self, job_id, fingerprint):
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            bucket = self.buckets[band].get(key)
+            if bucket:
+                bucket.discard(job_id)
+                if not bucket:
+                    del self.buckets[band][key]
+
+    def find(self, fingerprint, exclude_id=None):
+        """
+        Procura uma vaga quase idêntica à assinatura informada
+
+        Args:
+            fingerprint (int): Assinatura SimHash
+            exclude_id (str): ID a ignorar (a própria vaga)
+
+        Returns:
+            str or None: ID da vaga duplicada encontrada
+        """
+        checked = set()
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            for job_id in self.buckets[band].get(key, ()):
+                if job_id == exclude_id or job_id in checked:
+                    continue
+                checked.add(job_id)
+                if hamming_distance(fingerprint, self.fingerprints[job_id]) <= self.max_distance:
+                    return job_id
+        return None
+
+    def add(self, job_id, fingerprint):
+        """
+        Registra a assinatura de uma vaga no índice
+        """
+        if not job_id:
+            return
+
+        previous = self.fingerprints.pop(job_id, None)
+        if previous is not None:
+            self._unindex(job_id, previous)
+
+        self.fingerprints[job_id] = fingerprint
+        self._index(job_id, fingerprint)
+        self.dirty = True
+
+        # Remove as assinaturas mais antigas quando o limite é atingido
+        while len(self.fingerprints) > self.max_entries:
+            oldest_id = next(iter(self.fingerprints))
+            self._unindex(oldest_id, self.fingerprints.pop(oldest_id))
+
+    def load(self):
+        """
+        Carrega as assinaturas do disco e reconstrói os baldes
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f).get("fingerprints", {})
+        except (OSError, ValueError):
+            stored = {}
+
+        for job_id, value in stored.items():
+            fingerprint = int(value, 16)
+            self.fingerprints[job_id] = fingerprint
+            self._index(job_id, fingerprint)
+
+    def save(self):
+        """
+        Grava as assinaturas no disco se houver alterações
+        """
+        if not self.dirty:
+            return
+
+        data = {job_id: format(value, "x") for job_id, value in self.fingerprints.items()}
+        atomic_write_json(self.path, {"fingerprints": data})
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.fingerprints)
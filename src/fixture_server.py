@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor local que simula as páginas de vagas do LinkedIn para testes offline
+Gera vagas determinísticas a partir de uma semente, com a marcação esperada
+pelos seletores da automação, latência injetada e renderização sob demanda
+
+Uso: python src/fixture_server.py --port 8765 --seed 1
+     (e então LinkedInAutomation(..., base_url="http://127.0.0.1:8765"))
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from html import escape
+from urllib.parse import urlparse, parse_qs, urlencode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TITLES = [
+    "Desenvolvedor Python", "Engenheiro de Dados", "Analista de Sistemas",
+    "Desenvolvedor Front-end", "Cientista de Dados", "Engenheiro de Software",
+    "Desenvolvedor Full Stack", "Analista de QA", "Engenheiro DevOps",
+    "Desenvolvedor Back-end",
+]
+LEVELS = ["Estágio", "Júnior", "Pleno", "Sênior"]
+SKILLS = [
+    "python", "django", "flask", "sql", "react", "aws", "docker", "java",
+    "javascript", "kubernetes", "pandas", "typescript", "node", "git",
+]
+COMPANIES = [
+    "Acme Tecnologia", "Banco Horizonte", "Nuvem Sistemas Ltda", "Loja Virtual S.A.",
+    "Dados & Cia", "Fintech Aurora", "Saúde Digital", "Logística Rápida",
+    "Consultoria Alfa", "Startup Beta",
+]
+LOCATIONS = [
+    "São Paulo, SP", "Rio de Janeiro, RJ", "Belo Horizonte, MG", "Curitiba, PR",
+    "Porto Alegre, RS", "Recife, PE", "Brasil",
+]
+WORK_MODES = ["Remoto", "Híbrido", "Presencial"]
+
+FILTER_LABELS = [
+    "Remoto", "Híbrido", "Presencial", "Estágio", "Júnior", "Pleno", "Sênior",
+    "CLT", "PJ", "Temporário", "Freelancer", "Trainee",
+]
+
+# Identificadores das vagas simuladas (mesma ordem de grandeza dos reais)
+JOB_ID_BASE = 3900000000
+
+# Itens por página na lista de vagas salvas (igual ao LinkedIn)
+SAVED_PAGE_SIZE = 10
+
+STYLE = """
+body { font-family: sans-serif; margin: 0; display: flex; flex-wrap: wrap; }
+header { width: 100%; padding: 8px; background: #0a66c2; color: white; }
+main { width: 55%; padding: 8px; }
+.jobs-details { width: 40%; padding: 8px; position: sticky; top: 0; }
+.job-card-container, .job-card { border: 1px solid #ddd; margin: 6px 0; padding: 8px; min-height: 90px; cursor: pointer; }
+.filters-modal { display: none; border: 1px solid #999; padding: 8px; }
+.filters-modal.open { display: block; }
+"""
+
+PAGE_SCRIPT = """
+const details = document.getElementById('details');
+const jobs = window.__JOBS__ || {};
+
+function cardHtml(job) {
+    return `<a class="job-card-list__title" href="/jobs/view/${job.id}/">${job.title}</a>
+        <div class="job-card-container__company-name">${job.company}</div>
+        <ul><li class="job-card-container__metadata-item">${job.location} (${job.mode})</li></ul>
+        <div class="job-card-container__job-insight">${job.level} · ${job.skills.join(', ')}</div>
+        <time>${job.posted}</time>`;
+}
+
+// Cards renderizados apenas quando entram na área visível
+const observer = new IntersectionObserver((entries) => {
+    entries.forEach((entry) => {
+        const el = entry.target;
+        if (entry.isIntersecting && el.dataset.lazy) {
+            delete el.dataset.lazy;
+            el.innerHTML = cardHtml(jobs[el.dataset.jobId]);
+            observer.unobserve(el);
+        }
+    });
+});
+document.querySelectorAll('[data-lazy]').forEach((el) => observer.observe(el));
+
+function saveButtonHtml(job) {
+    const label = job.saved ? 'Salva' : 'Salvar';
+    return `<button class="jobs-save-button" data-save-id="${job.id}" aria-label="Salvar vaga ${job.title}"
+        aria-pressed="${job.saved}"><span>${label}</span></button>`;
+}
+
+async function openJob(id) {
+    details.innerHTML = '';
+    const response = await fetch(`/api/jobs/${id}`);
+    const job = await response.json();
+    details.innerHTML = `<h2 class="jobs-unified-top-card__job-title">${job.title}</h2>
+        <div>${job.company} · ${job.location} · ${job.mode}</div>
+        ${saveButtonHtml(job)}
+        <div class="jobs-description">${job.description}</div>`;
+    const url = new URL(location.href);
+    url.searchParams.set('currentJobId', id);
+    history.replaceState(null, '', url);
+}
+
+document.addEventListener('click', async (event) => {
+    const save = event.target.closest('[data-save-id]');
+    if (save) {
+        const response = await fetch(`/api/save/${save.dataset.saveId}`, {method: 'POST'});
+        if (response.ok) {
+            save.setAttribute('aria-pressed', 'true');
+            save.querySelector('span').textContent = 'Salva';
+        }
+        return;
+    }
+    const next = event.target.closest('[data-next]');
+    if (next) {
+        location.href = next.dataset.next;
+        return;
+    }
+    const toggle = event.target.closest('[data-toggle-filters]');
+    if (toggle) {
+        document.getElementById('filters').classList.toggle('open');
+        return;
+    }
+    const card = event.target.closest('[data-job-id]');
+    if (card && details) {
+        event.preventDefault();
+        openJob(card.dataset.jobId);
+    }
+});
+"""
+
+class FixtureJobs:
+    """
+    Gerador determinístico de vagas simuladas a partir de uma semente
+    """
+
+    def __init__(self, seed=0, total_jobs=1000, repost_ratio=0.05, saved_ratio=0.0):
+        """
+        Args:
+            seed (int): Semente das vagas geradas
+            total_jobs (int): Quantidade de vagas nos resultados de busca
+            repost_ratio (float): Fração de vagas que repetem uma vaga anterior
+            saved_ratio (float): Fração de vagas que já começam salvas
+        """
+        self.seed = seed
+        self.total_jobs = total_jobs
+        self.repost_ratio = repost_ratio
+        self.cache = {}
+        self.lock = threading.Lock()
+        self.saved = {
+            self.job_id(index) for index in range(total_jobs)
+            if random.Random(f"{seed}:saved:{index}").random() < saved_ratio
+        }
+
+    def job_id(self, index):
+        return str(JOB_ID_BASE + index)
+
+    def get(self, index):
+        """
+        Retorna a vaga da posição informada (sempre a mesma para a mesma semente)
+        """
+        with self.lock:
+            job = self.cache.get(index)
+        if job is not None:
+            return dict(job, saved=job["id"] in self.saved)
+
+        rng = random.Random(f"{self.seed}:{index}")
+        source = rng
+        if rng.random() < self.repost_ratio and index > 0:
+            # Repostagem: mesmo conteúdo de uma vaga anterior com outro ID
+            source = random.Random(f"{self.seed}:{rng.randrange(index)}")
+            source.random()
+
+        title = source.choice(TITLES)
+        level = source.choice(LEVELS)
+        skills = source.sample(SKILLS, 4)
+        company = source.choice(COMPANIES)
+        location = source.choice(LOCATIONS)
+        mode = source.choice(WORK_MODES)
+        days = rng.randint(0, 45)
+
+        job = {
+            "id": self.job_id(index),
+            "title": f"{title} {level}",
+            "level": level,
+            "skills": skills,
+            "company": company,
+            "location": location,
+            "mode": mode,
+            "posted": "hoje" if days == 0 else f"há {days} dia" + ("s" if days > 1 else ""),
+            "description": (
+                f"Procuramos {title.lower()} nível {level.lower()} para atuar em regime {mode.lower()}. "
+                f"Requisitos: {', '.join(skills)}. Local: {location}."
+            ),
+        }
+        with self.lock:
+            self.cache[index] = job
+        return dict(job, saved=job["id"] in self.saved)
+
+    def by_id(self, job_id):
+        try:
+            index = int(job_id) - JOB_ID_BASE
+        except ValueError:
+            return None
+        if 0 <= index < self.total_jobs:
+            return self.get(index)
+        return None
+
+    def save(self, job_id):
+        if self.by_id(job_id) is None:
+            return False
+        with self.lock:
+            self.saved.add(str(job_id))
+        return True
+
+    def saved_ids(self):
+        with self.lock:
+            return sorted(self.saved)
+
+class FixtureServer:
+    """
+    Servidor HTTP local com as páginas simuladas (login, feed, busca, vagas salvas)
+    """
+
+    def __init__(self, seed=0, total_jobs=1000, page_size=25, recommended=20,
+                 latency_ms=0, jitter_ms=0, lazy_after=None, saved_ratio=0.0,
+                 repost_ratio=0.05, host="127.0.0.1", port=0):
+        """
+        Args:
+            seed (int): Semente das vagas e da latência
+            total_jobs (int): Quantidade de vagas nos resultados de busca
+            page_size (int): Cards por página de resultados
+            recommended (int): Cards na seção de recomendadas do feed
+            latency_ms (int): Latência fixa adicionada a cada resposta
+            jitter_ms (int): Variação aleatória (semeada) somada à latência
+            lazy_after (int): Cards a partir dessa posição só são preenchidos ao rolar (None desativa)
+            saved_ratio (float): Fração de vagas que já começam salvas
+            repost_ratio (float): Fração de vagas que repetem uma vaga anterior
+            host (str): Endereço de escuta
+            port (int): Porta (0 escolhe uma porta livre)
+        """
+        self.jobs = FixtureJobs(seed, total_jobs, repost_ratio, saved_ratio)
+        self.page_size = page_size
+        self.recommended = recommended
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.lazy_after = lazy_after
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.requests = 0
+
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fixture.handle(self, "GET")
+
+            def do_POST(self):
+                fixture.handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, name="fixture-server", daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def delay(self):
+        """
+        Aplica a latência configurada à resposta atual
+        """
+        if not self.latency_ms and not self.jitter_ms:
+            return
+        with self.rng_lock:
+            jitter = self.rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        time.sleep((self.latency_ms + jitter) / 1000)
+
+    def handle(self, request, method):
+        """
+        Roteia a requisição para a página correspondente
+        """
+        self.requests += 1
+        self.delay()
+
+        url = urlparse(request.path)
+        path = url.path.rstrip("/") or "/"
+        query = parse_qs(url.query)
+
+        if path == "/login" and method == "POST":
+            return self.redirect(request, "/feed/")
+        if path.startswith("/api/save/") and method == "POST":
+            ok = self.jobs.save(path.rsplit("/", 1)[1])
+            return self.send(request, json.dumps({"saved": ok}), "application/json", 200 if ok else 404)
+        if path.startswith("/api/jobs/"):
+            job = self.jobs.by_id(path.rsplit("/", 1)[1])
+            if job is None:
+                return self.send(request, "{}", "application/json", 404)
+            return self.send(request, json.dumps(job, ensure_ascii=False), "application/json")
+
+        routes = {
+            "/": self.login_page,
+            "/login": self.login_page,
+            "/feed": self.feed_page,
+            "/jobs": self.jobs_home_page,
+            "/jobs/search": self.search_page,
+            "/my-items/saved-jobs": self.saved_jobs_page,
+        }
+        if path in routes:
+            return self.send(request, routes[path](query))
+        if path.startswith("/jobs/view/"):
+            job = self.jobs.by_id(path.split("/")[3])
+            if job is not None:
+                return self.send(request, self.job_page(job))
+
+        self.send(request, self.layout("Página não encontrada", "<main><h1>404</h1></main>"), status=404)
+
+    def send(self, request, body, content_type="text/html; charset=utf-8", status=200):
+        data = body.encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(data)))
+        request.send_header("Cache-Control", "no-store")
+        request.end_headers()
+        request.wfile.write(data)
+
+    def redirect(self, request, location):
+        # Consome o corpo do formulário antes de responder
+        length = int(request.headers.get("Content-Length") or 0)
+        if length:
+            request.rfile.read(length)
+        request.send_response(303)
+        request.send_header("Location", location)
+        request.send_header("Content-Length", "0")
+        request.end_headers()
+
+    def layout(self, title, body, jobs=None):
+        data = json.dumps({job["id"]: job for job in jobs or []}, ensure_ascii=False).replace("</", "<\\/")
+        return (
+            "<!DOCTYPE html><html lang='pt-BR'><head><meta charset='utf-8'>"
+            f"<title>{escape(title)} | LinkedIn</title><style>{STYLE}</style></head><body>"
+            "<header>LinkedIn (simulado)</header>"
+            f"{body}<script>window.__JOBS__ = {data};</script><script>{PAGE_SCRIPT}</script>"
+            "</body></html>"
+        )
+
+    def card(self, job, position, css_class="job-card-container"):
+        if self.lazy_after is not None and position >= self.lazy_after:
+            return f"<li><div class='{css_class}' data-job-id='{job['id']}' data-lazy='1'></div></li>"
+        return (
+            f"<li><div class='{css_class}' data-job-id='{job['id']}'>"
+            f"<a class='job-card-list__title' href='/jobs/view/{job['id']}/'>{escape(job['title'])}</a>"
+            f"<div class='job-card-container__company-name'>{escape(job['company'])}</div>"
+            f"<ul><li class='job-card-container__metadata-item'>{escape(job['location'])} ({job['mode']})</li></ul>"
+            f"<div class='job-card-container__job-insight'>{job['level']} · {', '.join(job['skills'])}</div>"
+            f"<time>{job['posted']}</time></div></li>"
+        )
+
+    def login_page(self, query):
+        return self.layout("Entrar", """
+            <main><h1>Entrar</h1>
+            <form method="post" action="/login">
+                <input id="username" name="session_key" type="text" placeholder="E-mail">
+                <input id="password" name="session_password" type="password" placeholder="Senha">
+                <button type="submit">Entrar</button>
+            </form></main>
+        """)
+
+    def feed_page(self, query):
+        jobs = [self.jobs.get(index) for index in range(min(self.recommended, self.jobs.total_jobs))]
+        cards = "".join(self.card(job, position, "job-card") for position, job in enumerate(jobs))
+        body = (
+            "<main><div class='feed-jobs-module'><h2>Vagas que mais combinam com seu perfil</h2>"
+            f"<ul>{cards}</ul></div></main><section class='jobs-details' id='details'></section>"
+        )
+        return self.layout("Feed", body, jobs)
+
+    def jobs_home_page(self, query):
+        return self.layout("Vagas", """
+            <main><form method="get" action="/jobs/search/">
+                <input class="jobs-search-box__text-input" name="keywords" placeholder="Pesquisar cargo, competência ou empresa">
+                <input class="jobs-search-box__text-input" name="location" placeholder="Localização">
+                <button type="submit">Pesquisar</button>
+            </form></main>
+        """)
+
+    def search_page(self, query):
+        try:
+            start = max(int(query.get("start", ["0"])[0]), 0)
+        except ValueError:
+            start = 0
+
+        end = min(start + self.page_size, self.jobs.total_jobs)
+        jobs = [self.jobs.get(index) for index in range(start, end)]
+        cards = "".join(self.card(job, position) for position, job in enumerate(jobs))
+
+        next_button = ""
+        if end < self.jobs.total_jobs:
+            params = {key: values[0] for key, values in query.items() if key != "currentJobId"}
+            params["start"] = end
+            next_button = f"<button aria-label='Próxima' data-next='/jobs/search/?{escape(urlencode(params))}'>Próxima</button>"
+
+        checkboxes = "".join(
+            f"<div><input type='checkbox' id='filter-{index}'><label for='filter-{index}'>{label}</label></div>"
+            for index, label in enumerate(FILTER_LABELS)
+        )
+        body = (
+            "<main><button data-toggle-filters='1'>Todos os filtros</button>"
+            f"<div class='filters-modal' id='filters'>{checkboxes}"
+            "<button data-toggle-filters='1'>Mostrar resultados</button></div>"
+            f"<div class='jobs-search-results-list'><ul>{cards}</ul></div>{next_button}</main>"
+            "<section class='jobs-details' id='details'></section>"
+        )
+        return self.layout("Busca de vagas", body, jobs)
+
+    def saved_jobs_page(self, query):
+        try:
+            start = max(int(query.get("start", ["0"])[0]), 0)
+        except ValueError:
+            start = 0
+
+        ids = self.jobs.saved_ids()[start:start + SAVED_PAGE_SIZE]
+        items = "".join(f"<li><a href='/jobs/view/{job_id}/'>Vaga {job_id}</a></li>" for job_id in ids)
+        return self.layout("Minhas vagas", f"<main><h1>Vagas salvas</h1><ul>{items}</ul></main>")
+
+    def job_page(self, job):
+        label = "Salva" if job["saved"] else "Salvar"
+        body = (
+            f"<main><h1>{escape(job['title'])}</h1><div>{escape(job['company'])} · {escape(job['location'])}</div>"
+            f"<button class='jobs-save-button' data-save-id='{job['id']}' aria-label='Salvar vaga {escape(job['title'])}' "
+            f"aria-pressed='{str(job['saved']).lower()}'><span>{label}</span></button>"
+            f"<div class='jobs-description'>{escape(job['description'])}</div></main>"
+        )
+        return self.layout(job["title"], body)
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de páginas de vagas simuladas")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=1000, help="vagas nos resultados de busca")
+    parser.add_argument("--page-size", type=int, default=25)
+    parser.add_argument("--recommended", type=int, default=20)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--jitter-ms", type=int, default=0)
+    parser.add_argument("--lazy-after", type=int, default=None,
+                        help="cards a partir dessa posição só são preenchidos ao rolar")
+    parser.add_argument("--saved-ratio", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FixtureServer(
+        seed=args.seed, total_jobs=args.jobs, page_size=args.page_size,
+        recommended=args.recommended, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        lazy_after=args.lazy_after, saved_ratio=args.saved_ratio, host=args.host, port=args.port
+    )
+    print(f"Servidor de vagas simuladas em {server.base_url} (Ctrl+C para parar)")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from tkinter import ttk, scrolledtext, messagebox
 from threading import Thread
 import time
 from automation_fixed import LinkedInAutomation
+from profiles import ProfileError, build_profile_list, split_terms
 
 class LinkedInGUI:
     """
@@ -10,10 +11,14 @@ class LinkedInGUI:
     Versão atualizada com filtragem inteligente de vagas
     """
     
-    def __init__(self):
+    def __init__(self, profile=False):
         """
         Inicializa a interface gráfica
+        
+        Args:
+            profile (bool): Deixa o modo de profiling marcado ao abrir
         """
+        self.profile_default = profile
         self.root = tk.Tk()
         self.automation = None
         self.is_running = False
@@ -156,6 +161,24 @@ class LinkedInGUI:
         avoid_entry = ttk.Entry(profile_frame, textvariable=self.avoid_terms_var, width=47)
         avoid_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2)
         
+        # Empresas bloqueadas (agências de recrutamento, empresas já rejeitadas)
+        ttk.Label(profile_frame, text="Bloquear empresas:").grid(row=2, column=0, sticky=tk.W, padx=(0, 10))
+        self.blocked_companies_var = tk.StringVar()
+        blocked_entry = ttk.Entry(profile_frame, textvariable=self.blocked_companies_var, width=47)
+        blocked_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=2)
+        
+        # Empresas sempre avaliadas
+        ttk.Label(profile_frame, text="Sempre avaliar:").grid(row=3, column=0, sticky=tk.W, padx=(0, 10))
+        self.allowed_companies_var = tk.StringVar()
+        allowed_entry = ttk.Entry(profile_frame, textvariable=self.allowed_companies_var, width=47)
+        allowed_entry.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=2)
+        
+        # Perfis extras avaliados na mesma passada (ex.: "backend: python, django | senior")
+        ttk.Label(profile_frame, text="Perfis extras:").grid(row=4, column=0, sticky=tk.W, padx=(0, 10))
+        self.profiles_var = tk.StringVar()
+        profiles_entry = ttk.Entry(profile_frame, textvariable=self.profiles_var, width=47)
+        profiles_entry.grid(row=4, column=1, sticky=(tk.W, tk.E), pady=2)
+        
         # Priorizar recomendações do LinkedIn
         self.use_recommendations_var = tk.BooleanVar(value=True)
         recommendations_check = ttk.Checkbutton(
@@ -163,13 +186,22 @@ class LinkedInGUI:
             text="🎯 Priorizar vagas recomendadas pelo LinkedIn (mais inteligente)", 
             variable=self.use_recommendations_var
         )
-        recommendations_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
+        recommendations_check.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
+        # Carregar vagas já salvas no início da execução
+        self.prefetch_saved_var = tk.BooleanVar(value=True)
+        prefetch_check = ttk.Checkbutton(
+            profile_frame,
+            text="📌 Ignorar vagas que já estão em 'Minhas vagas / Salvas'",
+            variable=self.prefetch_saved_var
+        )
+        prefetch_check.grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=2)
         
         # Dica explicativa
         tip_label = ttk.Label(profile_frame, 
                              text="💡 Dica: O LinkedIn analisa seu perfil e mostra vagas compatíveis automaticamente",
                              font=('Arial', 8), foreground='gray')
-        tip_label.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=2)
+        tip_label.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=2)
     
     def create_filters_section(self, parent, start_row):
         """
@@ -266,14 +298,20 @@ class LinkedInGUI:
                                        variable=self.stealth_var)
         stealth_check.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=2)
         
+        # Profiling da execução
+        self.profile_var = tk.BooleanVar(value=self.profile_default)
+        profile_check = ttk.Checkbutton(advanced_frame, text="Modo profiling (gera relatório de desempenho)", 
+                                       variable=self.profile_var)
+        profile_check.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=2)
+        
         # Estratégia de automação
         strategy_label = ttk.Label(advanced_frame, text="Estratégia:", font=('Arial', 10, 'bold'))
-        strategy_label.grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
+        strategy_label.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
         
         strategy_info = ttk.Label(advanced_frame, 
                                  text="1º: Tenta vagas recomendadas\n2º: Se falhar, usa busca tradicional",
                                  font=('Arial', 8), foreground='blue')
-        strategy_info.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=2)
+        strategy_info.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=2)
     
     def create_control_section(self, parent, start_row):
         """
@@ -464,6 +502,13 @@ class LinkedInGUI:
             messagebox.showerror("Erro", "Por favor, insira palavras-chave para busca ou ative as recomendações.")
             return False
         
+        try:
+            build_profile_list(split_terms(self.user_skills_var.get()), [], self.keywords_var.get(),
+                               self.profiles_var.get())
+        except ProfileError as e:
+            messagebox.showerror("Erro", f"Perfis extras inválidos:\n{e}")
+            return False
+        
         return True
     
     def test_browser(self):
@@ -555,7 +600,13 @@ class LinkedInGUI:
                 # Novos parâmetros para filtragem inteligente
                 user_skills=self.user_skills_var.get(),
                 avoid_terms=self.avoid_terms_var.get(),
-                use_recommendations=self.use_recommendations_var.get()
+                use_recommendations=self.use_recommendations_var.get(),
+                prefetch_saved=self.prefetch_saved_var.get(),
+                blocked_companies=self.blocked_companies_var.get(),
+                allowed_companies=self.allowed_companies_var.get(),
+                profiles=self.profiles_var.get(),
+                profile_run=self.profile_var.get(),
+                headless=self.headless_var.get()
             )
             
             # Executa a automação
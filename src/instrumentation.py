@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Contagem de chamadas ao Playwright (idas e voltas ao navegador) por método
+e ponto de chamada, com histogramas de latência no estilo HDR
+"""
+
+import os
+import sys
+import time
+import inspect
+
+# Precisão do histograma: 2^5 sub-baldes por potência de 2 (erro relativo ~3%)
+SUB_BUCKET_BITS = 5
+
+# Métodos que retornam novos Locators (o resultado também é instrumentado)
+LOCATOR_FACTORIES = {
+    "locator", "nth", "filter", "frame_locator", "get_by_text", "get_by_role",
+    "get_by_label", "get_by_placeholder", "get_by_test_id", "get_by_title",
+}
+
+# Propriedades que retornam objetos com métodos assíncronos
+WRAPPED_PROPERTIES = {"first", "last", "keyboard", "mouse"}
+
+class LatencyHistogram:
+    """
+    Histograma log-linear de latências em microssegundos (estilo HDR):
+    memória constante e percentis com erro relativo limitado
+    """
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0
+
+    def record(self, seconds):
+        """
+        Registra uma latência em segundos
+        """
+        value = int(seconds * 1_000_000)
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        key = (value >> shift) << shift
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        """
+        Retorna o percentil informado em segundos
+        """
+        if not self.count:
+            return 0.0
+
+        target = self.count * percent / 100.0
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= target:
+                return min(key, self.max) / 1_000_000
+        return self.max / 1_000_000
+
+class CallStats:
+    """
+    Registro de chamadas agrupadas por (método, ponto de chamada)
+    """
+
+    def __init__(self):
+        self.histograms = {}
+
+    def record(self, method, site, seconds):
+        """
+        Registra a duração de uma chamada
+        """
+        histogram = self.histograms.get((method, site))
+        if histogram is None:
+            histogram = self.histograms[(method, site)] = LatencyHistogram()
+        histogram.record(seconds)
+
+    @property
+    def total_calls(self):
+        return sum(histogram.count for histogram in self.histograms.values())
+
+    @property
+    def total_time(self):
+        return sum(histogram.total for histogram in self.histograms.values())
+
+    def report(self, limit=20):
+        """
+        Gera o relatório por ponto de chamada, ordenado pelo tempo total
+
+        Returns:
+            list: Linhas de texto do relatório
+        """
+        lines = [f"Chamadas ao Playwright: {self.total_calls} em {self.total_time:.1f}s"]
+        ranked = sorted(self.histograms.items(), key=lambda item: item[1].total, reverse=True)
+
+        for (method, site), histogram in ranked[:limit]:
+            lines.append(
+                f"  {method} @ {site}: {histogram.count}x, total {histogram.total:.2f}s, "
+                f"p50 {histogram.percentile(50) * 1000:.0f}ms, "
+                f"p95 {histogram.percentile(95) * 1000:.0f}ms, "
+                f"p99 {histogram.percentile(99) * 1000:.0f}ms"
+            )
+        return lines
+
+def _call_site(depth=2):
+    frame = sys._getframe(depth)
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{frame.f_lineno} ({code.co_name})"
+
+class InstrumentedProxy:
+    """
+    Envolve um Page/Locator do Playwright e mede cada chamada assíncrona
+
+    Locators derivados (locator(), nth(), first...) também são envolvidos,
+    então todas as chamadas feitas a partir da página são contabilizadas
+    """
+
+    __slots__ = ("_target", "_stats")
+
+    def __init__(self, target, stats):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_stats", stats)
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        stats = self._stats
+
+        if name in WRAPPED_PROPERTIES:
+            return InstrumentedProxy(attr, stats)
+
+        if name in LOCATOR_FACTORIES and callable(attr):
+            def factory(*args, **kwargs):
+                return InstrumentedProxy(attr(*args, **kwargs), stats)
+            return factory
+
+        if inspect.iscoroutinefunction(attr):
+            def call(*args, **kwargs):
+                # O ponto de chamada é capturado antes do await, no código que chamou
+                return _timed(stats, name, _call_site(), attr(*args, **kwargs))
+            return call
+
+        return attr
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    def __repr__(self):
+        return f"InstrumentedProxy({self._target!r})"
+
+async def _timed(stats, method, site, coroutine):
+    start = time.perf_counter()
+    try:
+        return await coroutine
+    finally:
+        stats.record(method, site, time.perf_counter() - start)
+
+def instrument(target, stats):
+    """
+    Envolve o objeto com o proxy de contagem, ou o retorna intacto se stats for None
+    """
+    if stats is None or target is None or isinstance(target, InstrumentedProxy):
+        return target
+    return InstrumentedProxy(target, stats)
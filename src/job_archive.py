@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arquivo local (somente acréscimo) dos cards de vaga coletados nas execuções
+Registros com prefixo de tamanho e compressão zstd (ou gzip, se o zstandard
+não estiver instalado), mais um índice ordenado mapeado em memória por ID
+"""
+
+import os
+import gzip
+import json
+import mmap
+import time
+import struct
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import get_data_dir
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Cabeçalho do arquivo de dados: assinatura + codec (b"z" zstd, b"g" gzip)
+DATA_MAGIC = b"LJA1"
+DATA_HEADER_SIZE = len(DATA_MAGIC) + 1
+
+# Cabeçalho do índice: assinatura + tamanho do arquivo de dados já indexado
+INDEX_MAGIC = b"LJI1"
+INDEX_HEADER = struct.Struct(">4sQ")
+
+RECORD_LENGTH = struct.Struct(">I")
+INDEX_ENTRY = struct.Struct(">QQ")
+
+# Campos do card guardados no arquivo
+ARCHIVED_FIELDS = ("job_id", "title", "company", "location", "posted", "text")
+
+def job_key(job_id):
+    """
+    Converte o ID da vaga na chave numérica de 64 bits usada no índice
+    """
+    job_id = str(job_id)
+    if job_id.isdigit() and int(job_id) < 2 ** 64:
+        return int(job_id)
+    return int.from_bytes(hashlib.blake2b(job_id.encode("utf-8"), digest_size=8).digest(), "big")
+
+def codec_functions(code):
+    """
+    Funções (compress, decompress) do codec gravado no cabeçalho (b"z" zstd, b"g" gzip)
+    """
+    if code == b"z":
+        if zstandard is None:
+            raise RuntimeError("Arquivo comprimido com zstd: instale o pacote zstandard")
+        return zstandard.ZstdCompressor(level=3).compress, zstandard.ZstdDecompressor().decompress
+    return (lambda data: gzip.compress(data, mtime=0)), gzip.decompress
+
+class JobArchive:
+    """
+    Arquivo de registros de vagas com busca por ID e leitura sequencial
+    """
+
+    def __init__(self, path=None, codec=None):
+        """
+        Args:
+            path (str): Caminho do arquivo de dados (padrão: diretório de dados)
+            codec (str): "zstd" ou "gzip" para arquivos novos (padrão: zstd se disponível)
+        """
+        self.path = path or os.path.join(get_data_dir(), "jobs.archive")
+        self.index_path = f"{self.path}.idx"
+        self.lock = threading.RLock()
+        self.executor = None
+        self.pending = {}
+        self.index_map = None
+        self.index_count = 0
+
+        self.codec = self._open_data(codec)
+        self.compress, self.decompress = codec_functions(self.codec)
+
+        self.reader = open(self.path, "rb")
+        self._load_index()
+
+    def _open_data(self, codec):
+        """
+        Abre (ou cria) o arquivo de dados e retorna o codec gravado no cabeçalho
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= DATA_HEADER_SIZE:
+            with open(self.path, "rb") as f:
+                header = f.read(DATA_HEADER_SIZE)
+            if header[:len(DATA_MAGIC)] != DATA_MAGIC:
+                raise ValueError(f"Arquivo de vagas inválido: {self.path}")
+            self.writer = open(self.path, "ab")
+            return header[len(DATA_MAGIC):]
+
+        if codec is None:
+            codec = "zstd" if zstandard is not None else "gzip"
+        code = b"z" if codec == "zstd" else b"g"
+        self.writer = open(self.path, "wb")
+        self.writer.write(DATA_MAGIC + code)
+        self.writer.flush()
+        return code
+
+    def _load_index(self):
+        """
+        Mapeia o índice em memória e indexa os registros gravados depois dele
+        """
+        indexed_size = DATA_HEADER_SIZE
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, size = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+                if magic == INDEX_MAGIC and size <= os.path.getsize(self.path):
+                    self.index_count = (os.path.getsize(self.index_path) - INDEX_HEADER.size) // INDEX_ENTRY.size
+                    if self.index_count:
+                        self.index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    indexed_size = size
+        except (OSError, struct.error):
+            self.index_map = None
+            self.index_count = 0
+
+        # Registros sem índice (execução interrompida) voltam para a lista pendente
+        valid_end = indexed_size
+        for offset, length in self._iter_offsets(indexed_size):
+            self.pending[job_key(self._read_at(offset, length).get("job_id", ""))] = offset
+            valid_end = offset + RECORD_LENGTH.size + length
+
+        # Descarta um registro incompleto no final do arquivo
+        if valid_end < os.path.getsize(self.path):
+            self.writer.truncate(valid_end)
+            self.writer.seek(valid_end)
+
+    def _iter_offsets(self, start):
+        """
+        Percorre os registros a partir de uma posição, retornando (posição, tamanho)
+        """
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            while True:
+                prefix = f.read(RECORD_LENGTH.size)
+                if len(prefix) < RECORD_LENGTH.size:
+                    return
+                (length,) = RECORD_LENGTH.unpack(prefix)
+                if len(f.read(length)) < length:
+                    return
+                yield offset, length
+                offset += RECORD_LENGTH.size + length
+
+    def _read_at(self, offset, length=None):
+        with self.lock:
+            self.reader.seek(offset)
+            if length is None:
+                (length,) = RECORD_LENGTH.unpack(self.reader.read(RECORD_LENGTH.size))
+            else:
+                self.reader.seek(offset + RECORD_LENGTH.size)
+            payload = self.reader.read(length)
+        return json.loads(self.decompress(payload))
+
+    def _index_key(self, position):
+        return INDEX_ENTRY.unpack_from(self.index_map, INDEX_HEADER.size + position * INDEX_ENTRY.size)
+
+    def _find_indexed(self, key):
+        # Busca binária sobre as entradas ordenadas do índice mapeado
+        low, high = 0, self.index_count
+        while low < high:
+            middle = (low + high) // 2
+            middle_key, offset = self._index_key(middle)
+            if middle_key < key:
+                low = middle + 1
+            elif middle_key > key:
+                high = middle
+            else:
+                return offset
+        return None
+
+    def append_many(self, records):
+        """
+        Acrescenta registros ao arquivo (a versão mais recente de cada ID prevalece)
+
+        Args:
+            records (list): Dicts já serializáveis em JSON
+
+        Returns:
+            int: Quantidade de registros gravados
+        """
+        with self.lock:
+            for record in records:
+                payload = self.compress(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+                offset = self.writer.tell()
+                self.writer.write(RECORD_LENGTH.pack(len(payload)) + payload)
+                self.pending[job_key(record.get("job_id", ""))] = offset
+            self.writer.flush()
+        return len(records)
+
+    def submit(self, records, **fields):
+        """
+        Agenda a gravação de cards coletados em uma thread separada (fora do event loop)
+
+        Os campos são copiados aqui, então os registros podem continuar sendo alterados
+
+        Args:
+            records (list): Cards coletados (JobRecord ou JobBatch)
+            **fields: Informações extras gravadas em cada registro (ex.: URL de origem)
+
+        Returns:
+            Future: Conclusão da gravação
+        """
+        archived_at = int(time.time())
+        payload = []
+        for record in records:
+            if not record.job_id:
+                continue
+            entry = record.to_dict(ARCHIVED_FIELDS)
+            entry["archived_at"] = archived_at
+            entry.update(fields)
+            payload.append(entry)
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-archive")
+        return self.executor.submit(self.append_many, payload)
+
+    def get(self, job_id):
+        """
+        Retorna a versão mais recente de uma vaga ou None
+        """
+        key = job_key(job_id)
+        with self.lock:
+            offset = self.pending.get(key)
+            if offset is None and self.index_map is not None:
+                offset = self._find_indexed(key)
+        if offset is None:
+            return None
+        return self._read_at(offset)
+
+    def scan(self):
+        """
+        Percorre todos os registros na ordem de gravação (inclui versões antigas)
+        """
+        with open(self.path, "rb") as f:
+            f.seek(DATA_HEADER_SIZE)
+            while True:
+                prefix = f.read(RECORD_LENGTH.size)
+                if len(prefix) < RECORD_LENGTH.size:
+                    return
+                (length,) = RECORD_LENGTH.unpack(prefix)
+                payload = f.read(length)
+                if len(payload) < length:
+                    return
+                yield json.loads(self.decompress(payload))
+
+    def flush_index(self):
+        """
+        Incorpora os registros pendentes ao índice ordenado (gravação atômica)
+        """
+        with self.lock:
+            if not self.pending and os.path.exists(self.index_path):
+                return
+
+            entries = {}
+            for position in range(self.index_count):
+                key, offset = self._index_key(position)
+                entries[key] = offset
+            entries.update(self.pending)
+
+            self.writer.flush()
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, self.writer.tell()))
+                for key in sorted(entries):
+                    f.write(INDEX_ENTRY.pack(key, entries[key]))
+
+            if self.index_map is not None:
+                self.index_map.close()
+                self.index_map = None
+            os.replace(tmp_path, self.index_path)
+
+            self.pending = {}
+            self.index_count = len(entries)
+            if self.index_count:
+                with open(self.index_path, "rb") as f:
+                    self.index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        """
+        Aguarda as gravações pendentes, atualiza o índice e fecha os arquivos
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+        self.flush_index()
+        with self.lock:
+            if self.index_map is not None:
+                self.index_map.close()
+                self.index_map = None
+            self.writer.close()
+            self.reader.close()
+
+    def __contains__(self, job_id):
+        key = job_key(job_id)
+        with self.lock:
+            return key in self.pending or (self.index_map is not None and self._find_indexed(key) is not None)
+
+    def __len__(self):
+        """
+        Quantidade de vagas distintas no arquivo
+        """
+        with self.lock:
+            if not self.pending:
+                return self.index_count
+            return self.index_count + sum(
+                1 for key in self.pending
+                if self.index_map is None or self._find_indexed(key) is None
+            )
+
+class ArchiveReader:
+    """
+    Leitura do arquivo de vagas sem nenhuma escrita: não cria o arquivo, não descarta
+    registros incompletos e não regrava o índice
+
+    Pode ser usado enquanto outra execução acrescenta registros: vale o conteúdo
+    existente ao abrir, e um registro incompleto no final é apenas ignorado
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Caminho do arquivo de dados
+        """
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.file = open(path, "rb")
+        header = self.file.read(DATA_HEADER_SIZE)
+        if len(header) < DATA_HEADER_SIZE or header[:len(DATA_MAGIC)] != DATA_MAGIC:
+            self.file.close()
+            raise ValueError(f"Arquivo de vagas inválido: {path}")
+
+        _, self.decompress = codec_functions(header[len(DATA_MAGIC):])
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index, self.indexed_size = self._load_index()
+
+    def _load_index(self):
+        """
+        Lê o índice (ID -> posição da versão mais recente), se for válido para este arquivo
+
+        Returns:
+            tuple: (dict chave -> posição, tamanho do arquivo de dados coberto pelo índice)
+        """
+        try:
+            with open(self.index_path, "rb") as f:
+                content = f.read()
+            magic, size = INDEX_HEADER.unpack_from(content)
+        except (OSError, struct.error):
+            return {}, DATA_HEADER_SIZE
+
+        if magic != INDEX_MAGIC or size > self.size:
+            return {}, DATA_HEADER_SIZE
+
+        end = INDEX_HEADER.size + (len(content) - INDEX_HEADER.size) // INDEX_ENTRY.size * INDEX_ENTRY.size
+        return dict(INDEX_ENTRY.iter_unpack(content[INDEX_HEADER.size:end])), size
+
+    def _iter_offsets(self, start):
+        """
+        Percorre os registros completos a partir de uma posição, retornando (posição, tamanho)
+        """
+        offset = start
+        while offset + RECORD_LENGTH.size <= self.size:
+            (length,) = RECORD_LENGTH.unpack_from(self.data, offset)
+            if offset + RECORD_LENGTH.size + length > self.size:
+                return
+            yield offset, length
+            offset += RECORD_LENGTH.size + length
+
+    def _read_at(self, offset, length=None):
+        if length is None:
+            (length,) = RECORD_LENGTH.unpack_from(self.data, offset)
+        start = offset + RECORD_LENGTH.size
+        return json.loads(self.decompress(self.data[start:start + length]))
+
+    def scan(self):
+        """
+        Percorre todos os registros na ordem de gravação (inclui versões antigas)
+        """
+        for offset, length in self._iter_offsets(DATA_HEADER_SIZE):
+            yield self._read_at(offset, length)
+
+    def latest(self):
+        """
+        Percorre apenas a versão mais recente de cada vaga, na ordem de gravação
+
+        Usa o índice e lê somente os registros gravados depois dele
+        """
+        offsets = dict(self.index)
+        for offset, length in self._iter_offsets(self.indexed_size):
+            offsets[job_key(self._read_at(offset, length).get("job_id", ""))] = offset
+        for offset in sorted(offsets.values()):
+            yield self._read_at(offset)
+
+    def get(self, job_id):
+        """
+        Retorna a versão mais recente de uma vaga ou None
+        """
+        key = job_key(job_id)
+        found = None
+        for offset, length in self._iter_offsets(self.indexed_size):
+            record = self._read_at(offset, length)
+            if job_key(record.get("job_id", "")) == key:
+                found = record
+        if found is not None:
+            return found
+        offset = self.index.get(key)
+        return self._read_at(offset) if offset is not None else None
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro local (ledger) das vagas conhecidas pela automação
+Mantém entre execuções o estado de cada vaga (salva, vista, rejeitada)
+"""
+
+import os
+import json
+import time
+
+from utils import get_data_dir, atomic_write_json
+
+class JobLedger:
+    """
+    Registro persistente de vagas indexado pelo ID da vaga do LinkedIn
+    """
+
+    STATUS_SAVED = "saved"
+    STATUS_SEEN = "seen"
+    STATUS_REJECTED = "rejected"
+
+    def __init__(self, path=None):
+        """
+        Inicializa o ledger carregando o arquivo local, se existir
+
+        Args:
+            path (str): Caminho do arquivo JSON (padrão: diretório de dados)
+        """
+        self.path = path or os.path.join(get_data_dir(), "job_ledger.json")
+        self.jobs = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """
+        Carrega o ledger do disco
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.jobs = json.load(f).get("jobs", {})
+        except (OSError, ValueError):
+            self.jobs = {}
+
+    def save(self):
+        """
+        Grava o ledger no disco se houver alterações pendentes
+        """
+        if not self.dirty:
+            return
+
+        atomic_write_json(self.path, {"jobs": self.jobs})
+        self.dirty = False
+
+    def mark(self, job_id, status, **fields):
+        """
+        Registra o status de uma vaga
+
+        Args:
+            job_id (str): ID da vaga
+            status (str): Novo status da vaga
+            **fields: Informações extras a guardar (ex.: perfil que salvou a vaga)
+        """
+        if not job_id:
+            return
+
+        entry = self.jobs.setdefault(str(job_id), {})
+        entry["status"] = status
+        entry["updated"] = int(time.time())
+        entry.update({key: value for key, value in fields.items() if value is not None})
+        self.dirty = True
+
+    def mark_many(self, job_ids, status):
+        """
+        Registra o mesmo status para várias vagas
+        """
+        for job_id in job_ids:
+            self.mark(job_id, status)
+
+    def get_status(self, job_id):
+        """
+        Retorna o status registrado de uma vaga ou None
+        """
+        entry = self.jobs.get(str(job_id))
+        return entry.get("status") if entry else None
+
+    def ids_with_status(self, status):
+        """
+        Retorna o conjunto de IDs com o status informado
+        """
+        return {job_id for job_id, entry in self.jobs.items() if entry.get("status") == status}
+
+    def __contains__(self, job_id):
+        return str(job_id) in self.jobs
+
+    def __len__(self):
+        return len(self.jobs)
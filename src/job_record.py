@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Representação compacta das vagas coletadas
+JobRecord guarda um card com __slots__ (sem __dict__ por instância) e strings
+de empresa/local internadas; JobBatch guarda muitos cards em colunas
+"""
+
+import re
+import sys
+
+# Campos de um card, na ordem usada por JobRecord e JobBatch
+RECORD_FIELDS = ("index", "job_id", "title", "company", "location", "posted", "text")
+
+# "há 3 dias", "3 days ago", "Reposted 2 weeks ago", "30+ dias"... (unidade -> dias)
+POSTED_AGE_PATTERN = re.compile(
+    r"(\d+)\+?\s*(min|hora|hour|hr|h\b|dia|day|d\b|semana|week|sem\b|w\b|m[eê]s|meses|month|mo\b|ano|year|yr)"
+)
+POSTED_UNIT_DAYS = (
+    (("min",), 1 / 1440),
+    (("hora", "hour", "hr", "h"), 1 / 24),
+    (("dia", "day", "d"), 1),
+    (("semana", "week", "sem", "w"), 7),
+    (("mês", "mes", "meses", "month", "mo"), 30),
+    (("ano", "year", "yr"), 365),
+)
+POSTED_TODAY = ("agora", "hoje", "just now", "today", "momentos", "moments")
+POSTED_YESTERDAY = ("ontem", "yesterday")
+
+def posted_age_days(posted):
+    """
+    Idade da vaga em dias a partir do texto "publicada há X" do card
+
+    Returns:
+        float or None: Idade aproximada ou None se o texto não indicar a data
+    """
+    text = str(posted or "").lower()
+    if not text:
+        return None
+
+    match = POSTED_AGE_PATTERN.search(text)
+    if match:
+        unit = match.group(2)
+        for prefixes, days in POSTED_UNIT_DAYS:
+            if unit.startswith(prefixes):
+                return int(match.group(1)) * days
+
+    if any(word in text for word in POSTED_YESTERDAY):
+        return 1
+    if any(word in text for word in POSTED_TODAY):
+        return 0
+    return None
+
+def intern_text(value):
+    """
+    Interna um texto curto e repetitivo (empresa, local, data de publicação)
+
+    Cards da mesma empresa ou cidade passam a compartilhar uma única string
+    """
+    if not value:
+        return ""
+    return sys.intern(str(value).strip())
+
+class JobRecord:
+    """
+    Um card de vaga coletado (apenas o texto original; minúsculas são geradas sob demanda)
+    """
+
+    __slots__ = RECORD_FIELDS + ("fingerprint",)
+
+    def __init__(self, index=0, job_id="", title="", company="", location="", posted="", text=""):
+        self.index = index
+        self.job_id = str(job_id or "")
+        self.title = (title or "").strip()
+        self.company = intern_text(company)
+        self.location = intern_text(location)
+        self.posted = intern_text(posted)
+        self.text = text or ""
+        self.fingerprint = None
+
+    @classmethod
+    def from_dict(cls, data, index=None):
+        """
+        Cria um registro a partir de um dict (script de coleta, JSONL ou arquivo de vagas)
+
+        Args:
+            data (dict): Campos do card; "id" é aceito no lugar de "job_id"
+            index (int): Posição do card na página (padrão: data["index"] ou 0)
+        """
+        text = data.get("text") or "\n".join(
+            str(data.get(field) or "") for field in ("title", "company", "location", "description")
+        )
+        return cls(
+            data.get("index", 0) if index is None else index,
+            data.get("job_id") or data.get("id") or "",
+            data.get("title", ""),
+            data.get("company", ""),
+            data.get("location", ""),
+            data.get("posted", ""),
+            text,
+        )
+
+    def lower_text(self):
+        """
+        Texto em minúsculas para comparação (não fica guardado no registro)
+        """
+        return self.text.lower()
+
+    def to_dict(self, fields=RECORD_FIELDS):
+        return {field: getattr(self, field) for field in fields}
+
+    def __repr__(self):
+        return f"JobRecord(job_id={self.job_id!r}, title={self.title!r}, company={self.company!r})"
+
+class JobBatch:
+    """
+    Lote de vagas em colunas (uma lista por campo)
+
+    Ocupa bem menos memória que uma lista de objetos em varreduras com dezenas
+    de milhares de vagas e é serializado (pickle) de forma compacta para os
+    processos de avaliação
+    """
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, records=None):
+        for field in RECORD_FIELDS:
+            setattr(self, field, [])
+        if records:
+            self.extend(records)
+
+    @classmethod
+    def from_dicts(cls, items):
+        batch = cls()
+        for position, data in enumerate(items):
+            batch.append(JobRecord.from_dict(data, data.get("index", position)))
+        return batch
+
+    def append(self, record):
+        self.index.append(record.index)
+        self.job_id.append(record.job_id)
+        self.title.append(record.title)
+        self.company.append(record.company)
+        self.location.append(record.location)
+        self.posted.append(record.posted)
+        self.text.append(record.text)
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def record(self, position):
+        """
+        Monta o JobRecord de uma posição do lote
+        """
+        return JobRecord(*(getattr(self, field)[position] for field in RECORD_FIELDS))
+
+    def __len__(self):
+        return len(self.job_id)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            batch = JobBatch()
+            for field in RECORD_FIELDS:
+                setattr(batch, field, getattr(self, field)[position])
+            return batch
+        return self.record(position)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self.record(position)
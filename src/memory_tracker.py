@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Acompanhamento de memória por fase da automação
+Combina snapshots do tracemalloc (Python), heap JS e nós do DOM da página
+e a memória residente do processo Python e dos processos do navegador (separadas)
+"""
+
+import time
+import tracemalloc
+
+from utils import process_rss, browser_rss, sample_page_memory
+
+# Arquivos internos que não interessam no ranking de alocações
+IGNORED_FILES = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>",
+                 "<unknown>", tracemalloc.__file__)
+
+def format_bytes(value):
+    """
+    Formata uma quantidade de bytes em unidade legível (com sinal)
+    """
+    sign = "-" if value < 0 else "+"
+    value = abs(value)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{sign}{value:.0f}{unit}" if unit == "B" else f"{sign}{value:.1f}{unit}"
+        value /= 1024
+    return f"{sign}{value:.1f}GB"
+
+class MemorySample:
+    """
+    Medição de memória em uma fronteira de fase
+    """
+
+    __slots__ = ("phase", "jobs", "timestamp", "python", "rss", "browser", "heap", "nodes")
+
+    def __init__(self, phase, jobs, python, rss, browser, heap, nodes):
+        self.phase = phase
+        self.jobs = jobs
+        self.timestamp = time.time()
+        self.python = python
+        # RSS deste processo e dos processos do navegador (driver + Chromium), separados
+        self.rss = rss
+        self.browser = browser
+        self.heap = heap
+        self.nodes = nodes
+
+class MemoryTracker:
+    """
+    Registra a memória em cada fronteira de fase e relata crescimento e origens
+    """
+
+    def __init__(self, log_callback, top_n=10, frames=1):
+        """
+        Args:
+            log_callback (function): Função para logging
+            top_n (int): Quantidade de pontos de alocação no relatório
+            frames (int): Profundidade de pilha guardada pelo tracemalloc
+        """
+        self.log = log_callback
+        self.top_n = top_n
+        self.frames = frames
+        self.samples = []
+        self.baseline = None
+        self.previous = None
+        self.owns_tracemalloc = False
+
+    def start(self):
+        """
+        Ativa o tracemalloc e guarda o snapshot de referência
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self.owns_tracemalloc = True
+        self.baseline = self.previous = self._snapshot()
+
+    def _snapshot(self):
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, name) for name in IGNORED_FILES])
+
+    async def checkpoint(self, phase, page=None, jobs=0):
+        """
+        Mede a memória ao final de uma fase
+
+        Args:
+            phase (str): Nome da fase (ex.: "login", "pagina 3")
+            page: Página do Playwright para amostrar heap JS e DOM (opcional)
+            jobs (int): Vagas processadas até aqui
+
+        Returns:
+            MemorySample: Medição registrada
+        """
+        if self.baseline is None:
+            return None
+
+        page_memory = await sample_page_memory(page) if page is not None else None
+        page_memory = page_memory or {}
+
+        snapshot = self._snapshot()
+        python_delta = sum(stat.size_diff for stat in snapshot.compare_to(self.previous, "filename"))
+        self.previous = snapshot
+
+        sample = MemorySample(
+            phase, jobs,
+            python=tracemalloc.get_traced_memory()[0],
+            rss=process_rss(),
+            browser=browser_rss(),
+            heap=page_memory.get("heap", 0),
+            nodes=page_memory.get("nodes", 0)
+        )
+        self.samples.append(sample)
+
+        self.log(
+            f"Memória [{phase}]: Python {sample.python / 1048576:.1f}MB ({format_bytes(python_delta)}), "
+            f"RSS {sample.rss / 1048576:.0f}MB, navegador {sample.browser / 1048576:.0f}MB, heap JS {sample.heap / 1048576:.1f}MB, "
+            f"{sample.nodes} nós DOM"
+        )
+        return sample
+
+    def growth_per_hundred(self):
+        """
+        Calcula o crescimento de cada medida a cada 100 vagas processadas
+
+        Returns:
+            dict or None: Crescimento por medida ou None sem amostras suficientes
+        """
+        measured = [sample for sample in self.samples if sample.jobs > 0]
+        if not measured:
+            return None
+
+        first = next((sample for sample in self.samples if sample.jobs == 0), measured[0])
+        last = measured[-1]
+        jobs = last.jobs - first.jobs
+        if jobs <= 0:
+            return None
+
+        return {
+            field: (getattr(last, field) - getattr(first, field)) * 100 / jobs
+            for field in ("python", "rss", "browser", "heap", "nodes")
+        }
+
+    def top_allocations(self):
+        """
+        Retorna os pontos de alocação que mais cresceram desde o início
+
+        Returns:
+            list: Tuplas (arquivo:linha, bytes a mais, alocações a mais)
+        """
+        if self.baseline is None:
+            return []
+
+        stats = self._snapshot().compare_to(self.baseline, "lineno")
+        result = []
+        for stat in stats[:self.top_n]:
+            if stat.size_diff <= 0:
+                break
+            frame = stat.traceback[0]
+            result.append((f"{frame.filename}:{frame.lineno}", stat.size_diff, stat.count_diff))
+        return result
+
+    def report(self):
+        """
+        Registra no log o crescimento por 100 vagas e as maiores origens de alocação
+        """
+        growth = self.growth_per_hundred()
+        if growth:
+            self.log(
+                f"Crescimento a cada 100 vagas: Python {format_bytes(growth['python'])}, "
+                f"RSS {format_bytes(growth['rss'])}, navegador {format_bytes(growth['browser'])}, heap JS {format_bytes(growth['heap'])}, "
+                f"{growth['nodes']:+.0f} nós DOM"
+            )
+
+        allocations = self.top_allocations()
+        if allocations:
+            self.log("Maiores crescimentos de alocação (Python):")
+            for site, size, count in allocations:
+                self.log(f"  {site}: {format_bytes(size)} em {count:+d} blocos")
+
+    def stop(self):
+        """
+        Gera o relatório final e desativa o tracemalloc se foi ativado aqui
+        """
+        if self.baseline is None:
+            return
+
+        self.report()
+        if self.owns_tracemalloc:
+            tracemalloc.stop()
+        self.baseline = self.previous = None
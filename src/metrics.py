@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Métricas da execução no formato OpenMetrics (compatível com Prometheus)
+Expostas em um endpoint HTTP local opcional ou gravadas em arquivo texto
+"""
+
+import os
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils import process_rss, browser_rss
+
+# Limites padrão dos histogramas de latência (segundos)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+def _format_value(value):
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+def _format_bound(bound):
+    # Limites de balde sempre como float ("1.0", "2.5"), como pede o OpenMetrics
+    return repr(float(bound))
+
+class Metric:
+    """
+    Família de métricas com amostras indexadas pelos rótulos
+    """
+
+    type_name = "unknown"
+
+    def __init__(self, name, documentation, lock):
+        self.name = name
+        self.documentation = documentation
+        self.lock = lock
+        self.values = {}
+
+    def _key(self, labels):
+        return tuple(sorted(labels.items()))
+
+    def samples(self):
+        """
+        Retorna as amostras como tuplas (sufixo, rótulos, valor)
+        """
+        return [("", key, value) for key, value in self.values.items()]
+
+class Counter(Metric):
+    """
+    Contador monotônico
+    """
+
+    type_name = "counter"
+
+    def inc(self, amount=1, **labels):
+        with self.lock:
+            key = self._key(labels)
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self):
+        return [("_total", key, value) for key, value in self.values.items()]
+
+class Gauge(Metric):
+    """
+    Valor que pode subir e descer
+    """
+
+    type_name = "gauge"
+
+    def set(self, value, **labels):
+        with self.lock:
+            self.values[self._key(labels)] = value
+
+class Histogram(Metric):
+    """
+    Histograma com baldes cumulativos
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, lock, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, lock)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        with self.lock:
+            key = self._key(labels)
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = {"counts": [0] * len(self.buckets), "count": 0, "sum": 0.0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][index] += 1
+            state["count"] += 1
+            state["sum"] += value
+
+    def samples(self):
+        result = []
+        for key, state in self.values.items():
+            for bound, count in zip(self.buckets, state["counts"]):
+                result.append(("_bucket", key + (("le", _format_bound(bound)),), count))
+            result.append(("_bucket", key + (("le", "+Inf"),), state["count"]))
+            result.append(("_count", key, state["count"]))
+            result.append(("_sum", key, state["sum"]))
+        return result
+
+class MetricsRegistry:
+    """
+    Registro de famílias de métricas com renderização em OpenMetrics
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.metrics = []
+
+    def _register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation):
+        return self._register(Counter(name, documentation, self.lock))
+
+    def gauge(self, name, documentation):
+        return self._register(Gauge(name, documentation, self.lock))
+
+    def histogram(self, name, documentation, buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, self.lock, buckets))
+
+    def render(self):
+        """
+        Gera o texto no formato OpenMetrics
+
+        Returns:
+            str: Exposição completa terminada em "# EOF"
+        """
+        lines = []
+        with self.lock:
+            for metric in self.metrics:
+                lines.append(f"# TYPE {metric.name} {metric.type_name}")
+                lines.append(f"# HELP {metric.name} {metric.documentation}")
+                for suffix, labels, value in metric.samples():
+                    lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """
+        Grava as métricas em arquivo de forma atômica (para coletores por arquivo)
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+        return path
+
+class MetricsServer:
+    """
+    Endpoint HTTP local que expõe o registro em /metrics
+    """
+
+    def __init__(self, registry, port, host="127.0.0.1"):
+        """
+        Args:
+            registry (MetricsRegistry): Registro a expor
+            port (int): Porta local
+            host (str): Endereço de escuta (padrão: apenas local)
+        """
+        registry_ref = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry_ref.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, name="metrics-server", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+class RunMetrics:
+    """
+    Métricas padrão de uma execução da automação
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or MetricsRegistry()
+        registry = self.registry
+
+        self.harvested = registry.counter("linkedin_jobs_harvested", "Cards de vaga coletados")
+        self.scored = registry.counter("linkedin_jobs_scored", "Vagas avaliadas pelos perfis")
+        self.rejected = registry.counter("linkedin_jobs_rejected", "Vagas rejeitadas pelos critérios")
+        self.saved = registry.counter("linkedin_jobs_saved", "Vagas salvas")
+        self.skipped = registry.counter("linkedin_jobs_skipped", "Vagas ignoradas antes de abrir, por motivo")
+        self.selector_misses = registry.counter("linkedin_selector_misses", "Seletores sem elemento visível")
+        self.retries = registry.counter("linkedin_retries", "Novas tentativas e caminhos alternativos usados")
+        self.page_recycles = registry.counter("linkedin_page_recycles", "Páginas recicladas, por motivo")
+        self.downloaded = registry.counter("linkedin_downloaded_bytes", "Bytes baixados pelo navegador")
+        self.stage_latency = registry.histogram("linkedin_stage_duration_seconds", "Duração de cada fase")
+        self.browser_memory = registry.gauge("linkedin_browser_memory_bytes", "RSS do navegador e do driver")
+        self.process_memory = registry.gauge("linkedin_process_memory_bytes", "RSS do processo Python")
+        self.first_save = registry.gauge("linkedin_time_to_first_save_seconds", "Tempo até a primeira vaga salva")
+        self.started = registry.gauge("linkedin_run_start_timestamp_seconds", "Início da execução")
+
+        self.start_time = time.time()
+        self.started.set(self.start_time)
+        # Leituras de tamanho de corpo em andamento (referência evita coleta da tarefa)
+        self.pending_sizes = set()
+
+    def observe_span(self, span):
+        """
+        Listener do Tracer: registra a duração de cada fase
+        """
+        self.stage_latency.observe(span.duration, stage=span.name)
+
+    def observe_response(self, response):
+        """
+        Listener de respostas do navegador: soma os bytes baixados
+
+        Sem content-length (respostas chunked ou comprimidas) o tamanho do corpo
+        é lido do navegador em segundo plano
+        """
+        try:
+            length = response.headers.get("content-length")
+            if length:
+                self.downloaded.inc(int(length))
+                return
+            task = asyncio.ensure_future(self.observe_body_size(response))
+            self.pending_sizes.add(task)
+            task.add_done_callback(self.pending_sizes.discard)
+        except Exception:
+            pass
+
+    async def observe_body_size(self, response):
+        """
+        Soma o tamanho do corpo de uma resposta sem content-length
+        """
+        try:
+            size = (await response.request.sizes()).get("responseBodySize", 0)
+            if size <= 0:
+                size = len(await response.body())
+            self.downloaded.inc(size)
+        except Exception:
+            pass
+
+    def job_saved(self):
+        """
+        Registra uma vaga salva e o tempo até a primeira
+        """
+        if not self.saved.values:
+            self.first_save.set(round(time.time() - self.start_time, 3))
+        self.saved.inc()
+
+    def sample_memory(self):
+        """
+        Atualiza a memória residente do navegador (só processos filhos) e do processo Python
+
+        Returns:
+            int: RSS do navegador em bytes
+        """
+        browser = browser_rss()
+        if browser:
+            self.browser_memory.set(browser)
+        rss = process_rss()
+        if rss:
+            self.process_memory.set(rss)
+        return browser
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Política de ritmo (pausas entre ações) da automação
+Todas as esperas passam por aqui: aleatória em produção, semeada para
+execuções reproduzíveis e zerada para benchmarks contra servidores locais
+"""
+
+import time
+import random
+import asyncio
+
+class Pacing:
+    """
+    Política de ritmo base: pausas sorteadas em uma janela [mínimo, máximo]
+    """
+
+    name = "random"
+
+    def __init__(self, scale=1.0, rng=None):
+        """
+        Args:
+            scale (float): Multiplicador aplicado a todas as pausas
+            rng (random.Random): Gerador de números (padrão: um novo gerador)
+        """
+        self.scale = scale
+        self.rng = rng or random.Random()
+        self.total_ms = 0
+
+    def duration(self, min_ms, max_ms=None):
+        """
+        Sorteia a duração de uma pausa em milissegundos
+
+        Args:
+            min_ms (int): Duração mínima (ou fixa, se max_ms não for informado)
+            max_ms (int): Duração máxima
+        """
+        if max_ms is None or max_ms <= min_ms:
+            value = min_ms
+        else:
+            value = self.rng.randint(int(min_ms), int(max_ms))
+        return int(value * self.scale)
+
+    async def wait(self, min_ms, max_ms=None):
+        """
+        Pausa assíncrona (não passa pelo navegador, ao contrário de wait_for_timeout)
+        """
+        ms = self.duration(min_ms, max_ms)
+        self.total_ms += ms
+        await asyncio.sleep(ms / 1000)
+
+    def sleep(self, min_ms, max_ms=None):
+        """
+        Pausa síncrona (bloqueia a thread atual)
+        """
+        ms = self.duration(min_ms, max_ms)
+        self.total_ms += ms
+        if ms > 0:
+            time.sleep(ms / 1000)
+
+    def typing_delay(self, ms):
+        """
+        Intervalo entre teclas ao digitar em campos de texto
+        """
+        return int(ms * self.scale)
+
+class RandomPacing(Pacing):
+    """
+    Ritmo de produção: pausas aleatórias que imitam um usuário
+    """
+
+class SeededPacing(Pacing):
+    """
+    Ritmo aleatório reproduzível: a mesma semente gera a mesma sequência de pausas
+    """
+
+    name = "seeded"
+
+    def __init__(self, seed=0, scale=1.0):
+        super().__init__(scale, random.Random(seed))
+        self.seed = seed
+
+class ZeroPacing(Pacing):
+    """
+    Sem pausas: mede o custo real do processamento contra servidores locais
+    """
+
+    name = "zero"
+
+    def __init__(self):
+        super().__init__(scale=0.0)
+
+    def duration(self, min_ms, max_ms=None):
+        return 0
+
+    async def wait(self, min_ms, max_ms=None):
+        # Apenas cede a vez ao event loop
+        await asyncio.sleep(0)
+
+    def sleep(self, min_ms, max_ms=None):
+        pass
+
+    def typing_delay(self, ms):
+        return 0
+
+PACING_MODES = {
+    "random": RandomPacing,
+    "seeded": SeededPacing,
+    "zero": ZeroPacing,
+}
+
+def create_pacing(mode="random", seed=None, scale=1.0):
+    """
+    Cria uma política de ritmo pelo nome
+
+    Args:
+        mode (str): "random", "seeded" ou "zero"
+        seed (int): Semente do modo "seeded"
+        scale (float): Multiplicador das pausas
+    """
+    if mode not in PACING_MODES:
+        raise ValueError(f"Modo de ritmo desconhecido: {mode}")
+    if mode == "zero":
+        return ZeroPacing()
+    if mode == "seeded":
+        return SeededPacing(seed or 0, scale)
+    return RandomPacing(scale)
+
+_pacing = RandomPacing()
+
+def get_pacing():
+    """
+    Retorna a política de ritmo padrão do processo
+    """
+    return _pacing
+
+def set_pacing(pacing):
+    """
+    Substitui a política de ritmo padrão do processo
+
+    Returns:
+        Pacing: Política anterior
+    """
+    global _pacing
+    previous, _pacing = _pacing, pacing
+    return previous
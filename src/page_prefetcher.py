@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pré-carregamento da próxima página de resultados em uma aba de fundo
+Esconde o tempo de carregamento da página N+1 enquanto a página N é processada
+"""
+
+import asyncio
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from utils import find_job_cards, harvest_job_cards
+from pacing import get_pacing
+
+# Quantidade de vagas por página nos resultados de busca do LinkedIn
+RESULTS_PAGE_SIZE = 25
+
+# Espera máxima pelos cards na aba de fundo (ms); sem cards até lá, não há próxima página
+PREFETCH_TIMEOUT_MS = 5000
+
+def results_offset(url):
+    """
+    Posição da página de resultados (parâmetro start) na URL
+
+    Returns:
+        int or None: Posição (0 na primeira página) ou None se a URL não for de busca
+    """
+    parsed = urlparse(url)
+    if "/jobs/search" not in parsed.path:
+        return None
+
+    try:
+        return int(parse_qs(parsed.query).get("start", ["0"])[0])
+    except ValueError:
+        return 0
+
+def page_url_at(url, start):
+    """
+    Monta a URL da página de resultados que começa na posição start (mesma busca e filtros)
+
+    Returns:
+        str or None: URL da página ou None se a URL não for de busca
+    """
+    parsed = urlparse(url)
+    if "/jobs/search" not in parsed.path:
+        return None
+
+    query = parse_qs(parsed.query)
+    # A vaga aberta no painel não deve ser carregada na outra página
+    query.pop("currentJobId", None)
+    query["start"] = [str(start)]
+    return urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+def build_next_page_url(url, page_size=RESULTS_PAGE_SIZE):
+    """
+    Calcula a URL da próxima página de resultados a partir da URL atual
+
+    Args:
+        url (str): URL da página de resultados atual
+        page_size (int): Quantidade de vagas por página
+
+    Returns:
+        str or None: URL da próxima página ou None se a URL não for de busca
+    """
+    start = results_offset(url)
+    if start is None:
+        return None
+    return page_url_at(url, start + page_size)
+
+class NextPagePrefetcher:
+    """
+    Abre a próxima página de resultados em uma aba do mesmo contexto e
+    coleta seus cards antecipadamente (no máximo uma página à frente)
+    """
+
+    def __init__(self, context, log_callback, page_size=RESULTS_PAGE_SIZE, page_wrapper=None,
+                 pacing=None, timeout_ms=PREFETCH_TIMEOUT_MS):
+        """
+        Inicializa o prefetcher
+
+        Args:
+            context: BrowserContext do Playwright
+            log_callback (function): Função para logging
+            page_size (int): Quantidade de vagas por página
+            page_wrapper (function): Função aplicada a cada aba nova (ex.: instrumentação)
+            pacing (Pacing): Política de ritmo das pausas (padrão: política global)
+            timeout_ms (int): Espera máxima pelos cards da próxima página
+        """
+        self.context = context
+        self.log = log_callback
+        self.page_size = page_size
+        self.page_wrapper = page_wrapper
+        self.pacing = pacing or get_pacing()
+        self.timeout_ms = timeout_ms
+        self.task = None
+        self.url = None
+
+    def schedule(self, current_url):
+        """
+        Agenda o carregamento da página seguinte à URL informada
+
+        Não faz nada se já existe uma página pré-carregada pendente
+
+        Returns:
+            bool: True se um novo carregamento foi agendado
+        """
+        if self.task is not None:
+            return False
+
+        next_url = build_next_page_url(current_url, self.page_size)
+        if not next_url:
+            return False
+
+        self.url = next_url
+        self.task = asyncio.ensure_future(self._load(next_url))
+        return True
+
+    async def _load(self, url):
+        """
+        Carrega a página em uma nova aba e coleta os cards de vaga
+
+        Sem cards dentro de timeout_ms (ex.: passou da última página) retorna None,
+        e a navegação segue pelo botão "Próxima"
+        """
+        page = await self.context.new_page()
+        if self.page_wrapper:
+            page = self.page_wrapper(page)
+        try:
+            await page.goto(url, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector("div[data-job-id], .job-card, .result-card", timeout=self.timeout_ms)
+            except PlaywrightTimeoutError:
+                await page.close()
+                return None
+
+            job_cards = await find_job_cards(page)
+            if not job_cards:
+                await page.close()
+                return None
+
+            # Força a renderização dos cards carregados sob demanda
+            await job_cards.evaluate_all(
+                "(elements) => elements.forEach((el) => el.scrollIntoView({block: 'center'}))"
+            )
+            await self.pacing.wait(500)
+
+            records = await harvest_job_cards(job_cards)
+            return page, records
+
+        except BaseException:
+            # Inclui o cancelamento da tarefa, para não deixar abas abertas
+            await page.close()
+            raise
+
+    async def take(self):
+        """
+        Aguarda e retorna a página pré-carregada
+
+        Returns:
+            tuple or None: (página, registros dos cards) ou None se falhou
+        """
+        if self.task is None:
+            return None
+
+        task, self.task = self.task, None
+        try:
+            return await task
+        except Exception as e:
+            self.log(f"Pré-carregamento da próxima página falhou: {e}")
+            return None
+
+    async def cancel(self):
+        """
+        Cancela o carregamento pendente e fecha a aba de fundo
+        """
+        if self.task is None:
+            return
+
+        task, self.task = self.task, None
+        task.cancel()
+        try:
+            result = await task
+            if result:
+                await result[0].close()
+        except (asyncio.CancelledError, Exception):
+            pass
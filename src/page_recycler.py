@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reciclagem periódica da página principal para limitar a memória do navegador
+O SPA do LinkedIn acumula heap e nós do DOM enquanto os cards são abertos;
+reabrir a URL atual em uma aba nova devolve essa memória sem perder a posição
+"""
+
+from utils import JOB_CARD_SELECTORS, find_job_cards, sample_page_memory
+
+class PageRecycler:
+    """
+    Decide quando reciclar a página e a substitui por uma nova na mesma URL
+    """
+
+    def __init__(self, context, log_callback, max_jobs=150, max_heap_mb=None,
+                 max_dom_nodes=None, check_every=10, page_wrapper=None):
+        """
+        Args:
+            context: BrowserContext do Playwright
+            log_callback (function): Função para logging
+            max_jobs (int): Vagas abertas na mesma página antes de reciclar (0 desativa)
+            max_heap_mb (int): Limite do heap JS usado em MB (None desativa)
+            max_dom_nodes (int): Limite de nós do DOM (None desativa)
+            check_every (int): Intervalo, em vagas, entre as amostras de memória
+            page_wrapper (function): Função aplicada a cada página nova (ex.: instrumentação)
+        """
+        self.context = context
+        self.log = log_callback
+        self.max_jobs = max_jobs
+        self.max_heap = max_heap_mb * 1048576 if max_heap_mb else None
+        self.max_dom_nodes = max_dom_nodes
+        self.check_every = max(check_every, 1)
+        self.page_wrapper = page_wrapper
+        self.jobs_since = 0
+        self.recycles = 0
+
+    def job_done(self):
+        """
+        Contabiliza uma vaga aberta na página atual
+        """
+        self.jobs_since += 1
+
+    def reset(self):
+        """
+        Zera a contagem (a página atual acabou de ser criada)
+        """
+        self.jobs_since = 0
+
+    async def check(self, page):
+        """
+        Verifica se a página deve ser reciclada
+
+        Returns:
+            str or None: Motivo da reciclagem ("jobs", "heap", "dom") ou None
+        """
+        if not self.jobs_since:
+            return None
+
+        if self.max_jobs and self.jobs_since >= self.max_jobs:
+            return "jobs"
+
+        if (self.max_heap or self.max_dom_nodes) and self.jobs_since % self.check_every == 0:
+            memory = await sample_page_memory(page)
+            if memory:
+                if self.max_heap and memory["heap"] >= self.max_heap:
+                    return "heap"
+                if self.max_dom_nodes and memory["nodes"] >= self.max_dom_nodes:
+                    return "dom"
+
+        return None
+
+    async def recycle(self, page, card_selectors=None):
+        """
+        Abre a URL atual em uma página nova e fecha a antiga
+
+        Args:
+            page: Página atual
+            card_selectors (list): Seletores dos cards esperados na página
+
+        Returns:
+            tuple: (página nova, Locator dos cards ou None)
+        """
+        url = page.url
+        selectors = card_selectors or JOB_CARD_SELECTORS
+        new_page = await self.context.new_page()
+        if self.page_wrapper:
+            new_page = self.page_wrapper(new_page)
+
+        try:
+            await new_page.goto(url, wait_until="domcontentloaded")
+            job_cards = None
+            try:
+                await new_page.wait_for_selector(", ".join(selectors), timeout=20000)
+                job_cards = await find_job_cards(new_page, selectors)
+                if job_cards:
+                    # Força a renderização dos cards carregados sob demanda
+                    await job_cards.evaluate_all(
+                        "(elements) => elements.forEach((el) => el.scrollIntoView({block: 'center'}))"
+                    )
+            except Exception:
+                pass
+        except BaseException:
+            await new_page.close()
+            raise
+
+        await new_page.bring_to_front()
+        await page.close()
+
+        self.recycles += 1
+        self.jobs_since = 0
+        return new_page, job_cards
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perfis de skills nomeados avaliados em uma única passada pelo texto da vaga
+Os termos de todos os perfis são reunidos sem repetição e procurados uma vez por card
+"""
+
+import re
+
+# Termos que indicam vagas sênior (usados para níveis Júnior/Estágio)
+SENIOR_TERMS = ["senior", "sênior", "lead", "manager", "diretor", "especialista"]
+
+# Termos que indicam cada modalidade de trabalho
+WORK_TERMS = {
+    "Remoto": ["remoto", "remote", "home office", "trabalho remoto"],
+    "Presencial": ["presencial", "escritório", "office", "local"],
+    "Híbrido": ["híbrido", "hybrid", "misto"]
+}
+
+# Nome do perfil criado a partir dos campos simples de skills/termos
+DEFAULT_PROFILE_NAME = "padrão"
+
+class ProfileError(ValueError):
+    """
+    Definição de perfis inválida (nome vazio ou repetido)
+    """
+
+def split_terms(text):
+    """
+    Converte uma string separada por vírgulas em lista de termos em minúsculas
+    """
+    return [term.strip().lower() for term in (text or "").split(',') if term.strip()]
+
+class SkillProfile:
+    """
+    Perfil de busca nomeado com suas skills e termos a evitar
+    """
+
+    def __init__(self, name, skills, avoid_terms=()):
+        """
+        Args:
+            name (str): Nome do perfil (ex.: "data analyst")
+            skills (list or str): Skills do perfil
+            avoid_terms (list or str): Termos a evitar neste perfil
+
+        Raises:
+            ProfileError: Se o nome estiver vazio
+        """
+        self.name = str(name or "").strip()
+        if not self.name:
+            raise ProfileError("Todo perfil precisa de um nome (\"nome: skills | evitar\")")
+        self.skills = split_terms(skills) if isinstance(skills, str) else [s.lower() for s in skills]
+        self.avoid_terms = (
+            split_terms(avoid_terms) if isinstance(avoid_terms, str) else [t.lower() for t in avoid_terms]
+        )
+
+    def __repr__(self):
+        return f"SkillProfile({self.name!r}, skills={self.skills!r}, avoid_terms={self.avoid_terms!r})"
+
+def parse_profiles(text):
+    """
+    Lê perfis no formato "nome: skill1, skill2 | evitar1, evitar2"
+
+    Perfis são separados por ";" ou quebra de linha; a parte "| evitar" é opcional
+
+    Args:
+        text (str): Definição dos perfis
+
+    Returns:
+        list: Lista de SkillProfile
+
+    Raises:
+        ProfileError: Se um perfil não tiver nome
+    """
+    profiles = []
+    for chunk in re.split(r"[;\n]", text or ""):
+        if ':' not in chunk:
+            continue
+
+        name, terms = chunk.split(':', 1)
+        skills, _, avoid = terms.partition('|')
+        if split_terms(skills):
+            profiles.append(SkillProfile(name, skills, avoid))
+
+    return profiles
+
+def build_profile_list(user_skills, avoid_terms, keywords="", profiles=None):
+    """
+    Monta a lista de perfis a partir dos campos simples e dos perfis extras
+
+    O perfil padrão usa as skills do usuário ou, sem elas, as palavras-chave
+    da busca; ele só é omitido quando há perfis extras e nenhuma skill
+
+    Args:
+        user_skills (list): Skills do usuário em minúsculas
+        avoid_terms (list): Termos a evitar em minúsculas
+        keywords (str): Palavras-chave da busca
+        profiles (str or list): Perfis extras em texto, SkillProfile ou dicts
+
+    Returns:
+        list: Lista de SkillProfile
+
+    Raises:
+        ProfileError: Se um perfil não tiver nome ou dois perfis tiverem o mesmo nome
+            (vereditos e contagens por perfil são indexados pelo nome)
+    """
+    if isinstance(profiles, str):
+        extra_profiles = parse_profiles(profiles)
+    else:
+        extra_profiles = list(profiles or [])
+
+    result = []
+    if user_skills or not extra_profiles:
+        result.append(SkillProfile(DEFAULT_PROFILE_NAME, user_skills or split_terms(keywords), avoid_terms))
+
+    for profile in extra_profiles:
+        if isinstance(profile, dict):
+            profile = SkillProfile(profile.get('name', ''), profile.get('skills', []),
+                                   profile.get('avoid_terms', []))
+        result.append(profile)
+
+    names = set()
+    for profile in result:
+        name = profile.name.lower()
+        if name in names:
+            raise ProfileError(f"Perfil repetido: \"{profile.name}\" (cada perfil precisa de um nome único)")
+        names.add(name)
+
+    return result
+
+class ProfileMatcher:
+    """
+    Avalia vários perfis de uma vez: o texto da vaga é percorrido uma única vez
+    e cada perfil recebe seu próprio veredito e pontuação
+    """
+
+    def __init__(self, profiles, experience_level="Todos", work_type="Todas"):
+        """
+        Reúne os termos de todos os perfis em um único conjunto
+
+        Args:
+            profiles (list): Lista de SkillProfile
+            experience_level (str): Nível de experiência configurado
+            work_type (str): Modalidade de trabalho configurada
+        """
+        self.profiles = list(profiles)
+        self.check_level = experience_level in ("Júnior", "Estágio")
+        self.work_terms = WORK_TERMS.get(work_type, []) if work_type != "Todas" else []
+
+        terms = set()
+        for profile in self.profiles:
+            terms.update(profile.skills)
+            terms.update(profile.avoid_terms)
+        if self.check_level:
+            terms.update(SENIOR_TERMS)
+        terms.update(self.work_terms)
+        terms.discard("")
+
+        # Cada termo é procurado uma única vez, mesmo que apareça em vários perfis.
+        # "termo in texto" (busca de substring em C) é mais rápido que uma alternação
+        # de regex com estes conjuntos de termos (dezenas a centenas); ver
+        # benchmarks/bench_scoring.py::test_profile_matcher_vs_naive
+        self.terms = tuple(sorted(terms))
+        self.profile_terms = [
+            (profile, frozenset(profile.skills), frozenset(profile.avoid_terms)) for profile in self.profiles
+        ]
+
+    def scan(self, text_lower):
+        """
+        Retorna o conjunto de termos dos perfis presentes no texto
+        """
+        return {term for term in self.terms if term in text_lower}
+
+    def evaluate(self, job_text):
+        """
+        Avalia o texto de uma vaga para todos os perfis
+
+        Args:
+            job_text (str): Texto da vaga
+
+        Returns:
+            dict: compatible, profile (melhor perfil compatível), score,
+                  level_compatible, work_mode_ok e verdicts por perfil
+        """
+        found = self.scan((job_text or "").lower())
+
+        level_ok = not (self.check_level and not found.isdisjoint(SENIOR_TERMS))
+        work_mode_ok = not self.work_terms or not found.isdisjoint(self.work_terms)
+
+        verdicts = {}
+        best_name = None
+        best_score = None
+        top_score = None
+        for profile, skill_set, avoid_set in self.profile_terms:
+            # isdisjoint evita montar as listas no caso comum de nenhum termo encontrado
+            matching_skills = [] if found.isdisjoint(skill_set) else [
+                skill for skill in profile.skills if skill in found
+            ]
+            avoid_found = [] if found.isdisjoint(avoid_set) else [
+                term for term in profile.avoid_terms if term in found
+            ]
+            score = len(matching_skills) - len(avoid_found) * 2
+            # Perfil sem skills não impõe exigência de skill (comportamento original)
+            skills_ok = bool(matching_skills) or not profile.skills
+            compatible = skills_ok and not avoid_found and level_ok and work_mode_ok
+
+            verdicts[profile.name] = {
+                'compatible': compatible,
+                'score': score,
+                'matching_skills': matching_skills,
+                'avoid_terms_found': avoid_found
+            }
+
+            if compatible and (best_score is None or score > best_score):
+                best_name, best_score = profile.name, score
+            if top_score is None or score > top_score:
+                top_score = score
+
+        return {
+            'compatible': best_name is not None,
+            'profile': best_name,
+            'score': best_score if best_score is not None else (top_score or 0),
+            'level_compatible': level_ok,
+            'work_mode_ok': work_mode_ok,
+            'verdicts': verdicts
+        }
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modo de profiling da automação: cProfile + diagnóstico do event loop asyncio
+Gera um arquivo .pstats (abra com snakeviz ou pstats) e um resumo no log
+"""
+
+import io
+import os
+import time
+import pstats
+import asyncio
+import cProfile
+import logging
+
+from utils import get_data_dir
+
+class SlowCallbackHandler(logging.Handler):
+    """
+    Captura os avisos de callbacks lentos emitidos pelo asyncio em modo debug
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        message = record.getMessage()
+        if "took" in message:
+            self.messages.append(message)
+
+class RunProfiler:
+    """
+    Profiler determinístico de uma execução com diagnóstico de tarefas asyncio
+    """
+
+    def __init__(self, log_callback, output_dir=None, slow_callback_ms=100, top_n=25):
+        """
+        Args:
+            log_callback (function): Função para logging do resumo
+            output_dir (str): Diretório dos arquivos .pstats (padrão: diretório de dados)
+            slow_callback_ms (int): Callbacks do event loop acima disso são registrados
+            top_n (int): Quantidade de funções no resumo
+        """
+        self.log = log_callback
+        self.output_dir = output_dir or os.path.join(get_data_dir(), "profiles")
+        self.slow_callback_ms = slow_callback_ms
+        self.top_n = top_n
+        self.profile = cProfile.Profile()
+        self.handler = SlowCallbackHandler()
+        self.loop = None
+        self.previous_debug = False
+        self.sampler = None
+        self.max_tasks = 0
+        self.started = None
+
+    def start(self, loop=None):
+        """
+        Inicia o profiling e o diagnóstico do event loop atual
+        """
+        self.loop = loop or asyncio.get_running_loop()
+        self.previous_debug = self.loop.get_debug()
+        self.loop.set_debug(True)
+        self.loop.slow_callback_duration = self.slow_callback_ms / 1000
+
+        logging.getLogger("asyncio").addHandler(self.handler)
+        self.sampler = self.loop.create_task(self._sample_tasks())
+        self.started = time.perf_counter()
+        self.profile.enable()
+
+    async def _sample_tasks(self):
+        # Amostra periódica da quantidade de tarefas vivas no event loop
+        while True:
+            self.max_tasks = max(self.max_tasks, len(asyncio.all_tasks(self.loop)))
+            await asyncio.sleep(1)
+
+    def stop(self):
+        """
+        Encerra o profiling, grava o .pstats e registra o resumo no log
+
+        Returns:
+            str or None: Caminho do arquivo .pstats
+        """
+        self.profile.disable()
+        elapsed = time.perf_counter() - self.started
+
+        if self.sampler:
+            self.sampler.cancel()
+        logging.getLogger("asyncio").removeHandler(self.handler)
+        self.loop.set_debug(self.previous_debug)
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = os.path.join(self.output_dir, f"run_{time.strftime('%Y%m%d_%H%M%S')}.pstats")
+            self.profile.dump_stats(path)
+        except OSError as e:
+            self.log(f"Erro ao gravar profile: {e}")
+            path = None
+
+        self.log(f"Profiling: {elapsed:.1f}s de execução, até {self.max_tasks} tarefas asyncio simultâneas")
+        if path:
+            self.log(f"Profile salvo em: {path} (abra com: snakeviz {path})")
+
+        for line in self.summary():
+            self.log(line)
+
+        slow = self.handler.messages
+        if slow:
+            self.log(f"{len(slow)} callbacks do event loop acima de {self.slow_callback_ms}ms:")
+            for message in slow[:10]:
+                self.log(f"  {message}")
+
+        return path
+
+    def summary(self):
+        """
+        Retorna as top-N funções por tempo acumulado como linhas de texto
+        """
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.strip_dirs().sort_stats("cumulative").print_stats(self.top_n)
+        return [line for line in stream.getvalue().splitlines() if line.strip()]
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Planejamento de várias buscas (palavras-chave x localização) em uma execução
+Um conjunto de IDs compartilhado garante que cada vaga seja avaliada e aberta
+uma única vez, e as buscas com mais vagas novas nas execuções anteriores vêm primeiro
+"""
+
+import os
+import json
+
+from utils import get_data_dir, atomic_write_json
+
+# Separador entre palavras-chave e localização ("python @ São Paulo")
+LOCATION_SEPARATOR = "@"
+
+class SearchQuery:
+    """
+    Uma busca: palavras-chave e localização, com as contagens desta execução
+    """
+
+    def __init__(self, keywords, location):
+        self.keywords = keywords.strip()
+        self.location = location.strip()
+        self.new = 0
+        self.duplicates = 0
+        self.pages = 0
+
+    @property
+    def key(self):
+        """
+        Chave normalizada usada nas estatísticas persistidas
+        """
+        return f"{' '.join(self.keywords.lower().split())}|{' '.join(self.location.lower().split())}"
+
+    @property
+    def label(self):
+        return f"'{self.keywords}' em '{self.location}'"
+
+def parse_queries(queries, default_location=""):
+    """
+    Converte a lista de buscas da configuração em SearchQuery
+
+    Args:
+        queries (str or list): Texto com uma busca por linha ou separadas por ";",
+            ou lista de textos / dicts {"keywords", "location"}; cada texto é
+            "palavras-chave @ localização" (sem "@", vale default_location)
+        default_location (str): Localização das buscas que não informam uma
+
+    Returns:
+        list: SearchQuery na ordem informada, sem repetições
+    """
+    if isinstance(queries, str):
+        queries = [part for line in queries.splitlines() for part in line.split(";")]
+
+    parsed = []
+    seen_keys = set()
+    for entry in queries or []:
+        if isinstance(entry, dict):
+            query = SearchQuery(entry.get("keywords", ""), entry.get("location") or default_location)
+        else:
+            keywords, _, location = str(entry).partition(LOCATION_SEPARATOR)
+            query = SearchQuery(keywords, location.strip() or default_location)
+        if query.keywords and query.key not in seen_keys:
+            seen_keys.add(query.key)
+            parsed.append(query)
+    return parsed
+
+class QueryPlanner:
+    """
+    Ordena as buscas pelo rendimento esperado e descarta vagas já vistas em outra busca
+    """
+
+    def __init__(self, queries, stats_path=None):
+        """
+        Args:
+            queries (list): Lista de SearchQuery
+            stats_path (str): Arquivo com o histórico de rendimento (padrão: diretório de dados)
+        """
+        self.queries = queries
+        self.seen = set()
+        self.stats_path = stats_path or os.path.join(get_data_dir(), "query_stats.json")
+        self.stats = self.load_stats()
+
+    def load_stats(self):
+        try:
+            with open(self.stats_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("queries", {})
+        except (OSError, ValueError):
+            return {}
+
+    def expected_yield(self, query):
+        """
+        Fração esperada de vagas novas, pelo histórico da busca
+
+        Com suavização de Laplace: buscas nunca executadas ficam com 1.0 e vão primeiro
+        """
+        stats = self.stats.get(query.key)
+        if not stats:
+            return 1.0
+        return (stats.get("new", 0) + 1) / (stats.get("new", 0) + stats.get("duplicates", 0) + 2)
+
+    def order(self):
+        """
+        Buscas em ordem decrescente de rendimento esperado (empates mantêm a ordem informada)
+        """
+        return sorted(self.queries, key=self.expected_yield, reverse=True)
+
+    def filter_new(self, query, records):
+        """
+        Mantém apenas os cards ainda não vistos nesta execução e contabiliza a busca
+
+        Args:
+            query (SearchQuery): Busca que coletou os cards
+            records (list): Cards coletados (JobRecord)
+
+        Returns:
+            list: Cards novos (cards sem ID são sempre mantidos)
+        """
+        query.pages += 1
+        fresh = []
+        for record in records:
+            if record.job_id and record.job_id in self.seen:
+                query.duplicates += 1
+                continue
+            if record.job_id:
+                self.seen.add(record.job_id)
+            query.new += 1
+            fresh.append(record)
+        return fresh
+
+    def save(self):
+        """
+        Acumula as contagens desta execução no histórico de rendimento
+        """
+        for query in self.queries:
+            if not query.pages:
+                continue
+            stats = self.stats.setdefault(query.key, {"new": 0, "duplicates": 0, "runs": 0})
+            stats["new"] += query.new
+            stats["duplicates"] += query.duplicates
+            stats["runs"] += 1
+        atomic_write_json(self.stats_path, {"queries": self.stats})
+
+    def report(self):
+        """
+        Linhas do relatório por busca (vagas novas x repetidas)
+        """
+        lines = []
+        for query in self.queries:
+            if not query.pages:
+                lines.append(f"  {query.label}: não executada")
+                continue
+            total = query.new + query.duplicates
+            share = query.new / total * 100 if total else 0
+            lines.append(
+                f"  {query.label}: {query.new} novas, {query.duplicates} repetidas "
+                f"({share:.0f}% novas, {query.pages} páginas)"
+            )
+        return lines
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reavaliação offline das vagas já vistas com novas skills e termos a evitar
+Lê snapshots (JSONL, HTML ou o arquivo local de vagas) um arquivo por vez,
+conta cada vaga uma única vez (a cópia mais recente), distribui lotes entre
+processos e grava as vagas compatíveis ordenadas
+
+Uso: python src/rescore.py [DIRETÓRIO] --skills "python, sql" --avoid "sênior"
+"""
+
+import os
+import sys
+import gzip
+import json
+import heapq
+import argparse
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from profiles import ProfileMatcher, ProfileError, build_profile_list, split_terms
+from job_record import JobRecord, JobBatch
+from utils import get_data_dir
+
+# Elementos HTML sem tag de fechamento
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+# Atributos que identificam um card de vaga nos snapshots HTML
+CARD_ID_ATTRIBUTES = ("data-job-id", "data-occludable-job-id")
+
+class CardExtractor(HTMLParser):
+    """
+    Extrai os cards de vaga (elementos com data-job-id) de um snapshot HTML
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.records = []
+        self.current = None
+        self.depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self.current is not None:
+            if tag not in VOID_ELEMENTS:
+                self.depth += 1
+            return
+
+        attrs = dict(attrs)
+        job_id = next((attrs[name] for name in CARD_ID_ATTRIBUTES if attrs.get(name)), None)
+        if job_id and tag not in VOID_ELEMENTS:
+            self.current = {"job_id": job_id, "parts": []}
+            self.depth = 1
+
+    def handle_endtag(self, tag):
+        if self.current is None or tag in VOID_ELEMENTS:
+            return
+        self.depth -= 1
+        if self.depth == 0:
+            parts = self.current["parts"]
+            self.records.append({
+                "job_id": self.current["job_id"],
+                "title": parts[0] if parts else "",
+                "company": parts[1] if len(parts) > 1 else "",
+                "text": "\n".join(parts),
+            })
+            self.current = None
+
+    def handle_data(self, data):
+        if self.current is not None and data.strip():
+            self.current["parts"].append(data.strip())
+
+def open_text(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+def iter_snapshot_files(path):
+    """
+    Lista os arquivos de snapshot de um diretório (ou o próprio arquivo), em ordem
+    """
+    if os.path.isfile(path):
+        yield path
+        return
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith((".jsonl", ".jsonl.gz", ".html", ".htm", ".archive")):
+                yield os.path.join(root, name)
+
+def newest_first(file_paths):
+    """
+    Ordena os snapshots do mais recente para o mais antigo (data de modificação, depois nome)
+    """
+    def modified(file_path):
+        try:
+            return os.path.getmtime(file_path)
+        except OSError:
+            return 0
+    return sorted(file_paths, key=lambda file_path: (modified(file_path), file_path), reverse=True)
+
+def iter_file_records(file_path):
+    """
+    Lê os registros de vaga de um snapshot, um de cada vez
+
+    Yields:
+        JobRecord: Registro de cada vaga (o arquivo local de vagas já traz só a versão mais recente)
+    """
+    if file_path.endswith(".archive"):
+        # Somente leitura (o arquivo pode estar sendo gravado por outra execução)
+        # e só a versão mais recente de cada vaga: regravações não contam duas vezes
+        from job_archive import ArchiveReader
+        with ArchiveReader(file_path) as archive:
+            for record in archive.latest():
+                yield JobRecord.from_dict(record)
+
+    elif file_path.endswith((".html", ".htm")):
+        extractor = CardExtractor()
+        with open_text(file_path) as f:
+            for line in f:
+                extractor.feed(line)
+                while extractor.records:
+                    yield JobRecord.from_dict(extractor.records.pop(0))
+        extractor.close()
+        for record in extractor.records:
+            yield JobRecord.from_dict(record)
+
+    else:
+        with open_text(file_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield JobRecord.from_dict(json.loads(line))
+                except ValueError:
+                    continue
+
+def latest_in_file(records):
+    """
+    Mantém a última cópia de cada vaga dentro de um snapshot (linhas posteriores são mais novas)
+    """
+    latest = {}
+    for record in records:
+        key = record.job_id or id(record)
+        latest.pop(key, None)
+        latest[key] = record
+    return latest.values()
+
+def iter_records(path):
+    """
+    Lê os registros de vaga de todos os snapshots, um de cada vez
+
+    A mesma vaga em vários snapshots conta uma única vez: os arquivos são lidos
+    do mais recente para o mais antigo e vale a cópia mais nova de cada job_id
+
+    Yields:
+        JobRecord: Registro de cada vaga
+    """
+    seen = set()
+    for file_path in newest_first(iter_snapshot_files(path)):
+        records = iter_file_records(file_path)
+        if not file_path.endswith(".archive"):
+            records = latest_in_file(records)
+
+        for record in records:
+            if record.job_id:
+                if record.job_id in seen:
+                    continue
+                seen.add(record.job_id)
+            yield record
+
+# Estado de cada processo de avaliação (criado uma vez pelo inicializador)
+_matcher = None
+
+def _init_worker(profiles, experience_level, work_type):
+    global _matcher
+    _matcher = ProfileMatcher(profiles, experience_level, work_type)
+
+def _score_chunk(chunk):
+    """
+    Avalia um lote (JobBatch) e devolve apenas as vagas compatíveis
+
+    Returns:
+        tuple: (total avaliado, lista de (score, job_id, título, empresa, perfil))
+    """
+    compatible = []
+    for job_id, title, company, text in zip(chunk.job_id, chunk.title, chunk.company, chunk.text):
+        result = _matcher.evaluate(text)
+        if result["compatible"]:
+            compatible.append((result["score"], job_id, title, company, result["profile"]))
+    return len(chunk), compatible
+
+class RankedResults:
+    """
+    Mantém apenas as K vagas de maior pontuação (memória constante)
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.heap = []
+        self.ids = set()
+        self.counter = 0
+
+    def add(self, score, job_id, title, company, profile):
+        if job_id and job_id in self.ids:
+            return
+        # O contador desempata pontuações iguais pela ordem de leitura
+        self.counter += 1
+        entry = (score, -self.counter, job_id, title, company, profile)
+        if len(self.heap) < self.limit:
+            heapq.heappush(self.heap, entry)
+            self.ids.add(job_id)
+        elif entry > self.heap[0]:
+            removed = heapq.heapreplace(self.heap, entry)
+            self.ids.discard(removed[2])
+            self.ids.add(job_id)
+
+    def ranked(self):
+        return sorted(self.heap, reverse=True)
+
+def chunked(records, size):
+    """
+    Agrupa os registros em lotes colunares de até size vagas
+    """
+    chunk = JobBatch()
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = JobBatch()
+    if len(chunk):
+        yield chunk
+
+def rescore(path, profiles, experience_level="Todos", work_type="Todas", workers=None,
+            chunk_size=2000, top=1000, log_callback=print):
+    """
+    Reavalia todos os registros dos snapshots em paralelo
+
+    Args:
+        path (str): Diretório ou arquivo de snapshots
+        profiles (list): Lista de SkillProfile
+        experience_level (str): Nível de experiência
+        work_type (str): Modalidade de trabalho
+        workers (int): Processos de avaliação (padrão: todos os núcleos)
+        chunk_size (int): Registros por lote enviado a um processo
+        top (int): Quantidade de vagas mantidas no ranking
+        log_callback (function): Função para logging do progresso
+
+    Returns:
+        dict: total, compatible, by_profile e ranked (lista ordenada por score)
+    """
+    workers = workers or os.cpu_count() or 1
+    results = RankedResults(top)
+    totals = {"total": 0, "compatible": 0, "by_profile": {}}
+    progress_every = workers * 10
+
+    def collect(future):
+        count, compatible = future.result()
+        totals["chunks"] = totals.get("chunks", 0) + 1
+        if totals["chunks"] % progress_every == 0:
+            log_callback(f"{totals['total'] + count} vagas avaliadas...")
+        totals["total"] += count
+        totals["compatible"] += len(compatible)
+        for score, job_id, title, company, profile in compatible:
+            totals["by_profile"][profile] = totals["by_profile"].get(profile, 0) + 1
+            results.add(score, job_id, title, company, profile)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(profiles, experience_level, work_type)) as executor:
+        # No máximo dois lotes por processo em andamento: leitura não se antecipa à avaliação
+        in_flight = set()
+        for chunk in chunked(iter_records(path), chunk_size):
+            if len(in_flight) >= workers * 2:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+            in_flight.add(executor.submit(_score_chunk, chunk))
+
+        for future in in_flight:
+            collect(future)
+
+    totals.pop("chunks", None)
+    totals["ranked"] = results.ranked()
+    return totals
+
+def write_ranked(path, ranked):
+    """
+    Grava o ranking em JSONL (uma vaga por linha, maior pontuação primeiro)
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for position, (score, _, job_id, title, company, profile) in enumerate(ranked, 1):
+            f.write(json.dumps({
+                "rank": position, "score": score, "job_id": job_id,
+                "title": title, "company": company, "profile": profile
+            }, ensure_ascii=False) + "\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reavalia offline as vagas já vistas com novos critérios")
+    parser.add_argument("path", nargs="?", default=get_data_dir(),
+                        help="diretório ou arquivo de snapshots (.jsonl, .html, .archive); padrão: diretório de dados")
+    parser.add_argument("--skills", default="", help="skills separadas por vírgula")
+    parser.add_argument("--avoid", default="", help="termos a evitar separados por vírgula")
+    parser.add_argument("--keywords", default="", help="palavras-chave usadas quando não há skills")
+    parser.add_argument("--profiles", default="", help='perfis extras ("nome: skills | evitar; ...")')
+    parser.add_argument("--experience", default="Todos", help="nível de experiência (ex.: Júnior)")
+    parser.add_argument("--work-type", default="Todas", help="modalidade (Remoto, Presencial, Híbrido)")
+    parser.add_argument("--workers", type=int, default=None, help="processos (padrão: todos os núcleos)")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="registros por lote")
+    parser.add_argument("--top", type=int, default=1000, help="vagas mantidas no ranking")
+    parser.add_argument("--output", default="rescored_jobs.jsonl", help="arquivo do ranking (JSONL)")
+    args = parser.parse_args(argv)
+
+    try:
+        profiles = build_profile_list(split_terms(args.skills), split_terms(args.avoid), args.keywords, args.profiles)
+    except ProfileError as e:
+        parser.error(str(e))
+    if not any(profile.skills for profile in profiles):
+        parser.error("informe --skills, --keywords ou --profiles")
+
+    totals = rescore(args.path, profiles, args.experience, args.work_type, args.workers,
+                     max(args.chunk_size, 1), max(args.top, 1))
+    write_ranked(args.output, totals["ranked"])
+
+    print(f"{totals['total']} vagas avaliadas, {totals['compatible']} compatíveis")
+    for name, count in sorted(totals["by_profile"].items(), key=lambda item: item[1], reverse=True):
+        print(f"  Perfil '{name}': {count}")
+    print(f"Ranking com {len(totals['ranked'])} vagas salvo em: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arquivo de configuração das execuções sem interface (TOML ou JSON)
+
+Exemplo (config.toml):
+
+    [account]
+    email = "voce@example.com"
+    password_env = "LINKEDIN_PASSWORD"
+
+    [search]
+    keywords = "python"
+    location = "Brasil"
+    # Ou várias buscas, com vagas repetidas avaliadas uma única vez:
+    # queries = ["python @ São Paulo", "django @ Remoto", "data engineer"]
+    max_jobs = 20
+    # Execuções diárias: ignora vagas com mais de 2 dias e para na primeira
+    # página sem vagas novas ou recentes
+    # max_posted_days = 2
+    # stale_pages = 1
+
+    [filters]
+    experience_level = "Júnior"
+    work_type = "Remoto"
+
+    [profile]
+    user_skills = "python, sql"
+    avoid_terms = "sênior, lead"
+
+    [run]
+    pacing = "random"
+"""
+
+import os
+import json
+
+from pacing import PACING_MODES
+from profiles import ProfileError, build_profile_list, split_terms
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Chaves aceitas em cada seção, com o valor padrão (os nomes são os parâmetros de LinkedInAutomation)
+CONFIG_SECTIONS = {
+    "account": {
+        "email": "",
+        "password": "",
+    },
+    "search": {
+        "keywords": "",
+        "queries": None,
+        "location": "Brasil",
+        "max_jobs": 10,
+        "delay": 3,
+        "use_recommendations": False,
+        "prefetch_next_page": True,
+        "max_posted_days": None,
+        "stale_pages": None,
+        "max_pages": 50,
+    },
+    "filters": {
+        "experience_level": "Todos",
+        "work_type": "Todas",
+        "contract_type": "Todos",
+        "apply_filters": True,
+        "blocked_companies": "",
+        "allowed_companies": "",
+        "skip_duplicates": True,
+        "prefetch_saved": True,
+    },
+    "profile": {
+        "user_skills": "",
+        "avoid_terms": "",
+        "profiles": None,
+    },
+    "run": {
+        "headless": True,
+        "pacing": "random",
+        "pacing_seed": None,
+        "pacing_scale": 1.0,
+        "base_url": None,
+        "archive_jobs": True,
+        "search_cache_hours": 0,
+        "search_cache_size": 200,
+        "checkpoint": True,
+        "checkpoint_path": None,
+        "resume": False,
+        "trace_path": None,
+        "metrics_textfile": None,
+        "track_memory": False,
+        "profile_run": False,
+    },
+}
+
+# Chaves que não são repassadas diretamente ao construtor
+PACING_KEYS = ("pacing", "pacing_seed", "pacing_scale")
+
+class ConfigError(ValueError):
+    """
+    Arquivo de configuração ausente, ilegível ou com valores inválidos
+    """
+
+def read_config_file(path):
+    """
+    Lê um arquivo TOML (.toml) ou JSON (qualquer outra extensão)
+
+    Returns:
+        dict: Conteúdo do arquivo
+    """
+    try:
+        if path.endswith(".toml"):
+            if tomllib is None:
+                raise ConfigError("Leitura de TOML requer Python 3.11+ ou o pacote tomli; use um arquivo JSON")
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except OSError as e:
+        raise ConfigError(f"Não foi possível ler {path}: {e}")
+    except ValueError as e:
+        if isinstance(e, ConfigError):
+            raise
+        raise ConfigError(f"Arquivo de configuração inválido ({path}): {e}")
+
+def load_run_config(path):
+    """
+    Carrega e valida a configuração, preenchendo os valores padrão
+
+    A senha pode vir do arquivo, da variável indicada em account.password_env
+    ou da variável LINKEDIN_PASSWORD
+
+    Returns:
+        dict: Configuração plana (nome do parâmetro -> valor)
+    """
+    data = read_config_file(path)
+    if not isinstance(data, dict):
+        raise ConfigError("A configuração deve ser um objeto com seções")
+
+    config = {}
+    for section, defaults in CONFIG_SECTIONS.items():
+        values = dict(data.get(section) or {})
+        if section == "account":
+            password_env = values.pop("password_env", None)
+            if not values.get("password"):
+                values["password"] = os.environ.get(password_env or "LINKEDIN_PASSWORD", "")
+
+        unknown = sorted(set(values) - set(defaults))
+        if unknown:
+            raise ConfigError(f"Chaves desconhecidas em [{section}]: {', '.join(unknown)}")
+        for key, default in defaults.items():
+            config[key] = values.get(key, default)
+
+    unknown_sections = sorted(set(data) - set(CONFIG_SECTIONS))
+    if unknown_sections:
+        raise ConfigError(f"Seções desconhecidas: {', '.join(unknown_sections)}")
+
+    if not config["email"] or not config["password"]:
+        raise ConfigError("Informe account.email e a senha (account.password ou password_env)")
+    if not any(config[key] for key in ("keywords", "queries", "user_skills", "profiles")):
+        raise ConfigError("Informe search.keywords, search.queries, profile.user_skills ou profile.profiles")
+    try:
+        build_profile_list(split_terms(config["user_skills"]), [], config["keywords"], config["profiles"])
+    except ProfileError as e:
+        raise ConfigError(f"profile.profiles inválido: {e}")
+    if config["pacing"] not in PACING_MODES:
+        raise ConfigError(f"run.pacing deve ser um de: {', '.join(PACING_MODES)}")
+    try:
+        config["max_jobs"] = int(config["max_jobs"])
+        config["delay"] = int(config["delay"])
+        config["pacing_scale"] = float(config["pacing_scale"])
+        if config["stale_pages"] is not None:
+            config["stale_pages"] = int(config["stale_pages"])
+        config["max_pages"] = int(config["max_pages"])
+        if config["max_posted_days"] is not None:
+            config["max_posted_days"] = float(config["max_posted_days"])
+    except (TypeError, ValueError) as e:
+        raise ConfigError(f"Valor numérico inválido: {e}")
+
+    return config
+
+def automation_kwargs(config):
+    """
+    Separa os parâmetros do construtor de LinkedInAutomation (sem o ritmo)
+    """
+    return {key: value for key, value in config.items() if key not in PACING_KEYS}
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache local e de curta duração das páginas de resultados de busca
+Guarda os cards coletados de cada página (chave: busca + filtros + página) para
+que uma nova passagem processe apenas as vagas que surgiram desde a anterior;
+a comparação usa todas as páginas da busca, já que vagas novas empurram as
+antigas para as páginas seguintes
+"""
+
+import os
+import json
+import time
+from collections import OrderedDict
+
+from utils import get_data_dir, atomic_write_json
+
+# Campos do card guardados no cache
+CACHED_FIELDS = ("index", "job_id", "title", "company", "location", "posted")
+
+def normalize_text(value):
+    return " ".join(str(value or "").lower().split())
+
+def search_parts(keywords, location, filters=None):
+    normalized_filters = sorted((normalize_text(name), normalize_text(value))
+                                for name, value in (filters or {}).items())
+    return [normalize_text(keywords), normalize_text(location), normalized_filters]
+
+def search_key(keywords, location, filters=None):
+    """
+    Monta a chave normalizada da busca (todas as páginas)
+
+    Returns:
+        str: Chave estável (maiúsculas, espaços e ordem dos filtros não importam)
+    """
+    return json.dumps(search_parts(keywords, location, filters), ensure_ascii=False)
+
+def search_cache_key(keywords, location, filters=None, page=0):
+    """
+    Monta a chave normalizada de uma página de resultados
+
+    Args:
+        keywords (str): Palavras-chave da busca
+        location (str): Localização
+        filters (dict): Filtros aplicados (nome -> valor)
+        page (int): Número da página (0 = primeira)
+
+    Returns:
+        str: Chave estável (maiúsculas, espaços e ordem dos filtros não importam)
+    """
+    return json.dumps(search_parts(keywords, location, filters) + [int(page)], ensure_ascii=False)
+
+class SearchCache:
+    """
+    Páginas de resultados recentes com validade (TTL) e descarte das menos usadas (LRU)
+    """
+
+    def __init__(self, path=None, ttl_hours=6, max_entries=200):
+        """
+        Args:
+            path (str): Arquivo do cache (padrão: diretório de dados)
+            ttl_hours (float): Validade de cada página gravada
+            max_entries (int): Quantidade máxima de páginas guardadas
+        """
+        self.path = path or os.path.join(get_data_dir(), "search_cache.json")
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max(int(max_entries), 1)
+        self.entries = OrderedDict()
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        """
+        Carrega o cache do disco, descartando páginas vencidas
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("entries", [])
+        except (OSError, ValueError):
+            entries = []
+
+        # O arquivo guarda as páginas da menos para a mais recentemente usada
+        now = time.time()
+        for entry in entries:
+            if now - entry.get("stored_at", 0) < self.ttl:
+                self.entries[entry["key"]] = entry
+
+    def save(self):
+        """
+        Grava o cache no disco se houver alterações
+        """
+        if not self.dirty:
+            return
+        atomic_write_json(self.path, {"entries": list(self.entries.values())})
+        self.dirty = False
+
+    def get(self, key):
+        """
+        Retorna a página gravada (dict com ids, records e stored_at) ou None se ausente ou vencida
+        """
+        entry = self.entries.get(key)
+        if entry is not None and time.time() - entry["stored_at"] >= self.ttl:
+            del self.entries[key]
+            self.dirty = True
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, records, search=None):
+        """
+        Grava os cards de uma página, descartando as páginas menos usadas além do limite
+
+        Args:
+            key (str): Chave de search_cache_key
+            records (list): Cards coletados (JobRecord)
+            search (str): Chave de search_key, que agrupa as páginas da mesma busca
+        """
+        self.entries[key] = {
+            "key": key,
+            "search": search,
+            "stored_at": time.time(),
+            "ids": [record.job_id for record in records if record.job_id],
+            "records": [record.to_dict(CACHED_FIELDS) for record in records],
+        }
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def known_ids(self, search):
+        """
+        IDs de todas as páginas válidas da busca na passagem anterior
+
+        Vagas novas deslocam os resultados para as páginas seguintes, então uma
+        vaga já vista pode reaparecer em outra página; por isso a comparação é
+        feita com a busca inteira e não só com a mesma página
+
+        Args:
+            search (str): Chave de search_key
+
+        Returns:
+            set: IDs conhecidos (vazio se não houver página válida da busca)
+        """
+        self.expire()
+        keys = [key for key, entry in self.entries.items() if entry.get("search") == search]
+        if not keys:
+            self.misses += 1
+            return set()
+
+        self.hits += 1
+        ids = set()
+        for key in keys:
+            ids.update(self.entries[key]["ids"])
+            self.entries.move_to_end(key)
+        return ids
+
+    def expire(self):
+        """
+        Descarta as páginas vencidas
+        """
+        now = time.time()
+        expired = [key for key, entry in self.entries.items() if now - entry["stored_at"] >= self.ttl]
+        for key in expired:
+            del self.entries[key]
+        if expired:
+            self.dirty = True
+
+    def clear(self):
+        self.entries.clear()
+        self.dirty = True
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rastreamento por fases (spans) com exportação no formato Chrome trace-event
+O arquivo gerado pode ser aberto em https://ui.perfetto.dev ou chrome://tracing
+"""
+
+import os
+import json
+import time
+import asyncio
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+
+# Span ativo no contexto atual (propagado automaticamente entre tarefas asyncio)
+_current_span = contextvars.ContextVar("linkedin_automation_span", default=None)
+
+class Span:
+    """
+    Intervalo de tempo nomeado com argumentos e span pai
+    """
+
+    __slots__ = ("name", "category", "args", "parent", "start", "end", "track")
+
+    def __init__(self, name, category, args, parent, track):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.parent = parent
+        self.track = track
+        self.start = time.perf_counter()
+        self.end = None
+
+    @property
+    def duration(self):
+        """
+        Duração do span em segundos (até agora, se ainda estiver aberto)
+        """
+        return (self.end or time.perf_counter()) - self.start
+
+class Tracer:
+    """
+    Coletor de spans; quando desabilitado, span() não registra nada
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Args:
+            enabled (bool): Se os spans devem ser registrados
+        """
+        self.enabled = enabled
+        self.spans = []
+        self.listeners = []
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def add_listener(self, callback):
+        """
+        Registra uma função chamada com cada span finalizado
+        """
+        self.listeners.append(callback)
+
+    def _track_name(self):
+        # Cada tarefa asyncio vira uma trilha própria no visualizador
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            return task.get_name()
+        return threading.current_thread().name
+
+    @contextmanager
+    def span(self, name, category="automation", **args):
+        """
+        Abre um span enquanto o bloco with é executado
+
+        Args:
+            name (str): Nome da fase (ex.: "login", "card")
+            category (str): Categoria exibida no visualizador
+            **args: Informações extras (ex.: job_id, página)
+        """
+        if not self.enabled and not self.listeners:
+            yield None
+            return
+
+        span = Span(name, category, args, _current_span.get(), self._track_name())
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            _current_span.reset(token)
+            if self.enabled:
+                with self.lock:
+                    self.spans.append(span)
+            for listener in self.listeners:
+                listener(span)
+
+    def current(self):
+        """
+        Retorna o span ativo no contexto atual
+        """
+        return _current_span.get()
+
+    def to_trace_events(self):
+        """
+        Converte os spans registrados em eventos "X" (complete) do Chrome trace-event
+        """
+        pid = os.getpid()
+        tracks = {}
+        events = []
+
+        with self.lock:
+            spans = list(self.spans)
+
+        for span in spans:
+            tid = tracks.setdefault(span.track, len(tracks) + 1)
+            args = {key: str(value) for key, value in span.args.items()}
+            if span.parent is not None:
+                args["parent"] = span.parent.name
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round((span.start - self.origin) * 1_000_000, 1),
+                "dur": round((span.end - span.start) * 1_000_000, 1),
+                "pid": pid,
+                "tid": tid,
+                "args": args
+            })
+
+        # Metadados com o nome de cada trilha
+        for track, tid in tracks.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": track}})
+
+        return events
+
+    def export(self, path):
+        """
+        Grava o trace em JSON (formato aceito pelo Perfetto e pelo chrome://tracing)
+
+        Returns:
+            str: Caminho do arquivo gerado
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.to_trace_events(), "displayTimeUnit": "ms"}, f)
+        return path
+
+    def summary(self):
+        """
+        Soma o tempo gasto por nome de span
+
+        Returns:
+            list: Tuplas (nome, quantidade, total em segundos) ordenadas pelo total
+        """
+        totals = {}
+        with self.lock:
+            for span in self.spans:
+                count, total = totals.get(span.name, (0, 0.0))
+                totals[span.name] = (count + 1, total + span.end - span.start)
+        return sorted(((name, count, total) for name, (count, total) in totals.items()),
+                      key=lambda item: item[2], reverse=True)
+
+def traced(name=None, category="automation"):
+    """
+    Decorator que envolve um método assíncrono da automação em um span
+
+    O tracer é obtido do atributo "tracer" da instância (self.tracer)
+
+    Args:
+        name (str): Nome do span (padrão: nome do método)
+        category (str): Categoria do span
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            tracer = getattr(self, "tracer", None)
+            if tracer is None:
+                return await func(self, *args, **kwargs)
+            with tracer.span(span_name, category):
+                return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -5,30 +5,33 @@ Funções auxiliares para a automação do LinkedIn com Playwright
 Versão atualizada com suporte para filtragem inteligente
 """
 
+import os
+import json
 import time
 import random
 import re
 import asyncio
 
+from pacing import get_pacing
+from job_record import JobRecord, intern_text
+
 def random_delay(min_seconds=1, max_seconds=3):
     """
     Executa um delay aleatório entre min_seconds e max_seconds
     """
-    delay = random.uniform(min_seconds, max_seconds)
-    time.sleep(delay)
+    get_pacing().sleep(min_seconds * 1000, max_seconds * 1000)
 
 async def async_random_delay(min_seconds=1, max_seconds=3):
     """
     Versão assíncrona do delay aleatório
     """
-    delay = random.uniform(min_seconds, max_seconds)
-    await asyncio.sleep(delay)
+    await get_pacing().wait(min_seconds * 1000, max_seconds * 1000)
 
 def get_random_delay_ms(min_ms=100, max_ms=500):
     """
     Retorna um delay aleatório em milissegundos para uso com Playwright
     """
-    return random.randint(min_ms, max_ms)
+    return get_pacing().duration(min_ms, max_ms)
 
 async def safe_click(locator, max_attempts=3):
     """
@@ -42,7 +45,7 @@ async def safe_click(locator, max_attempts=3):
         except Exception as e:
             if attempt == max_attempts - 1:
                 return False
-            await asyncio.sleep(0.5)
+            await get_pacing().wait(500)
     
     return False
 
@@ -55,9 +58,9 @@ async def safe_fill(locator, text, clear_first=True, typing_delay=50):
         
         if clear_first:
             await locator.fill("")
-            await asyncio.sleep(0.1)
+            await get_pacing().wait(100)
         
-        await locator.type(text, delay=typing_delay)
+        await locator.type(text, delay=get_pacing().typing_delay(typing_delay))
         return True
         
     except Exception:
@@ -70,19 +73,16 @@ async def safe_fill(locator, text, clear_first=True, typing_delay=50):
 async def extract_job_info(job_element):
     """
     Extrai informações relevantes de um elemento de vaga
+    
+    Returns:
+        JobRecord: Registro com o texto original (minúsculas via lower_text())
     """
     try:
-        job_info = {
-            'title': '',
-            'company': '',
-            'location': '',
-            'description': '',
-            'full_text': ''
-        }
+        job_info = JobRecord()
         
         # Extrair texto completo
         full_text = await job_element.text_content()
-        job_info['full_text'] = full_text.lower() if full_text else ''
+        job_info.text = full_text or ''
         
         # Tentar extrair título da vaga
         title_selectors = [
@@ -96,7 +96,7 @@ async def extract_job_info(job_element):
             try:
                 title_element = job_element.locator(selector).first
                 if await title_element.is_visible():
-                    job_info['title'] = await title_element.text_content()
+                    job_info.title = (await title_element.text_content() or '').strip()
                     break
             except:
                 continue
@@ -112,7 +112,7 @@ async def extract_job_info(job_element):
             try:
                 company_element = job_element.locator(selector).first
                 if await company_element.is_visible():
-                    job_info['company'] = await company_element.text_content()
+                    job_info.company = intern_text(await company_element.text_content())
                     break
             except:
                 continue
@@ -120,7 +120,7 @@ async def extract_job_info(job_element):
         return job_info
         
     except Exception as e:
-        return {'full_text': '', 'title': '', 'company': '', 'location': '', 'description': ''}
+        return JobRecord()
 
 def analyze_job_compatibility(job_text, user_skills, avoid_terms, experience_level):
     """
@@ -232,7 +232,7 @@ async def find_recommended_jobs(page):
         current_url = page.url
         if 'feed' not in current_url:
             await page.goto('https://www.linkedin.com/feed/')
-            await page.wait_for_timeout(3000)
+            await get_pacing().wait(3000)
         
         # Procurar seção de vagas recomendadas
         recommendation_selectors = [
@@ -241,18 +241,12 @@ async def find_recommended_jobs(page):
             "[data-view-name='job-recommendations']"
         ]
         
-        jobs = []
         for selector in recommendation_selectors:
             try:
                 section = page.locator(selector).first
                 if await section.is_visible():
                     job_cards = section.locator('.job-card, [data-job-id]')
-                    count = await job_cards.count()
-                    
-                    for i in range(count):
-                        jobs.append(job_cards.nth(i))
-                    
-                    return jobs
+                    return await harvest_job_cards(job_cards)
             except:
                 continue
         
@@ -267,7 +261,7 @@ async def traditional_job_search(page, keywords, location, max_results):
     """
     try:
         await page.goto('https://www.linkedin.com/jobs/')
-        await page.wait_for_timeout(3000)
+        await get_pacing().wait(3000)
         
         # Preencher campos de busca
         keyword_field = page.locator("input[placeholder*='Pesquisar']").first
@@ -280,17 +274,13 @@ async def traditional_job_search(page, keywords, location, max_results):
         
         # Executar busca
         await page.keyboard.press('Enter')
-        await page.wait_for_timeout(5000)
+        await get_pacing().wait(5000)
         
         # Coletar vagas
         job_cards = page.locator('div[data-job-id], .job-card')
-        count = await job_cards.count()
+        jobs = await harvest_job_cards(job_cards)
         
-        jobs = []
-        for i in range(min(count, max_results)):
-            jobs.append(job_cards.nth(i))
-        
-        return jobs
+        return jobs[:max_results]
         
     except Exception as e:
         return []
@@ -358,7 +348,7 @@ async def scroll_to_element(locator):
     """
     try:
         await locator.scroll_into_view_if_needed()
-        await asyncio.sleep(0.5)
+        await get_pacing().wait(500)
     except:
         pass
 
@@ -378,7 +368,7 @@ async def scroll_page(page, direction="down", amount=3, pixels=300):
                 await page.evaluate(f"window.scrollBy(0, {pixels});")
             else:
                 await page.evaluate(f"window.scrollBy(0, -{pixels});")
-            await asyncio.sleep(0.3)
+            await get_pacing().wait(300)
     except:
         pass
 
@@ -444,7 +434,7 @@ async def human_like_hover(locator):
     """
     try:
         await locator.hover()
-        await asyncio.sleep(random.uniform(0.1, 0.3))
+        await get_pacing().wait(100, 300)
     except:
         pass
 
@@ -950,7 +940,7 @@ async def scroll_to_element(locator):
     """
     try:
         await locator.scroll_into_view_if_needed()
-        await asyncio.sleep(0.5)
+        await get_pacing().wait(500)
     except:
         pass
 
@@ -970,7 +960,7 @@ async def scroll_page(page, direction="down", amount=3, pixels=300):
                 await page.evaluate(f"window.scrollBy(0, {pixels});")
             else:
                 await page.evaluate(f"window.scrollBy(0, -{pixels});")
-            await asyncio.sleep(0.3)
+            await get_pacing().wait(300)
     except:
         pass
 
@@ -1036,7 +1026,7 @@ async def human_like_hover(locator):
     """
     try:
         await locator.hover()
-        await asyncio.sleep(random.uniform(0.1, 0.3))
+        await get_pacing().wait(100, 300)
     except:
         pass
 
@@ -1327,4 +1317,243 @@ def get_browser_options(headless=False):
             "--enable-automation"
         ],
         "slow_mo": 50 if not headless else 0  # Adiciona delay natural
-    }
\ No newline at end of file
+    }
+
+# Script executado no navegador para coletar todos os cards de uma vez
+# (uma única ida e volta ao Playwright em vez de várias por card)
+JOB_CARD_HARVEST_SCRIPT = """
+    (elements) => elements.map((el, index) => {
+        const pick = (selectors) => {
+            for (const selector of selectors) {
+                const node = el.querySelector(selector);
+                if (node && node.textContent.trim()) {
+                    return node.textContent.trim();
+                }
+            }
+            return '';
+        };
+
+        let jobId = el.getAttribute('data-job-id') || el.getAttribute('data-occludable-job-id') || '';
+        if (!jobId) {
+            const link = el.querySelector("a[href*='/jobs/view/']");
+            const match = link ? link.getAttribute('href').match(/\\/jobs\\/view\\/(\\d+)/) : null;
+            jobId = match ? match[1] : '';
+        }
+
+        return {
+            index: index,
+            job_id: jobId,
+            text: el.textContent || '',
+            title: pick(['.job-card-list__title', '.job-title', 'h3', '.job-card__title']),
+            company: pick(['.job-card-container__company-name', '.company-name', '.job-card__company-name',
+                           '.artdeco-entity-lockup__subtitle']),
+            location: pick(['.job-card-container__metadata-item', '.job-card-container__metadata-wrapper li',
+                            '.job-card__location', '.artdeco-entity-lockup__caption']),
+            posted: pick(['time', '.job-card-container__listed-time', '.job-card-list__footer-wrapper time'])
+        };
+    })
+"""
+
+# Script para coletar IDs de vagas presentes na página (links e atributos)
+JOB_ID_COLLECT_SCRIPT = """
+    () => {
+        const ids = new Set();
+        document.querySelectorAll('[data-job-id]').forEach((el) => {
+            const value = el.getAttribute('data-job-id');
+            if (value) ids.add(value);
+        });
+        document.querySelectorAll("a[href*='/jobs/view/']").forEach((el) => {
+            const match = el.getAttribute('href').match(/\\/jobs\\/view\\/(\\d+)/);
+            if (match) ids.add(match[1]);
+        });
+        return Array.from(ids);
+    }
+"""
+
+def get_data_dir():
+    """
+    Retorna o diretório local de dados da automação, criando-o se necessário
+    
+    Pode ser alterado pela variável de ambiente LINKEDIN_AUTOMATION_HOME
+    
+    Returns:
+        str: Caminho do diretório de dados
+    """
+    path = os.environ.get("LINKEDIN_AUTOMATION_HOME") or os.path.join(
+        os.path.expanduser("~"), ".linkedin_automation"
+    )
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def atomic_write_json(path, data):
+    """
+    Grava um JSON de forma atômica (arquivo temporário + rename)
+    
+    Args:
+        path (str): Caminho do arquivo de destino
+        data: Conteúdo serializável em JSON
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+async def harvest_job_cards(job_cards):
+    """
+    Coleta os dados de todos os cards de vaga em uma única chamada
+    
+    Args:
+        job_cards: Locator do Playwright com os cards de vaga
+    
+    Returns:
+        list: Lista de JobRecord (index, job_id, text, title, company, location e posted)
+    """
+    try:
+        cards = await job_cards.evaluate_all(JOB_CARD_HARVEST_SCRIPT)
+    except Exception:
+        return []
+    return [JobRecord.from_dict(card) for card in cards]
+
+async def collect_job_ids(page):
+    """
+    Coleta os IDs de todas as vagas presentes na página atual
+    
+    Args:
+        page: Página do Playwright
+    
+    Returns:
+        list: IDs das vagas encontradas
+    """
+    try:
+        return await page.evaluate(JOB_ID_COLLECT_SCRIPT)
+    except Exception:
+        return []
+
+# Seletores usados para localizar os cards de vaga nas páginas de resultados
+JOB_CARD_SELECTORS = [
+    "div[data-job-id]",
+    ".job-card",
+    ".result-card"
+]
+
+async def find_job_cards(page, selectors=None):
+    """
+    Localiza os cards de vaga da página usando o primeiro seletor com resultados
+    
+    Args:
+        page: Página do Playwright
+        selectors (list): Seletores a testar (padrão: JOB_CARD_SELECTORS)
+    
+    Returns:
+        Locator or None: Cards encontrados ou None se a página não tiver vagas
+    """
+    for selector in selectors or JOB_CARD_SELECTORS:
+        job_cards = page.locator(selector)
+        if await job_cards.count() > 0:
+            return job_cards
+    
+    return None
+
+
+def process_tree_rss(root_pid=None, include_root=True):
+    """
+    Soma a memória residente (RSS) de um processo e de todos os seus descendentes
+    
+    Lê /proc diretamente (Linux); o navegador do Playwright roda como
+    processo filho do driver, que por sua vez é filho deste processo
+    
+    Args:
+        root_pid (int): PID raiz (padrão: processo atual)
+        include_root (bool): Incluir o próprio processo raiz (False: só os descendentes)
+    
+    Returns:
+        int: Memória residente total em bytes (0 se /proc não estiver disponível)
+    """
+    root_pid = root_pid or os.getpid()
+    children = {}
+    
+    try:
+        pids = [int(name) for name in os.listdir("/proc") if name.isdigit()]
+    except OSError:
+        return 0
+    
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", "r") as f:
+                # O nome do processo fica entre parênteses e pode conter espaços
+                fields = f.read().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(pid)
+        except (OSError, IndexError, ValueError):
+            continue
+    
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pending = [root_pid] if include_root else list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/statm", "r") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    
+    return total
+
+def browser_rss():
+    """
+    Memória residente apenas dos processos filhos (driver do Playwright e navegador)
+    """
+    return process_tree_rss(include_root=False)
+
+def process_rss():
+    """
+    Memória residente apenas deste processo Python
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+# Memória do renderizador: heap JS (somente Chromium) e quantidade de nós do DOM
+PAGE_MEMORY_SCRIPT = """
+() => ({
+    heap: (performance.memory && performance.memory.usedJSHeapSize) || 0,
+    nodes: document.getElementsByTagName('*').length
+})
+"""
+
+async def sample_page_memory(page):
+    """
+    Lê o heap JS usado e a quantidade de nós do DOM da página
+    
+    Args:
+        page: Página do Playwright
+    
+    Returns:
+        dict: {'heap': bytes, 'nodes': quantidade} ou None se a leitura falhar
+    """
+    try:
+        return await page.evaluate(PAGE_MEMORY_SCRIPT)
+    except Exception:
+        return None
+
+def job_card_locator(page, job_id):
+    """
+    Localiza o card de uma vaga pelo ID, independente da posição na lista
+    
+    Útil quando a página foi recarregada e a ordem dos cards pode ter mudado
+    
+    Args:
+        page: Página do Playwright
+        job_id (str): ID da vaga
+    
+    Returns:
+        Locator: Primeiro card com o ID informado
+    """
+    return page.locator(
+        f"[data-job-id='{job_id}'], [data-occludable-job-id='{job_id}'], "
+        f"li:has(a[href*='/jobs/view/{job_id}'])"
+    ).first
@@ -0,0 +1,19 @@
+"""
+Configuração dos testes unitários (lógica pura, sem navegador)
+
+Uso:
+    python -m pytest tests
+"""
+
+import os
+import sys
+import tempfile
+
+# Adiciona a raiz (cli.py) e o diretório src ao path para importar os módulos
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+# Dados locais (ledger, índices, checkpoint) dos testes não se misturam aos do usuário
+os.environ["LINKEDIN_AUTOMATION_HOME"] = tempfile.mkdtemp(prefix="linkedin-tests-")
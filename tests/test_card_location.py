@@ -0,0 +1,61 @@
+"""
+Testes da localização dos cards depois da reciclagem da página
+"""
+
+import asyncio
+
+import pytest
+
+from job_record import JobRecord
+
+class FakeLocator:
+    def __init__(self, selector, count=0):
+        self.selector = selector
+        self.total = count
+        self.first = self
+
+    async def count(self):
+        return self.total
+
+    def nth(self, index):
+        return (self.selector, index)
+
+class FakePage:
+    """
+    Página com cards só no seletor informado
+    """
+
+    def __init__(self, selector=None, count=0):
+        self.selector = selector
+        self.total = count
+
+    def locator(self, selector):
+        return FakeLocator(selector, self.total if selector == self.selector else 0)
+
+@pytest.fixture
+def automation():
+    pytest.importorskip("playwright")
+    from automation_fixed import LinkedInAutomation
+
+    bot = LinkedInAutomation("t@example.com", "", "python", "Brasil", 10, 0, lambda message: None,
+                             skip_duplicates=False, checkpoint=False, recycle_after_jobs=0)
+    bot.cards_reloaded = True
+    return bot
+
+def test_cards_are_queried_again_after_recycle(automation):
+    automation.page = FakePage(".job-card", 25)
+
+    job_cards = asyncio.run(automation.recycle_page_if_needed(None))
+    assert job_cards.selector == ".job-card"
+    assert automation.locate_card(job_cards, JobRecord(index=3)) == (".job-card", 3)
+
+def test_card_with_id_is_located_by_id(automation):
+    automation.page = FakePage()
+    locator = automation.locate_card(None, JobRecord(index=3, job_id="4242"))
+    assert "data-job-id='4242'" in locator.selector
+
+def test_card_without_id_or_cards_is_reported(automation):
+    automation.page = FakePage()
+    assert asyncio.run(automation.recycle_page_if_needed(None)) is None
+    with pytest.raises(LookupError):
+        automation.locate_card(None, JobRecord(index=3))
@@ -0,0 +1,111 @@
+"""
+Testes do checkpoint da busca: gravação, vagas com erro, conclusão e remoção
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from checkpoint import RunCheckpoint
+from job_record import JobRecord
+
+PAGE_URL = "https://www.linkedin.com/jobs/search/?keywords=python&start=25"
+
+def record_job(checkpoint, job_id, index, saved=False):
+    checkpoint.record("python|brasil", None, PAGE_URL, 25, job_id, index, saved)
+
+def test_load_without_checkpoint(tmp_path):
+    assert RunCheckpoint(str(tmp_path / "checkpoint.json")).load() is None
+
+def test_record_and_load(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    checkpoint = RunCheckpoint(path)
+    record_job(checkpoint, "101", 0, saved=True)
+    record_job(checkpoint, "102", 1)
+
+    state = RunCheckpoint(path).load()
+    assert state["page_url"] == PAGE_URL
+    assert state["offset"] == 25
+    assert (state["last_job_id"], state["last_index"]) == ("102", 1)
+    assert (state["processed"], state["saved"]) == (2, 1)
+
+def test_failure_does_not_advance(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    checkpoint = RunCheckpoint(path)
+    record_job(checkpoint, "101", 0)
+    checkpoint.record_failure("102")
+    checkpoint.record_failure("102")
+
+    state = RunCheckpoint(path).load()
+    assert state["last_job_id"] == "101"
+    assert state["failed"] == ["102"]
+    assert state["processed"] == 1
+
+    # Vaga refeita com sucesso deixa de constar como pendente
+    checkpoint.record_failure("103")
+    record_job(checkpoint, "102", 1)
+    assert RunCheckpoint(path).load()["failed"] == ["103"]
+
+def test_completed_queries_and_clear(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    checkpoint = RunCheckpoint(path)
+    checkpoint.complete_query("python @ brasil")
+    checkpoint.complete_query("python @ brasil")
+
+    state = RunCheckpoint(path).load()
+    assert state["completed_queries"] == ["python @ brasil"]
+
+    checkpoint.clear()
+    assert not os.path.exists(path)
+    assert RunCheckpoint(path).load() is None
+    checkpoint.clear()
+
+# Regras da automação em torno do checkpoint (sem abrir o navegador)
+
+@pytest.fixture
+def automation(tmp_path):
+    pytest.importorskip("playwright")
+    from automation_fixed import LinkedInAutomation
+
+    bot = LinkedInAutomation("t@example.com", "", "python", "Brasil", 10, 0, lambda message: None,
+                             skip_duplicates=False, checkpoint_path=str(tmp_path / "checkpoint.json"))
+    bot.page = SimpleNamespace(url=PAGE_URL)
+    return bot
+
+def cards(*job_ids):
+    return [JobRecord(index=n, job_id=job_id, title=f"Vaga {job_id}") for n, job_id in enumerate(job_ids)]
+
+def test_save_checkpoint_skips_errors(automation):
+    automation.save_checkpoint(cards("101")[0], {"verdict": "saved", "saved": True})
+    automation.save_checkpoint(cards("101", "102")[1], {"verdict": automation.VERDICT_ERROR, "saved": False})
+
+    state = RunCheckpoint(automation.checkpoint.path).load()
+    assert state["last_job_id"] == "101"
+    assert state["failed"] == ["102"]
+    assert (state["processed"], state["saved"]) == (1, 1)
+
+def test_skip_processed_keeps_failed_jobs(automation):
+    records = cards("101", "102", "103", "104")
+    resume_state = {"last_job_id": "103", "last_index": 2, "failed": ["102"]}
+
+    remaining = automation.skip_processed(records, resume_state)
+    assert [record.job_id for record in remaining] == ["102", "104"]
+
+def test_skip_processed_falls_back_to_index(automation):
+    records = cards("201", "202", "203")
+    resume_state = {"last_job_id": "999", "last_index": 0, "failed": []}
+
+    remaining = automation.skip_processed(records, resume_state)
+    assert [record.job_id for record in remaining] == ["202", "203"]
+
+def test_clear_checkpoint_only_when_complete(automation):
+    automation.save_checkpoint(cards("101")[0], {"verdict": "saved", "saved": True})
+    path = automation.checkpoint.path
+
+    automation.clear_checkpoint()
+    assert os.path.exists(path)
+
+    automation.search_complete = True
+    automation.clear_checkpoint()
+    assert not os.path.exists(path)
@@ -0,0 +1,28 @@
+"""
+Testes dos códigos de saída da execução sem interface
+"""
+
+import pytest
+
+import cli
+
+FINISHED = ("max_jobs", "max_pages", "stale_pages", "cached", "no_cards", "last_page", "recommended")
+
+@pytest.mark.parametrize("stop_reason, code", [
+    ("last_page", cli.EXIT_OK),
+    ("max_jobs", cli.EXIT_OK),
+    ("recommended", cli.EXIT_OK),
+    ("error", cli.EXIT_FAILURE),
+    (None, cli.EXIT_FAILURE),
+    ("stopped", cli.EXIT_INTERRUPTED),
+])
+def test_exit_code(stop_reason, code):
+    assert cli.exit_code(stop_reason, FINISHED) == code
+
+def test_finished_reasons_match_automation():
+    pytest.importorskip("playwright")
+    from automation_fixed import FINISHED_STOP_REASONS, STOP_REASONS
+
+    assert set(FINISHED_STOP_REASONS) == set(FINISHED)
+    assert set(FINISHED_STOP_REASONS) <= set(STOP_REASONS)
+    assert cli.exit_code("stopped", FINISHED_STOP_REASONS) == 130
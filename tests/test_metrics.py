@@ -0,0 +1,40 @@
+"""
+Testes da renderização das métricas e do listener de respostas
+"""
+
+import pytest
+
+from metrics import MetricsRegistry
+
+def test_histogram_bounds_are_floats():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("linkedin_stage_duration_seconds", "Duração de cada fase")
+    histogram.observe(0.7, stage="card")
+
+    text = registry.render()
+    assert 'linkedin_stage_duration_seconds_bucket{stage="card",le="1.0"} 1' in text
+    assert 'le="0.05"' in text and 'le="300.0"' in text and 'le="+Inf"' in text
+    assert 'le="1"' not in text
+    assert text.endswith("# EOF\n")
+
+class FakeContext:
+    def __init__(self):
+        self.listeners = []
+
+    def on(self, event, listener):
+        self.listeners.append((event, listener))
+
+@pytest.mark.parametrize("options, watched", [
+    ({}, False),
+    ({"metrics_port": 9300}, True),
+    ({"metrics_textfile": "metrics.prom"}, True),
+])
+def test_response_listener_only_when_exporting(options, watched):
+    pytest.importorskip("playwright")
+    from automation_fixed import LinkedInAutomation
+
+    bot = LinkedInAutomation("t@example.com", "", "python", "Brasil", 10, 0, lambda message: None,
+                             skip_duplicates=False, checkpoint=False, **options)
+    bot.context = FakeContext()
+    bot.watch_responses()
+    assert bool(bot.context.listeners) == watched
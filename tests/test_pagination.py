@@ -0,0 +1,68 @@
+"""
+Testes das regras de parada da paginação: idade da vaga e páginas sem novidades
+"""
+
+import pytest
+
+from job_ledger import JobLedger
+from job_record import JobRecord, posted_age_days
+
+@pytest.mark.parametrize("posted, days", [
+    ("há 3 dias", 3),
+    ("Publicada há 2 semanas", 14),
+    ("Há 5 horas", 5 / 24),
+    ("há 30 minutos", 30 / 1440),
+    ("há 1 mês", 30),
+    ("há 2 meses", 60),
+    ("1 month ago", 30),
+    ("Reposted 2 weeks ago", 14),
+    ("30+ days ago", 30),
+    ("hoje", 0),
+    ("Just now", 0),
+    ("ontem", 1),
+])
+def test_posted_age_days(posted, days):
+    assert posted_age_days(posted) == pytest.approx(days)
+
+@pytest.mark.parametrize("posted", ["", None, "Promovida", "Candidatura simplificada"])
+def test_posted_age_days_unknown(posted):
+    assert posted_age_days(posted) is None
+
+@pytest.fixture
+def automation(tmp_path):
+    pytest.importorskip("playwright")
+    from automation_fixed import LinkedInAutomation
+
+    def build(**options):
+        return LinkedInAutomation("t@example.com", "", "python", "Brasil", 10, 0, lambda message: None,
+                                  skip_duplicates=False, checkpoint=False, **options)
+    return build
+
+def card(job_id, posted):
+    return JobRecord(job_id=job_id, title=f"Vaga {job_id}", posted=posted)
+
+def test_stale_pages_disabled_by_default(automation):
+    assert automation().stale_pages == 0
+    assert automation(stale_pages=None).stale_pages == 0
+    assert automation(stale_pages=0).stale_pages == 0
+    assert automation(stale_pages=2).stale_pages == 2
+
+def test_is_too_old(automation):
+    bot = automation(max_posted_days=7)
+    assert bot.is_too_old(card("1", "há 2 semanas"))
+    assert not bot.is_too_old(card("2", "há 3 dias"))
+    assert not bot.is_too_old(card("3", "Promovida"))
+    assert not automation().is_too_old(card("4", "há 2 anos"))
+
+def test_is_stale_page(automation):
+    bot = automation(max_posted_days=7, stale_pages=2)
+    bot.ledger.mark("200", JobLedger.STATUS_SEEN)
+    bot.saved_job_ids = {"300"}
+
+    assert bot.is_known_job("200") and bot.is_known_job("300")
+    assert not bot.is_known_job("400") and not bot.is_known_job("")
+
+    assert bot.is_stale_page([card("100", "há 1 mês"), card("200", "hoje"), card("300", "ontem")])
+    assert not bot.is_stale_page([card("100", "há 1 mês"), card("400", "há 2 dias")])
+    assert not bot.is_stale_page([card("500", "")])
+    assert bot.is_stale_page([])
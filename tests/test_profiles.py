@@ -0,0 +1,45 @@
+"""
+Testes da leitura dos perfis nomeados
+"""
+
+import pytest
+
+from profiles import DEFAULT_PROFILE_NAME, ProfileError, SkillProfile, build_profile_list, parse_profiles
+
+def test_parse_profiles():
+    profiles = parse_profiles("backend: Python, Django | Sênior; dados: sql, pandas\nsem skills:")
+    assert [(profile.name, profile.skills, profile.avoid_terms) for profile in profiles] == [
+        ("backend", ["python", "django"], ["sênior"]),
+        ("dados", ["sql", "pandas"], []),
+    ]
+
+def test_default_profile_from_keywords():
+    profiles = build_profile_list([], ["estágio"], "Python, SQL")
+    assert [(profile.name, profile.skills) for profile in profiles] == [(DEFAULT_PROFILE_NAME, ["python", "sql"])]
+
+@pytest.mark.parametrize("profiles", [
+    ": python, sql",
+    "   : python",
+    [{"skills": ["python"]}],
+])
+def test_empty_name_is_rejected(profiles):
+    with pytest.raises(ProfileError):
+        build_profile_list(["python"], [], "", profiles)
+
+@pytest.mark.parametrize("user_skills, profiles", [
+    ([], "dados: sql; Dados: pandas"),
+    (["python"], f"{DEFAULT_PROFILE_NAME}: sql"),
+    ([], [SkillProfile("backend", ["python"]), {"name": "backend ", "skills": ["go"]}]),
+])
+def test_duplicate_name_is_rejected(user_skills, profiles):
+    with pytest.raises(ProfileError, match="repetido"):
+        build_profile_list(user_skills, [], "", profiles)
+
+def test_config_rejects_invalid_profiles(tmp_path):
+    from run_config import ConfigError, load_run_config
+
+    path = tmp_path / "config.json"
+    path.write_text('{"account": {"email": "t@example.com", "password": "x"}, '
+                    '"profile": {"profiles": "dados: sql; dados: pandas"}}', encoding="utf-8")
+    with pytest.raises(ConfigError, match="repetido"):
+        load_run_config(str(path))
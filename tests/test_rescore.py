@@ -0,0 +1,99 @@
+"""
+Testes da reavaliação offline a partir do arquivo local de vagas e de snapshots
+"""
+
+import os
+import json
+
+from job_archive import JobArchive, ArchiveReader
+from profiles import SkillProfile
+from rescore import iter_records, rescore
+
+def write_archive(path, count=50):
+    archive = JobArchive(path, codec="gzip")
+    archive.append_many([
+        {"job_id": str(1000 + i), "title": f"Vaga {i}", "company": "Acme", "text": "python remoto"}
+        for i in range(count)
+    ])
+    archive.close()
+
+def test_iter_records_keeps_latest_version(tmp_path):
+    path = str(tmp_path / "jobs.archive")
+    write_archive(path)
+
+    archive = JobArchive(path)
+    archive.append_many([{"job_id": "1007", "title": "Vaga 7 (atualizada)", "text": "python"}])
+    archive.close()
+
+    records = list(iter_records(path))
+    assert len(records) == 50
+    assert [record.title for record in records if record.job_id == "1007"] == ["Vaga 7 (atualizada)"]
+
+def test_rescore_counts_each_job_once(tmp_path):
+    path = str(tmp_path / "jobs.archive")
+    write_archive(path)
+    archive = JobArchive(path)
+    archive.append_many([{"job_id": "1003", "title": "Vaga 3", "text": "python"}])
+    archive.close()
+
+    totals = rescore(path, [SkillProfile("backend", ["python"])], workers=1, chunk_size=7,
+                     log_callback=lambda message: None)
+    assert totals["total"] == 50
+    assert totals["compatible"] == 50
+
+def test_reader_does_not_modify_archive(tmp_path):
+    path = str(tmp_path / "jobs.archive")
+    write_archive(path, count=5)
+
+    # Registro pendente (sem índice) seguido de um registro incompleto, como em
+    # um arquivo que outra execução ainda está gravando
+    archive = JobArchive(path)
+    archive.append_many([{"job_id": "2000", "title": "Nova", "text": ""}])
+    archive.writer.write(b"\x00\x00\x01\x00incompleto")
+    archive.writer.flush()
+
+    with open(path, "rb") as f:
+        data_before = f.read()
+    with open(f"{path}.idx", "rb") as f:
+        index_before = f.read()
+
+    with ArchiveReader(path) as reader:
+        assert len(list(reader.scan())) == 6
+        assert len(list(reader.latest())) == 6
+        assert reader.get("2000")["title"] == "Nova"
+        assert reader.get("1002")["title"] == "Vaga 2"
+        assert reader.get("999") is None
+
+    with open(path, "rb") as f:
+        assert f.read() == data_before
+    with open(f"{path}.idx", "rb") as f:
+        assert f.read() == index_before
+    archive.writer.close()
+    archive.reader.close()
+    assert os.path.exists(path)
+
+def write_jsonl(path, jobs, modified):
+    with open(path, "w", encoding="utf-8") as f:
+        for job in jobs:
+            f.write(json.dumps(job, ensure_ascii=False) + "\n")
+    os.utime(path, (modified, modified))
+
+def test_job_in_several_snapshots_counts_once(tmp_path):
+    write_jsonl(str(tmp_path / "2024-01-01.jsonl"), [
+        {"job_id": "1", "title": "Backend (antiga)", "text": "python"},
+        {"job_id": "2", "title": "Dados", "text": "python sql"},
+    ], modified=1_700_000_000)
+    write_jsonl(str(tmp_path / "2024-01-02.jsonl"), [
+        {"job_id": "1", "title": "Backend", "text": "python remoto"},
+        {"job_id": "3", "title": "Frontend", "text": "react"},
+        {"job_id": "3", "title": "Frontend (atualizada)", "text": "react"},
+    ], modified=1_700_086_400)
+
+    records = {record.job_id: record.title for record in iter_records(str(tmp_path))}
+    assert records == {"1": "Backend", "2": "Dados", "3": "Frontend (atualizada)"}
+
+    totals = rescore(str(tmp_path), [SkillProfile("backend", ["python"])], workers=1,
+                     log_callback=lambda message: None)
+    assert (totals["total"], totals["compatible"]) == (3, 2)
+    assert totals["by_profile"] == {"backend": 2}
+    assert sorted(entry[2] for entry in totals["ranked"]) == ["1", "2"]
@@ -0,0 +1,76 @@
+"""
+Testes do cache de páginas de resultados: chaves, validade (TTL) e descarte (LRU)
+"""
+
+import search_cache
+from job_record import JobRecord
+from search_cache import SearchCache, search_cache_key, search_key
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def records(*job_ids):
+    return [JobRecord(index=n, job_id=job_id, title=f"Vaga {job_id}") for n, job_id in enumerate(job_ids)]
+
+def test_keys_are_normalized():
+    filters = {"Modalidade": "Remoto", "experiência": " Pleno "}
+    same_filters = {"experiência": "pleno", "modalidade": "REMOTO"}
+
+    assert search_key("Python  Django", "São Paulo", filters) == search_key(" python django", "são paulo ", same_filters)
+    assert search_cache_key("Python", "Brasil", filters, 2) == search_cache_key("python", "BRASIL", same_filters, 2)
+    assert search_cache_key("python", "brasil", filters, 1) != search_cache_key("python", "brasil", filters, 2)
+    assert search_key("python", "brasil", filters) != search_key("python", "brasil", {"modalidade": "híbrido"})
+    assert search_key("python", "brasil") != search_key("django", "brasil")
+
+def test_known_ids_covers_every_page(tmp_path):
+    cache = SearchCache(str(tmp_path / "cache.json"))
+    search = search_key("python", "brasil")
+    cache.put(search_cache_key("python", "brasil", page=0), records("1", "2"), search)
+    cache.put(search_cache_key("python", "brasil", page=1), records("3", "4"), search)
+    cache.put(search_cache_key("django", "brasil", page=0), records("9"), search_key("django", "brasil"))
+
+    # Vagas deslocadas para a página seguinte continuam conhecidas
+    assert cache.known_ids(search) == {"1", "2", "3", "4"}
+    assert cache.known_ids(search_key("java", "brasil")) == set()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_ttl_expiry(tmp_path, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(search_cache.time, "time", clock)
+    path = str(tmp_path / "cache.json")
+    search = search_key("python", "brasil")
+    key = search_cache_key("python", "brasil")
+
+    cache = SearchCache(path, ttl_hours=1)
+    cache.put(key, records("1"), search)
+    cache.save()
+
+    clock.now += 3599
+    assert cache.get(key) is not None
+    assert SearchCache(path, ttl_hours=1).known_ids(search) == {"1"}
+
+    clock.now += 1
+    assert cache.known_ids(search) == set()
+    assert cache.get(key) is None
+    assert len(cache) == 0
+    assert len(SearchCache(path, ttl_hours=1)) == 0
+
+def test_lru_eviction(tmp_path):
+    path = str(tmp_path / "cache.json")
+    search = search_key("python", "brasil")
+    keys = [search_cache_key("python", "brasil", page=page) for page in range(3)]
+
+    cache = SearchCache(path, max_entries=2)
+    cache.put(keys[0], records("1"), search)
+    cache.put(keys[1], records("2"), search)
+    cache.get(keys[0])
+    cache.put(keys[2], records("3"), search)
+
+    # A página menos usada (1) é descartada; a ordem de uso sobrevive à gravação
+    assert list(cache.entries) == [keys[0], keys[2]]
+    cache.save()
+    assert list(SearchCache(path, max_entries=2).entries) == [keys[0], keys[2]]